@@ -0,0 +1,90 @@
+"""
+Time spent resolving `include=space,space.organization` on large synthetic v3 pages.
+
+    $ python benchmarks/bench_included_resources.py [--resources 5000] [--spaces 500] [--organizations 50]
+
+`linear scan` is the resolution this client used to perform (one scan of the included resources per relationship),
+`guid index` is the current EntityManager._mixin_included_resources.
+"""
+import argparse
+import copy
+import time
+from unittest.mock import MagicMock
+
+from cloudfoundry_client.common_objects import JsonObject
+from cloudfoundry_client.v3.entities import EntityManager, plural
+
+
+def build_page(resources: int, spaces: int, organizations: int) -> JsonObject:
+    def to_one(guid: str) -> JsonObject:
+        return JsonObject(data=JsonObject(guid=guid))
+
+    return JsonObject(
+        resources=[
+            JsonObject(guid="app-%d" % i, name="app-%d" % i, relationships=JsonObject(space=to_one("space-%d" % (i % spaces))))
+            for i in range(resources)
+        ],
+        included=JsonObject(
+            spaces=[
+                JsonObject(
+                    guid="space-%d" % i,
+                    name="space-%d" % i,
+                    relationships=JsonObject(organization=to_one("organization-%d" % (i % organizations))),
+                )
+                for i in range(spaces)
+            ],
+            organizations=[JsonObject(guid="organization-%d" % i, name="organization-%d" % i) for i in range(organizations)],
+        ),
+    )
+
+
+def linear_scan(result: JsonObject) -> JsonObject:
+    def include_resources(resource: JsonObject):
+        for relationship_name, relationship in resource.get("relationships", {}).items():
+            relationship_guid = (relationship.get("data") or {}).get("guid")
+            included_resources = result["included"].get(plural(relationship_name))
+            if relationship_guid is not None and included_resources is not None:
+                included_resource = next((r for r in included_resources if relationship_guid == r.get("guid")), None)
+                if included_resource is not None:
+                    include_resources(included_resource)
+                    resource.setdefault("_included", {}).update({relationship_name: included_resource})
+
+    for resource in result.get("resources", [result]):
+        include_resources(resource)
+    del result["included"]
+    return result
+
+
+def measure(resolve, page: JsonObject, rounds: int) -> float:
+    best = None
+    for _ in range(rounds):
+        candidate = copy.deepcopy(page)
+        started = time.perf_counter()
+        resolve(candidate)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resources", type=int, default=5000)
+    parser.add_argument("--spaces", type=int, default=500)
+    parser.add_argument("--organizations", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=5)
+    arguments = parser.parse_args()
+
+    page = build_page(arguments.resources, arguments.spaces, arguments.organizations)
+    manager = EntityManager("http://somewhere.org", MagicMock(), "/v3/apps")
+    linear = measure(linear_scan, page, arguments.rounds)
+    indexed = measure(manager._mixin_included_resources, page, arguments.rounds)
+    print(
+        "%d resources, %d spaces, %d organizations"
+        % (arguments.resources, arguments.spaces, arguments.organizations)
+    )
+    print("linear scan: %8.2f ms" % (linear * 1000))
+    print("guid index:  %8.2f ms (x%.1f)" % (indexed * 1000, linear / indexed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Delay between the end of a job and the poll noticing it, on simulated jobs: no request is sent.
+
+    $ python benchmarks/bench_job_polling.py [--jobs 1000] [--max-duration 30]
+
+`fixed` is the v2 push polling (every 5 seconds), `doubling` the v3 job polling (1 second doubled up to 60 seconds),
+`waiter` the current Waiter.
+"""
+import argparse
+import random
+
+from cloudfoundry_client.waiter import Waiter
+
+
+class SimulatedClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+def measure(waiter_factory, durations: list[float]) -> tuple[float, float, float]:
+    delays = []
+    polls = 0
+    for duration in durations:
+        clock = SimulatedClock()
+        waiter = waiter_factory(clock)
+
+        def poll() -> bool:
+            nonlocal polls
+            polls += 1
+            return clock.now >= duration
+
+        waiter.wait(poll, lambda done: done)
+        delays.append(clock.now - duration)
+    delays.sort()
+    return sum(delays) / len(delays), delays[int(len(delays) * 0.95)], polls / len(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=1000)
+    parser.add_argument("--max-duration", type=float, default=30.0)
+    arguments = parser.parse_args()
+
+    generator = random.Random(0)
+    # most jobs are short, a few take long
+    durations = [min(generator.expovariate(1 / 3.0), arguments.max_duration) for _ in range(arguments.jobs)]
+    strategies = dict(
+        fixed=lambda clock: Waiter(5, 5, None, 0, lambda step: step, clock, clock.sleep),
+        doubling=lambda clock: Waiter(1, 60, None, 0, None, clock, clock.sleep),
+        waiter=lambda clock: Waiter(timeout=None, clock=clock, sleep=clock.sleep),
+    )
+    print("%d jobs of %.1f seconds on average" % (arguments.jobs, sum(durations) / len(durations)))
+    for name, waiter_factory in strategies.items():
+        mean_delay, p95_delay, polls = measure(waiter_factory, durations)
+        print("%-9s mean delay %6.2f s, p95 delay %6.2f s, %5.1f polls by job" % (name + ":", mean_delay, p95_delay, polls))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Time spent describing the files of an application (sha1, size and mode) before a push, on a synthetic tree.
+
+    $ python benchmarks/bench_push_hashing.py [--files 10000] [--max-size-kb 256] [--workers 8]
+
+`sequential` is the description this client used to perform (os.walk, then sha1, getsize and lstat per file),
+`parallel` is the current PushOperation._load_all_resources.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from cloudfoundry_client.operations.push.cf_ignore import CfIgnore
+from cloudfoundry_client.operations.push.file_helper import FileHelper
+from cloudfoundry_client.operations.push.push import PushOperation
+
+
+def build_tree(top_directory: str, files: int, max_size_kb: int):
+    generator = random.Random(0)
+    for i in range(files):
+        directory = os.path.join(top_directory, "module-%d" % (i % 50), "package-%d" % (i % 7))
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, "file-%d.bin" % i), "wb") as f:
+            f.write(generator.randbytes(generator.randint(0, max_size_kb * 1024)))
+
+
+def sequential(top_directory: str) -> dict:
+    application_items = {}
+    cf_ignore = CfIgnore(top_directory)
+    for directory, file_names in FileHelper.walk(top_directory):
+        for file_name in file_names:
+            relative_file_location = os.path.join(directory, file_name)
+            if not cf_ignore.is_entry_ignored(relative_file_location):
+                absolute_file_location = os.path.join(top_directory, relative_file_location)
+                application_items[relative_file_location] = dict(
+                    sha1=FileHelper.sha1(absolute_file_location),
+                    size=FileHelper.size(absolute_file_location),
+                    mode=FileHelper.mode(absolute_file_location),
+                )
+    return application_items
+
+
+def measure(describe, rounds: int) -> float:
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        describe()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=10000)
+    parser.add_argument("--max-size-kb", type=int, default=256)
+    parser.add_argument("--workers", type=int, default=min(32, (os.cpu_count() or 1) + 4))
+    parser.add_argument("--rounds", type=int, default=3)
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as top_directory:
+        build_tree(top_directory, arguments.files, arguments.max_size_kb)
+        assert sequential(top_directory) == PushOperation._load_all_resources(top_directory, arguments.workers)
+        sequential_time = measure(lambda: sequential(top_directory), arguments.rounds)
+        parallel_time = measure(lambda: PushOperation._load_all_resources(top_directory, arguments.workers), arguments.rounds)
+    print("%d files of at most %d KiB, %d workers" % (arguments.files, arguments.max_size_kb, arguments.workers))
+    print("sequential: %8.2f ms" % (sequential_time * 1000))
+    print("parallel:   %8.2f ms (x%.1f)" % (parallel_time * 1000, sequential_time / parallel_time))
+
+
+if __name__ == "__main__":
+    main()
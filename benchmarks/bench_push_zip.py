@@ -0,0 +1,63 @@
+"""
+Time spent building the archive of an application uploaded by a push, on a synthetic tree.
+
+    $ python benchmarks/bench_push_zip.py [--files 2000] [--max-size-kb 512] [--workers 8]
+
+`sequential` compresses the files one after the other, `parallel` compresses them on a pool of workers.
+The files are half random bytes, that deflate cannot compress, and half text.
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from cloudfoundry_client.operations.push.file_helper import FileHelper
+
+
+def build_tree(top_directory: str, files: int, max_size_kb: int):
+    generator = random.Random(0)
+    words = [b"cloud", b"foundry", b"python", b"client", b"push", b"zip"]
+    for i in range(files):
+        directory = os.path.join(top_directory, "module-%d" % (i % 50))
+        os.makedirs(directory, exist_ok=True)
+        size = generator.randint(0, max_size_kb * 1024)
+        with open(os.path.join(directory, "file-%d.%s" % (i, "bin" if i % 2 == 0 else "txt")), "wb") as f:
+            if i % 2 == 0:
+                f.write(generator.randbytes(size))
+            else:
+                f.write(b" ".join(generator.choice(words) for _ in range(size // 6)))
+
+
+def measure(build, rounds: int) -> tuple[float, int]:
+    best = None
+    size = 0
+    for _ in range(rounds):
+        started = time.perf_counter()
+        size = sum(len(chunk) for chunk in build())
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--max-size-kb", type=int, default=512)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--rounds", type=int, default=3)
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as top_directory:
+        build_tree(top_directory, arguments.files, arguments.max_size_kb)
+        sequential_time, sequential_size = measure(lambda: FileHelper.zip_stream(top_directory), arguments.rounds)
+        parallel_time, parallel_size = measure(
+            lambda: FileHelper.zip_stream(top_directory, workers=arguments.workers), arguments.rounds
+        )
+    print("%d files of at most %d KiB, %d workers" % (arguments.files, arguments.max_size_kb, arguments.workers))
+    print("sequential: %8.2f ms, %d bytes" % (sequential_time * 1000, sequential_size))
+    print("parallel:   %8.2f ms, %d bytes (x%.1f)" % (parallel_time * 1000, parallel_size, sequential_time / parallel_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Time spent finding the files of an application already uploaded, out of the network, on synthetic descriptions.
+
+    $ python benchmarks/bench_resource_matching.py [--files 50000] [--known-ratio 0.5]
+
+`list` is the diff this client used to perform (a list of the known resources, looked up for each file),
+`set` is the current ResourceMatcher. The cloud controller is replaced by a set of known fingerprints.
+"""
+import argparse
+import hashlib
+import random
+import time
+
+from cloudfoundry_client.operations.push.resource_matcher import ResourceMatcher
+
+
+class FakeResources(object):
+    def __init__(self, known: set[tuple[str, int]]):
+        self.known = known
+        self.requests = 0
+
+    def match(self, items: list[dict]) -> list[dict]:
+        self.requests += 1
+        return [item for item in items if (item["sha1"], item["size"]) in self.known]
+
+    def match_many(self, items: list[dict], chunk_size: int = 1000, max_workers: int = 4) -> list[dict]:
+        return [item for start in range(0, len(items), chunk_size) for item in self.match(items[start:start + chunk_size])]
+
+
+class FakeV2(object):
+    def __init__(self, resources: FakeResources):
+        self.resources = resources
+
+
+class FakeClient(object):
+    def __init__(self, resources: FakeResources):
+        self.v2 = FakeV2(resources)
+
+
+def build_descriptions(files: int, known_ratio: float) -> tuple[dict, set]:
+    generator = random.Random(0)
+    descriptions = {}
+    known = set()
+    for i in range(files):
+        size = generator.randint(0, 1024 * 1024)
+        sha1 = hashlib.sha1(b"%d" % i).hexdigest()
+        descriptions["module-%d/file-%d.bin" % (i % 50, i)] = dict(sha1=sha1, size=size, mode="644")
+        if generator.random() < known_ratio:
+            known.add((sha1, size))
+    return descriptions, known
+
+
+def list_diff(client: FakeClient, descriptions: dict) -> tuple[list[str], list[dict]]:
+    def generate_key(item: dict):
+        return "%s-%d" % (item["sha1"], item["size"])
+
+    already_uploaded_entries = [
+        generate_key(item)
+        for item in client.v2.resources.match([dict(sha1=item["sha1"], size=item["size"]) for item in descriptions.values()])
+    ]
+    zipped = [
+        path
+        for path in descriptions
+        if path in descriptions and generate_key(descriptions[path]) not in already_uploaded_entries
+    ]
+    resources = [
+        dict(fn=path, **description)
+        for path, description in descriptions.items()
+        if generate_key(description) in already_uploaded_entries
+    ]
+    return zipped, resources
+
+
+def set_diff(client: FakeClient, descriptions: dict) -> tuple[list[str], list[dict]]:
+    already_uploaded_paths = ResourceMatcher(client, minimum_size=0).match(descriptions)
+    zipped = [path for path in descriptions if path in descriptions and path not in already_uploaded_paths]
+    resources = [dict(fn=path, **description) for path, description in descriptions.items() if path in already_uploaded_paths]
+    return zipped, resources
+
+
+def measure(diff, rounds: int) -> float:
+    best = None
+    for _ in range(rounds):
+        started = time.perf_counter()
+        diff()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=50000)
+    parser.add_argument("--known-ratio", type=float, default=0.5)
+    parser.add_argument("--rounds", type=int, default=1)
+    arguments = parser.parse_args()
+
+    descriptions, known = build_descriptions(arguments.files, arguments.known_ratio)
+    client = FakeClient(FakeResources(known))
+    assert list_diff(client, descriptions) == set_diff(client, descriptions)
+    list_time = measure(lambda: list_diff(client, descriptions), arguments.rounds)
+    set_time = measure(lambda: set_diff(client, descriptions), arguments.rounds)
+    print("%d files, %.0f%% already uploaded" % (arguments.files, arguments.known_ratio * 100))
+    print("list: %10.2f ms" % (list_time * 1000))
+    print("set:  %10.2f ms (x%.0f)" % (set_time * 1000, list_time / set_time))
+
+
+if __name__ == "__main__":
+    main()
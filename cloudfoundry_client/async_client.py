@@ -0,0 +1,205 @@
+import asyncio
+import logging
+import ssl
+from http import HTTPStatus
+from typing import Any
+
+import aiohttp
+from oauth2_client.credentials_manager import OAuthError
+
+from cloudfoundry_client.client import CloudFoundryClient, V2, V3
+from cloudfoundry_client.common_objects import BufferedResponse
+from cloudfoundry_client.rate_limiter import RateLimiter
+from cloudfoundry_client.v2.async_entities import AsyncEntityManager as AsyncEntityManagerV2
+from cloudfoundry_client.v3.async_entities import AsyncEntityManager
+
+_logger = logging.getLogger(__name__)
+
+
+class AsyncV2(object):
+    def __init__(self, v2: V2, client: "AsyncCloudFoundryClient"):
+        for manager_name, manager in vars(v2).items():
+            entity_uri = getattr(manager, "entity_uri", None)
+            if entity_uri is not None:
+                setattr(self, manager_name, AsyncEntityManagerV2(manager.target_endpoint, client, entity_uri))
+
+
+class AsyncV3(object):
+    def __init__(self, v3: V3, client: "AsyncCloudFoundryClient"):
+        for manager_name, manager in vars(v3).items():
+            entity_uri = getattr(manager, "entity_uri", None)
+            if entity_uri is not None:
+                setattr(self, manager_name, AsyncEntityManager(manager.target_endpoint, client, entity_uri))
+
+
+class AsyncCloudFoundryClient(object):
+    def __init__(self, client: CloudFoundryClient, connection_limit: int = 100, connection_limit_per_host: int = 0):
+        """
+        An asyncio client sharing its credentials with a CloudFoundryClient.
+        All requests go through a single aiohttp session, hence a single connection pool.
+        The managers mirror the v2/v3 managers of the synchronous client (list, get, get_first, len...)
+        as coroutines; the specialised helpers (application start/stop, job polling...) remain synchronous only.
+
+        :param client: an initialized CloudFoundryClient. Its token is used and refreshed when it expires.
+        :param connection_limit: total number of simultaneous connections. 0 means no limit.
+        :param connection_limit_per_host: number of simultaneous connections to a same host. 0 means no limit.
+        """
+        self.credential_manager = client
+        self.info = client.info
+        self.json_decoder = client.json_decoder
+        self._connection_limit = connection_limit
+        self._connection_limit_per_host = connection_limit_per_host
+        self._session: aiohttp.ClientSession | None = None
+        self._refresh_lock = asyncio.Lock()
+        self._v2 = AsyncV2(client._v2, self) if client._v2 is not None else None
+        self._v3 = AsyncV3(client._v3, self) if client._v3 is not None else None
+
+    @property
+    def v2(self) -> AsyncV2:
+        if self._v2 is None:
+            raise NotImplementedError("No V2 endpoint for this instance")
+        return self._v2
+
+    @property
+    def v3(self) -> AsyncV3:
+        if self._v3 is None:
+            raise NotImplementedError("No V3 endpoint for this instance")
+        return self._v3
+
+    async def __aenter__(self) -> "AsyncCloudFoundryClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def get(self, url: str, params: dict | None = None, **kwargs) -> BufferedResponse:
+        response_cache = self.credential_manager.response_cache
+        if len(kwargs) > 0:
+            return await self._request("GET", url, params=params, **kwargs)
+        response = response_cache.get(url, params) if response_cache is not None else None
+        if response is None:
+            response = await self._conditional_get(url, params)
+            if response_cache is not None:
+                response_cache.put(url, params, response)
+        return response
+
+    async def _conditional_get(self, url: str, params: dict | None) -> BufferedResponse:
+        conditional_requests = self.credential_manager.conditional_requests
+        if conditional_requests is None:
+            return await self._request("GET", url, params=params)
+        headers = conditional_requests.headers(url, params)
+        response = await self._request("GET", url, accept_not_modified=len(headers) > 0, params=params, headers=headers)
+        resolved = conditional_requests.resolve(url, params, response)
+        if resolved is None:
+            response = await self._request("GET", url, params=params, headers=dict())
+            resolved = conditional_requests.resolve(url, params, response)
+        return resolved if resolved is not None else response
+
+    async def post(self, url: str, data=None, json=None, files=None, **kwargs) -> BufferedResponse:
+        return await self._mutate("POST", url, data=AsyncCloudFoundryClient._form_data(data, files), json=json, **kwargs)
+
+    async def put(self, url: str, data=None, json=None, **kwargs) -> BufferedResponse:
+        return await self._mutate("PUT", url, data=data, json=json, **kwargs)
+
+    async def patch(self, url: str, data=None, json=None, **kwargs) -> BufferedResponse:
+        return await self._mutate("PATCH", url, data=data, json=json, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> BufferedResponse:
+        return await self._mutate("DELETE", url, **kwargs)
+
+    async def _mutate(self, method: str, url: str, **kwargs) -> BufferedResponse:
+        try:
+            return await self._request(method, url, **kwargs)
+        finally:
+            if self.credential_manager.response_cache is not None:
+                self.credential_manager.response_cache.invalidate(url)
+            self.credential_manager.name_resolver.invalidate(url)
+
+    async def _request(self, method: str, url: str, accept_not_modified: bool = False, **kwargs) -> BufferedResponse:
+        retry_policy = self.credential_manager.retry_policy
+        rate_limiter = self.credential_manager.rate_limiter
+        attempt = 0
+        while True:
+            if rate_limiter is not None:
+                await AsyncCloudFoundryClient._acquire(rate_limiter)
+            started = self.credential_manager.request_logger.start()
+            response = await self._bearer_request(method, url, **kwargs)
+            self.credential_manager.request_logger.log(method, url, response, started)
+            if rate_limiter is not None:
+                rate_limiter.update(response)
+            delay = retry_policy.delay(method, response, attempt) if retry_policy is not None else None
+            if delay is None:
+                return CloudFoundryClient._check_response(response, accept_not_modified)
+            _logger.debug("%s: url=%s - status_code=%s - retrying in %.2fs", method, url, response.status_code, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _bearer_request(self, method: str, url: str, **kwargs) -> BufferedResponse:
+        access_token = self.credential_manager._access_token
+        response = await self._send(method, url, access_token, **kwargs)
+        if self.credential_manager.refresh_token is not None and CloudFoundryClient._is_token_expired(response):
+            await self._refresh_token(access_token)
+            response = await self._send(method, url, self.credential_manager._access_token, **kwargs)
+        return response
+
+    async def _refresh_token(self, expired_token: str | None):
+        async with self._refresh_lock:
+            # another coroutine may have refreshed it while we were waiting
+            if self.credential_manager._access_token == expired_token:
+                _logger.debug("_refresh_token - access token expired, refreshing it")
+                await asyncio.to_thread(self.credential_manager._refresh_token)
+
+    async def _send(self, method: str, url: str, access_token: str | None, **kwargs) -> BufferedResponse:
+        if access_token is None:
+            raise OAuthError(HTTPStatus.UNAUTHORIZED, "no_token", "no token provided")
+        headers = dict(kwargs.pop("headers", None) or {})
+        headers["Authorization"] = "Bearer %s" % access_token
+        async with self._get_session().request(method, url, headers=headers, proxy=self._proxy(url), **kwargs) as response:
+            content = await response.read()
+            return BufferedResponse(str(response.url), response.status, response.headers, content, response.charset)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._connection_limit,
+                limit_per_host=self._connection_limit_per_host,
+                ssl=self._ssl(),
+            )
+            headers = {}
+            if self.credential_manager.user_agent:
+                headers["User-Agent"] = self.credential_manager.user_agent
+            self._session = aiohttp.ClientSession(connector=connector, headers=headers, trust_env=False)
+        return self._session
+
+    def _ssl(self) -> bool | ssl.SSLContext:
+        verify = self.credential_manager.service_information.verify
+        if isinstance(verify, str):
+            return ssl.create_default_context(cafile=verify)
+        return True if verify else False
+
+    def _proxy(self, url: str) -> str | None:
+        proxy = self.credential_manager.proxies.get("https" if url.startswith("https") else "http")
+        return proxy if proxy else None
+
+    @staticmethod
+    async def _acquire(rate_limiter: RateLimiter):
+        wait = rate_limiter.try_acquire()
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = rate_limiter.try_acquire()
+
+    @staticmethod
+    def _form_data(data, files) -> Any:
+        if files is None:
+            return data
+        form_data = aiohttp.FormData()
+        for name, value in (data or {}).items():
+            form_data.add_field(name, value)
+        for name, file_description in files.items():
+            form_data.add_field(name, file_description[1], filename=file_description[0])
+        return form_data
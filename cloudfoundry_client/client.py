@@ -2,15 +2,29 @@ import logging
 import os
 from pathlib import Path
 import json
+import socket
+import threading
+import time
+from collections.abc import Callable
+from functools import partial
 from http import HTTPStatus
 
 import requests
 from oauth2_client.credentials_manager import CredentialManager, ServiceInformation
 from requests import Response
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.connection import HTTPConnection
 
+from cloudfoundry_client.conditional_requests import ConditionalRequests
 from cloudfoundry_client.doppler.client import DopplerClient
 from cloudfoundry_client.errors import InvalidStatusCode
+from cloudfoundry_client.json_decoder import STANDARD_DECODER
+from cloudfoundry_client.name_resolver import NameResolver
 from cloudfoundry_client.networking.v1.external.policies import PolicyManager
+from cloudfoundry_client.rate_limiter import RateLimiter
+from cloudfoundry_client.request_logger import RequestLogger
+from cloudfoundry_client.response_cache import ResponseCache
+from cloudfoundry_client.retry_policy import RetryPolicy
 from cloudfoundry_client.rlpgateway.client import RLPGatewayClient
 from cloudfoundry_client.v2.apps import AppManager as AppManagerV2
 from cloudfoundry_client.v2.buildpacks import BuildpackManager as BuildpackManagerV2
@@ -30,12 +44,15 @@ from cloudfoundry_client.v2.spaces import SpaceManager as SpaceManagerV2
 from cloudfoundry_client.v3.apps import AppManager
 from cloudfoundry_client.v3.audit_events import AuditEventManager
 from cloudfoundry_client.v3.buildpacks import BuildpackManager
+from cloudfoundry_client.v3.builds import BuildManager
+from cloudfoundry_client.v3.deployments import DeploymentManager
 from cloudfoundry_client.v3.domains import DomainManager
 from cloudfoundry_client.v3.droplets import DropletManager
 from cloudfoundry_client.v3.feature_flags import FeatureFlagManager
 from cloudfoundry_client.v3.isolation_segments import IsolationSegmentManager
 from cloudfoundry_client.v3.organization_quotas import OrganizationQuotaManager
 from cloudfoundry_client.v3.packages import PackageManager
+from cloudfoundry_client.v3.resource_matches import ResourceMatchManager
 from cloudfoundry_client.v3.processes import ProcessManager
 from cloudfoundry_client.v3.organizations import OrganizationManager
 from cloudfoundry_client.v3.roles import RoleManager
@@ -122,6 +139,8 @@ class V3(object):
         self.apps = AppManager(target_endpoint, credential_manager)
         self.audit_events = AuditEventManager(target_endpoint, credential_manager)
         self.buildpacks = BuildpackManager(target_endpoint, credential_manager)
+        self.builds = BuildManager(target_endpoint, credential_manager)
+        self.deployments = DeploymentManager(target_endpoint, credential_manager)
         self.domains = DomainManager(target_endpoint, credential_manager)
         self.droplets = DropletManager(target_endpoint, credential_manager)
         self.feature_flags = FeatureFlagManager(target_endpoint, credential_manager)
@@ -131,6 +150,7 @@ class V3(object):
         self.organization_quotas = OrganizationQuotaManager(target_endpoint, credential_manager)
         self.packages = PackageManager(target_endpoint, credential_manager)
         self.processes = ProcessManager(target_endpoint, credential_manager)
+        self.resource_matches = ResourceMatchManager(target_endpoint, credential_manager)
         self.roles = RoleManager(target_endpoint, credential_manager)
         self.routes = RouteManager(target_endpoint, credential_manager)
         self.security_groups = SecurityGroupManager(target_endpoint, credential_manager)
@@ -145,6 +165,27 @@ class V3(object):
         self.users = UserManager(target_endpoint, credential_manager)
 
 
+class SocketOptionsAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter whose connections, proxied or not, are opened with the given socket options.
+    """
+
+    def __init__(self, socket_options: list[tuple] | None = None, **kwargs):
+        # set before calling the parent constructor as it initializes the pool manager
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs):
+        if self.socket_options is not None:
+            pool_kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
+    def proxy_manager_for(self, proxy: str, **proxy_kwargs):
+        if self.socket_options is not None:
+            proxy_kwargs["socket_options"] = self.socket_options
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
 class CloudFoundryClient(CredentialManager):
     def __init__(self, target_endpoint: str, client_id: str = "cf", client_secret: str = "", **kwargs):
         """
@@ -163,11 +204,53 @@ class CloudFoundryClient(CredentialManager):
             of an identity provider. Note that this identity provider must support the grant type password.
             See UAA API specifications
         :param user_agent: string. Can be used to set a custom http user agent
+        :param json_decoder: JsonDecoder used to read the responses, such as JsonDecoder.fastest() to use orjson or ujson
+            when installed. Defaults to the standard library
+        :param request_logger: RequestLogger instrumenting each request (debug logs, body truncation, timing, hook).
+            Defaults to debug logs of at most 4096 bytes of the response bodies
+        :param retry_policy: RetryPolicy deciding which failed requests are retried (429, 502, 503 and 504 on
+            idempotent methods by default). Defaults to None: requests are not retried
+        :param rate_limiter: RateLimiter throttling the requests so that the budget of the user is not exhausted.
+            Defaults to None: requests are not throttled
+        :param response_cache: ResponseCache answering the GET requests of the types of resources it is configured for.
+            Defaults to None: responses are not cached
+        :param conditional_requests: ConditionalRequests revalidating the GET requests with ETag and Last-Modified,
+            so that unchanged bodies are not transferred again. Defaults to None
+        :param name_resolver: NameResolver turning names into guids, used by the command line and the push operation.
+            Defaults to a resolver remembering the guids found for five minutes
+        :param pool_connections: number of hosts whose connections are kept in the pool. Defaults to 10
+        :param pool_maxsize: maximum number of connections kept per host. Raise it when many threads share
+            the client. Defaults to 10
+        :param pool_block: when True, a thread waits for a free connection once pool_maxsize connections to a host
+            are in use, instead of opening a connection that is discarded afterward. Defaults to False
+        :param tcp_keep_alive: enables TCP keep-alive on the connections so that idle pooled connections are
+            not silently dropped by firewalls or load balancers. Defaults to False
+        :param socket_options: list of (level, option, value) passed to setsockopt on each new connection.
+            Replaces the default options of urllib3 and tcp_keep_alive
         """
         proxy = kwargs.get("proxy", dict(http="", https=""))
         verify = kwargs.get("verify", True)
+        user_agent = kwargs.get("user_agent", "cf-python-client")
         self.token_format = kwargs.get("token_format")
         self.login_hint = kwargs.get("login_hint")
+        self.json_decoder = kwargs.get("json_decoder") or STANDARD_DECODER
+        self.request_logger = kwargs.get("request_logger") or RequestLogger(_logger)
+        self.retry_policy: RetryPolicy | None = kwargs.get("retry_policy")
+        self.rate_limiter: RateLimiter | None = kwargs.get("rate_limiter")
+        self.response_cache: ResponseCache | None = kwargs.get("response_cache")
+        self.conditional_requests: ConditionalRequests | None = kwargs.get("conditional_requests")
+        self.name_resolver: NameResolver = kwargs.get("name_resolver") or NameResolver()
+        self._refresh_lock = threading.Lock()
+        self._pooled_session = CloudFoundryClient._build_session(
+            proxy,
+            verify,
+            user_agent,
+            pool_connections=kwargs.get("pool_connections", DEFAULT_POOLSIZE),
+            pool_maxsize=kwargs.get("pool_maxsize", DEFAULT_POOLSIZE),
+            pool_block=kwargs.get("pool_block", DEFAULT_POOLBLOCK),
+            tcp_keep_alive=kwargs.get("tcp_keep_alive", False),
+            socket_options=kwargs.get("socket_options"),
+        )
         target_endpoint_trimmed = target_endpoint.rstrip("/")
         info = self._get_info(target_endpoint_trimmed, proxy, verify=verify)
         service_information = ServiceInformation(
@@ -176,7 +259,7 @@ class CloudFoundryClient(CredentialManager):
         super().__init__(
             service_information,
             proxies=proxy,
-            user_agent=kwargs.get("user_agent", "cf-python-client")
+            user_agent=user_agent
         )
         self._v2 = (
             V2(info.api_v2_url, self)
@@ -238,9 +321,75 @@ class CloudFoundryClient(CredentialManager):
         else:
             return self._rlpgateway
 
+    def _bearer_request(self, method: Callable[..., Response], url: str, **kwargs) -> Response:
+        if kwargs.get("headers") is None:
+            kwargs["headers"] = dict()
+        access_token = self._access_token
+        response = method(url, **kwargs)
+        if self.refresh_token is not None and self._is_token_expired(response):
+            self._refresh_token(access_token)
+            return method(url, **kwargs)
+        return response
+
+    def _refresh_token(self, expired_token: str | None = None):
+        """
+        Refreshes the access token once for all the threads whose requests were sent with the expired token:
+        the refresh token may be renewed by the refresh, and a second refresh would send the former one.
+        :param expired_token: the token found expired. None refreshes the current token
+        """
+        with self._refresh_lock:
+            # another thread may have refreshed it while we were waiting
+            if expired_token is None or self._access_token == expired_token:
+                _logger.debug("_refresh_token - access token expired, refreshing it")
+                super()._refresh_token()
+
+    @property
+    def _access_token(self) -> str | None:
+        return CredentialManager._access_token.fget(self)
+
+    @_access_token.setter
+    def _access_token(self, access_token: str):
+        if self._session is None:
+            # the pooled session is reused (and its connections with it) when the token is renewed
+            self._pooled_session.headers.pop("Authorization", None)
+            self._session = self._pooled_session
+        if access_token is not None and len(access_token) > 0:
+            self._session.headers.update(dict(Authorization="Bearer %s" % access_token))
+
+    @staticmethod
+    def _build_session(
+        proxy: dict,
+        verify: bool | str,
+        user_agent: str | None,
+        pool_connections: int,
+        pool_maxsize: int,
+        pool_block: bool,
+        tcp_keep_alive: bool,
+        socket_options: list[tuple] | None,
+    ) -> requests.Session:
+        if socket_options is None and tcp_keep_alive:
+            socket_options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        adapter = SocketOptionsAdapter(
+            socket_options=socket_options,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.proxies = proxy
+        session.verify = verify
+        session.trust_env = False
+        if user_agent:
+            session.headers.update({"User-Agent": user_agent})
+        return session
+
     def _get_info(self, target_endpoint: str, proxy: dict | None = None, verify: bool = True) -> Info:
         root_response = CloudFoundryClient._check_response(
-            requests.get("%s/" % target_endpoint, proxies=proxy if proxy is not None else dict(http="", https=""), verify=verify)
+            self._pooled_session.get(
+                "%s/" % target_endpoint, proxies=proxy if proxy is not None else dict(http="", https=""), verify=verify
+            )
         )
         root_info = root_response.json()
 
@@ -345,41 +494,110 @@ class CloudFoundryClient(CredentialManager):
         )
 
     def get(self, url: str, params: dict | None = None, **kwargs) -> Response:
-        response = super().get(url, params, **kwargs)
-        CloudFoundryClient._log_request("GET", url, response)
-        return CloudFoundryClient._check_response(response)
+        # only plain requests are cached: streams or custom headers would not be honoured
+        if len(kwargs) > 0:
+            return self._request("GET", url, partial(super().get, url, params, **kwargs))
+        response = self.response_cache.get(url, params) if self.response_cache is not None else None
+        if response is None:
+            response = self._conditional_get(url, params)
+            if self.response_cache is not None:
+                self.response_cache.put(url, params, response)
+        return response
+
+    def _conditional_get(self, url: str, params: dict | None) -> Response:
+        if self.conditional_requests is None:
+            return self._request("GET", url, partial(super().get, url, params))
+        headers = self.conditional_requests.headers(url, params)
+        # a 304 is only expected when validators were sent, the stored response then replaces it
+        response = self._request(
+            "GET", url, partial(super().get, url, params, headers=headers), accept_not_modified=len(headers) > 0
+        )
+        resolved = self.conditional_requests.resolve(url, params, response)
+        if resolved is None:
+            response = self._request("GET", url, partial(super().get, url, params, headers=dict()))
+            resolved = self.conditional_requests.resolve(url, params, response)
+        return resolved if resolved is not None else response
 
     def post(self, url: str, data=None, json=None, **kwargs) -> Response:
-        response = super().post(url, data, json, **kwargs)
-        CloudFoundryClient._log_request("POST", url, response)
-        return CloudFoundryClient._check_response(response)
+        file_positions = CloudFoundryClient._file_positions(data, kwargs.get("files"))
+        return self._mutate("POST", url, partial(super().post, url, data, json, **kwargs), file_positions)
 
     def put(self, url: str, data=None, json=None, **kwargs) -> Response:
-        response = super().put(url, data, json, **kwargs)
-        CloudFoundryClient._log_request("PUT", url, response)
-        return CloudFoundryClient._check_response(response)
+        file_positions = CloudFoundryClient._file_positions(data, kwargs.get("files"))
+        return self._mutate("PUT", url, partial(super().put, url, data, json, **kwargs), file_positions)
 
     def patch(self, url: str, data=None, json=None, **kwargs) -> Response:
-        response = super().patch(url, data, json, **kwargs)
-        CloudFoundryClient._log_request("PATCH", url, response)
-        return CloudFoundryClient._check_response(response)
+        file_positions = CloudFoundryClient._file_positions(data, kwargs.get("files"))
+        return self._mutate("PATCH", url, partial(super().patch, url, data, json, **kwargs), file_positions)
 
     def delete(self, url: str, **kwargs) -> Response:
-        response = super().delete(url, **kwargs)
-        CloudFoundryClient._log_request("DELETE", url, response)
-        return CloudFoundryClient._check_response(response)
+        return self._mutate("DELETE", url, partial(super().delete, url, **kwargs))
+
+    def _mutate(self, method: str, url: str, send: Callable[[], Response], file_positions: list | None = None) -> Response:
+        try:
+            return self._request(method, url, send, file_positions)
+        finally:
+            # even a failed request may have modified the resource
+            if self.response_cache is not None:
+                self.response_cache.invalidate(url)
+            self.name_resolver.invalidate(url)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        send: Callable[[], Response],
+        file_positions: list | None = None,
+        accept_not_modified: bool = False,
+    ) -> Response:
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            started = self.request_logger.start()
+            response = send()
+            self.request_logger.log(method, url, response, started)
+            if self.rate_limiter is not None:
+                self.rate_limiter.update(response)
+            delay = self.retry_policy.delay(method, response, attempt) if self.retry_policy is not None else None
+            # the files sent were read up to their end, they are sent again from where they started
+            if delay is None or not CloudFoundryClient._rewind(file_positions):
+                return CloudFoundryClient._check_response(response, accept_not_modified)
+            _logger.debug("%s: url=%s - status_code=%s - retrying in %.2fs", method, url, response.status_code, delay)
+            time.sleep(delay)
+            attempt += 1
 
     @staticmethod
-    def _log_request(method: str, url: str, response: Response):
-        _logger.debug(
-            f"{method}: url={url} - status_code={response.status_code}"
-            f" - vcap-request-id={response.headers.get('x-vcap-request-id', 'N/A')} - response={response.text}"
-        )
+    def _file_positions(data, files) -> list[tuple]:
+        file_values = files.values() if isinstance(files, dict) else files or []
+        file_positions = []
+        for value in [data, *file_values]:
+            # files are given as file objects, or tuples of a name, a file object, a content type...
+            file_object = value[1] if isinstance(value, tuple) and len(value) > 1 else value
+            if hasattr(file_object, "read"):
+                try:
+                    file_positions.append((file_object, file_object.tell()))
+                except (AttributeError, OSError):
+                    file_positions.append((file_object, None))
+        return file_positions
 
     @staticmethod
-    def _check_response(response: Response) -> Response:
+    def _rewind(file_positions: list[tuple] | None) -> bool:
+        for file_object, position in file_positions or []:
+            if position is None:
+                return False
+            try:
+                file_object.seek(position)
+            except (AttributeError, OSError):
+                return False
+        return True
+
+    @staticmethod
+    def _check_response(response: Response, accept_not_modified: bool = False) -> Response:
         if int(response.status_code / 100) == 2:
             return response
+        elif accept_not_modified and response.status_code == HTTPStatus.NOT_MODIFIED.value:
+            return response
         else:
             try:
                 body = response.json()
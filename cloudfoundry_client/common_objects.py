@@ -1,6 +1,6 @@
 import json
-from collections.abc import Callable, Generator
-from typing import TypeVar, Generic
+from collections.abc import AsyncIterator, Awaitable, Callable, Generator, Iterable, Mapping
+from typing import Any, TypeVar, Generic
 
 
 class Request(dict):
@@ -16,6 +16,49 @@ class JsonObject(dict):
     json = json.dumps
 
 
+class BufferedResponse(object):
+    """
+    A response whose body has already been read, such as the one of the asynchronous client or a stored one.
+    It exposes the subset of requests.Response used by the entity managers so that the response parsing is shared.
+    """
+
+    def __init__(self, url: str, status_code: int, headers: Mapping[str, str], content: bytes, encoding: str | None):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def json(self, **kwargs) -> Any:
+        return json.loads(self.text, **kwargs)
+
+
+class Projection(object):
+    """
+    Extracts the values found at the given paths of a resource as a tuple.
+    A path is a dot separated list of keys, eg. "relationships.space.data.guid". Missing values are None.
+    """
+
+    def __init__(self, paths: Iterable[str] | str):
+        self._paths = [path.split(".") for path in ([paths] if isinstance(paths, str) else paths)]
+
+    def __call__(self, resource: dict) -> tuple:
+        return tuple(Projection._extract(resource, keys) for keys in self._paths)
+
+    @staticmethod
+    def _extract(resource: dict, keys: list[str]) -> Any:
+        value = resource
+        for key in keys:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+
+
 ENTITY = TypeVar('ENTITY')
 
 
@@ -54,10 +97,57 @@ class Pagination(Generic[ENTITY], Generator[ENTITY, None, None]):
         super().throw(typ, val, tb)
 
     def close(self):
+        # the next page loader may keep pages in flight, they are not loaded once the iteration stops
+        close_loader = getattr(self._next_page_loader, "close", None)
+        if close_loader is not None:
+            close_loader()
         super().close()
 
+    def __del__(self):
+        self.close()
+
     def __iter__(self):
         return self
 
     def __next__(self) -> ENTITY:
         return self.send(None)
+
+
+class AsyncPagination(Generic[ENTITY], AsyncIterator[ENTITY]):
+    def __init__(self, first_page: JsonObject,
+                 total_result: int,
+                 next_page_loader: Callable[[JsonObject], Awaitable[JsonObject | None]],
+                 resources_accessor: Callable[[JsonObject], list[JsonObject]],
+                 instance_creator: Callable[[JsonObject], ENTITY]):
+        self._first_page = first_page
+        self._total_results = total_result
+        self._next_page_loader = next_page_loader
+        self._resources_accessor = resources_accessor
+        self._instance_creator = instance_creator
+        self._cursor = None
+        self._current_page = None
+
+    @property
+    def total_results(self) -> int:
+        return self._total_results
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> ENTITY:
+        if self._cursor is None:
+            self._current_page = self._first_page
+            self._cursor = self._resources_accessor(self._current_page).__iter__()
+        while True:
+            try:
+                return self._instance_creator(self._cursor.__next__())
+            except StopIteration:
+                self._current_page = await self._next_page_loader(self._current_page)
+                if self._current_page is None:
+                    raise StopAsyncIteration
+                self._cursor = self._resources_accessor(self._current_page).__iter__()
+
+
+def chunk_guids(guids: Iterable[str], chunk_size: int) -> list[list[str]]:
+    unique_guids = list(dict.fromkeys(guids))
+    return [unique_guids[start:start + chunk_size] for start in range(0, len(unique_guids), chunk_size)]
@@ -0,0 +1,139 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from http import HTTPStatus
+from typing import Any
+from urllib.parse import urlencode
+
+from requests import Response
+
+from cloudfoundry_client.common_objects import BufferedResponse
+
+StoredEntry = dict[str, Any]
+
+
+class MemoryValidatorStore(object):
+    """
+    Keeps the last max_size entries in memory.
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._entries: OrderedDict[str, StoredEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> StoredEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: StoredEntry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+
+class DiskValidatorStore(object):
+    """
+    Keeps the entries in a directory, one file per request, so that they survive the process.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def get(self, key: str) -> StoredEntry | None:
+        try:
+            with open(self._path(key), "rb") as f:
+                metadata = json.loads(f.readline())
+                metadata["content"] = f.read()
+                return metadata
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, entry: StoredEntry):
+        metadata = {name: value for name, value in entry.items() if name != "content"}
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(file_descriptor, "wb") as f:
+            f.write(json.dumps(metadata).encode("utf-8"))
+            f.write(b"\n")
+            f.write(entry["content"])
+        # readers never see a partially written file
+        os.replace(temporary_path, self._path(key))
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(key.encode("utf-8")).hexdigest())
+
+
+class ConditionalRequests(object):
+    """
+    Sends the validators (ETag, Last-Modified) of the previous response to a GET request, and answers
+    with the stored body when the server replies 304 Not Modified.
+    """
+
+    def __init__(self, store: MemoryValidatorStore | DiskValidatorStore | None = None):
+        """
+        :param store: where the validators and bodies are kept. Defaults to the memory of the process
+        """
+        self.store = store if store is not None else MemoryValidatorStore()
+        self.not_modified = 0
+        self.modified = 0
+        self._lock = threading.Lock()
+
+    def headers(self, url: str, params: dict | None) -> dict[str, str]:
+        entry = self.store.get(ConditionalRequests._key(url, params))
+        headers = dict()
+        if entry is not None:
+            if entry.get("etag") is not None:
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified") is not None:
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def resolve(self, url: str, params: dict | None, response: Response) -> Response | BufferedResponse | None:
+        """
+        :return: the response, the stored one when not modified. None when not modified but the stored response is gone
+        (evicted, deleted or unreadable): the request must then be sent again without validators
+        """
+        key = ConditionalRequests._key(url, params)
+        if response.status_code == HTTPStatus.NOT_MODIFIED.value:
+            entry = self.store.get(key)
+            if entry is not None:
+                with self._lock:
+                    self.not_modified += 1
+                return BufferedResponse(response.url, entry["status_code"], entry["headers"], entry["content"], entry["encoding"])
+            return None
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code == HTTPStatus.OK.value and (etag is not None or last_modified is not None):
+            with self._lock:
+                self.modified += 1
+            self.store.put(
+                key,
+                dict(
+                    etag=etag,
+                    last_modified=last_modified,
+                    status_code=response.status_code,
+                    headers=dict(response.headers),
+                    content=response.content,
+                    encoding=response.encoding,
+                ),
+            )
+        return response
+
+    def counters(self) -> dict:
+        with self._lock:
+            return dict(not_modified=self.not_modified, modified=self.modified)
+
+    @staticmethod
+    def _key(url: str, params: dict | None) -> str:
+        if not params:
+            return url
+        return "%s%s%s" % (url, "&" if "?" in url else "?", urlencode(sorted(params.items()), doseq=True))
@@ -0,0 +1,69 @@
+import json
+from collections.abc import Callable
+from json import JSONDecodeError
+from typing import Any
+
+from requests import Response
+
+from cloudfoundry_client.common_objects import JsonObject
+
+
+class JsonDecoder(object):
+    """
+    Decodes the body of the responses. Every object of a response is a JsonObject.
+    """
+
+    def __init__(self, loads: Callable[[bytes], Any] | None = None):
+        """
+        :param loads: function decoding a JSON document given as bytes, such as orjson.loads. Its objects are turned into
+            JsonObject afterwards. Defaults to the standard library, which builds them while decoding.
+        """
+        self.loads = loads
+
+    def decode(self, response: Response) -> JsonObject | Any:
+        if self.loads is None:
+            return json.loads(response.content, object_hook=JsonObject)
+        try:
+            result = self.loads(response.content)
+        except JSONDecodeError:
+            raise
+        except ValueError as e:
+            raise JSONDecodeError(str(e), "", 0)
+        return JsonDecoder._wrap(result)
+
+    @staticmethod
+    def of(client: Any) -> "JsonDecoder":
+        """
+        :return: the decoder of a client, the standard one when it has none such as for clients built by subclasses
+        """
+        decoder = getattr(client, "json_decoder", None)
+        return decoder if isinstance(decoder, JsonDecoder) else STANDARD_DECODER
+
+    @staticmethod
+    def fastest() -> "JsonDecoder":
+        """
+        :return: a decoder using orjson when installed, then ujson, then the standard library
+        """
+        try:
+            import orjson
+
+            return JsonDecoder(orjson.loads)
+        except ImportError:
+            pass
+        try:
+            import ujson
+
+            return JsonDecoder(ujson.loads)
+        except ImportError:
+            return JsonDecoder()
+
+    @staticmethod
+    def _wrap(value: Any) -> Any:
+        if isinstance(value, dict):
+            return JsonObject((key, JsonDecoder._wrap(item)) for key, item in value.items())
+        elif isinstance(value, list):
+            return [JsonDecoder._wrap(item) for item in value]
+        return value
+
+
+STANDARD_DECODER = JsonDecoder()
@@ -54,7 +54,7 @@ class AppCommandDomain(CommandDomain):
 
     def recent_logs(self) -> Command:
         def execute(client, arguments):
-            resource_id = self.resolve_id(arguments.id[0], lambda x: self._get_client_domain(client).get_first(name=x))
+            resource_id = self.resolve_id(arguments.id[0], client)
             for envelope in client.doppler.recent_logs(resource_id):
                 print(envelope)
 
@@ -62,7 +62,7 @@ class AppCommandDomain(CommandDomain):
 
     def stream_logs(self) -> Command:
         def execute(client, arguments):
-            resource_id = self.resolve_id(arguments.id[0], lambda x: self._get_client_domain(client).get_first(name=x))
+            resource_id = self.resolve_id(arguments.id[0], client)
             try:
                 for envelope in client.doppler.stream_logs(resource_id):
                     print(envelope)
@@ -73,14 +73,14 @@ class AppCommandDomain(CommandDomain):
 
     def simple_extra_command(self, entry) -> Command:
         def execute(client, arguments):
-            resource_id = self.resolve_id(arguments.id[0], lambda x: self._get_client_domain(client).get_first(name=x))
+            resource_id = self.resolve_id(arguments.id[0], client)
             print(getattr(self._get_client_domain(client), entry)(resource_id).json(indent=1))
 
         return Command(entry, self._generate_id_command_parser(entry), execute)
 
     def app_routes(self) -> Command:
         def execute(client: CloudFoundryClient, arguments: Namespace):
-            resource_id = self.resolve_id(arguments.id[0], lambda x: self._get_client_domain(client).get_first(name=x))
+            resource_id = self.resolve_id(arguments.id[0], client)
             for entity in getattr(self._get_client_domain(client), "list_routes")(resource_id):
                 print("%s - %s" % (entity["metadata"]["guid"], entity["entity"]["host"]))
 
@@ -96,7 +96,7 @@ class AppCommandDomain(CommandDomain):
 
         def execute(client: CloudFoundryClient, arguments: Namespace):
             app_domain = self._get_client_domain(client)
-            resource_id = self.resolve_id(arguments.id[0], lambda x: app_domain.get_first(name=x))
+            resource_id = self.resolve_id(arguments.id[0], client)
             getattr(app_domain, "restart_instance")(resource_id, int(arguments.instance_id[0]))
 
         return Command("restart_instance", generate_parser, execute)
@@ -1,4 +1,3 @@
-import functools
 import json
 import os
 import re
@@ -106,16 +105,13 @@ class CommandDomain(object):
         elif self.api_version == "v3":
             return entity["guid"]
 
-    def resolve_id(self, argument: str, get_by_name: Callable[[str], JsonObject]) -> str:
+    def resolve_id(self, argument: str, client: CloudFoundryClient) -> str:
         if CommandDomain.is_guid(argument):
             return argument
         elif self.allow_retrieve_by_name:
-            result = get_by_name(argument)
-            if result is not None:
-                if self.api_version == "v2":
-                    return result["metadata"]["guid"]
-                elif self.api_version == "v3":
-                    return result["guid"]
+            guid = client.name_resolver.resolve(self._get_client_domain(client), argument, self.name_property)
+            if guid is not None:
+                return guid
             else:
                 raise InvalidStatusCode(HTTPStatus.NOT_FOUND, "%s with name %s" % (self.client_domain, argument))
         else:
@@ -127,8 +123,19 @@ class CommandDomain(object):
         elif self.api_version == "v3":
             return entity[self.name_property]
 
-    def find_by_name(self, client: CloudFoundryClient, name: str) -> JsonObject:
-        return self._get_client_domain(client).get_first(**{self.name_property: name})
+    def find_by_name(self, client: CloudFoundryClient, name: str) -> JsonObject | None:
+        client_domain = self._get_client_domain(client)
+        # the entity is fetched by its guid only when already known: otherwise a single lookup by name gets it
+        guid = client.name_resolver.remembered(client_domain, name, self.name_property)
+        if guid is not None:
+            return client_domain.get(guid)
+        entity = self._get_first_by_name(client_domain, name)
+        if entity is not None:
+            client.name_resolver.remember(client_domain, name, self.id(entity), self.name_property)
+        return entity
+
+    def _get_first_by_name(self, client_domain: Any, name: str) -> JsonObject | None:
+        return client_domain.get_first(**{self.name_property: name})
 
     def create(self) -> Command:
         entry = self._create_entry()
@@ -165,16 +172,7 @@ class CommandDomain(object):
         entry = self._delete_entry()
 
         def execute(client: CloudFoundryClient, arguments: Namespace):
-            if self.is_guid(arguments.id[0]):
-                self._get_client_domain(client)._remove(arguments.id[0])
-            elif self.allow_retrieve_by_name:
-                entity = self.find_by_name(client, arguments.id[0])
-                if entity is None:
-                    raise InvalidStatusCode(HTTPStatus.NOT_FOUND, "%s with name %s" % (self.client_domain, arguments.id[0]))
-                else:
-                    self._get_client_domain(client)._remove(self.id(entity))
-            else:
-                raise ValueError("id: %s: does not allow search by name" % self.client_domain)
+            self._get_client_domain(client)._remove(self.resolve_id(arguments.id[0], client))
 
         def generate_parser(parser: _SubParsersAction):
             delete_parser = parser.add_parser(entry)
@@ -192,7 +190,7 @@ class CommandDomain(object):
         entry = self._get_entry()
 
         def execute(client: CloudFoundryClient, arguments: Namespace):
-            resource_id = self.resolve_id(arguments.id[0], functools.partial(self.find_by_name, client))
+            resource_id = self.resolve_id(arguments.id[0], client)
             print(self._get_client_domain(client).get(resource_id).json(indent=1))
 
         def generate_parser(parser: _SubParsersAction):
@@ -1,6 +1,7 @@
 import json
 import os
 from argparse import Namespace, _SubParsersAction
+from typing import Any
 
 from cloudfoundry_client.client import CloudFoundryClient
 from cloudfoundry_client.common_objects import JsonObject
@@ -30,8 +31,8 @@ class TaskCommandDomain(CommandDomain):
     def name(self, entity: JsonObject) -> str:
         return entity[self.name_property]
 
-    def find_by_name(self, client: CloudFoundryClient, name: str):
-        return self._get_client_domain(client).get_first(**{"%ss" % self.name_property: name})
+    def _get_first_by_name(self, client_domain: Any, name: str) -> JsonObject | None:
+        return client_domain.get_first(**{"%ss" % self.name_property: name})
 
     def create(self) -> Command:
         entry = self._create_entry()
@@ -0,0 +1,47 @@
+import uuid
+from collections.abc import Iterable, Iterator
+
+MultipartFile = tuple[str, Iterable[bytes], str]
+
+
+class MultipartStream(object):
+    """
+    A multipart/form-data body produced while it is sent: requests transmits an iterable body with
+    chunked transfer encoding. The parts are iterated again each time the body is, so that a request
+    sent once more (on a token refresh or a retry) sends the whole body again.
+    """
+
+    def __init__(self, fields: dict[str, str], files: dict[str, MultipartFile], boundary: str | None = None):
+        """
+        :param fields: the values of the form fields, by name
+        :param files: (file name, iterable of bytes, content type) of the files, by name of field
+        :param boundary: separates the parts. Defaults to a random one
+        """
+        self.fields = fields
+        self.files = files
+        self.boundary = boundary if boundary is not None else uuid.uuid4().hex
+
+    @property
+    def content_type(self) -> str:
+        return "multipart/form-data; boundary=%s" % self.boundary
+
+    def __iter__(self) -> Iterator[bytes]:
+        for name, value in self.fields.items():
+            yield self._part_header(name) + b"\r\n" + value.encode("utf-8") + b"\r\n"
+        for name, (file_name, content, content_type) in self.files.items():
+            yield (
+                self._part_header(name, file_name)
+                + ("Content-Type: %s\r\nContent-Transfer-Encoding: binary\r\n\r\n" % content_type).encode("utf-8")
+            )
+            for chunk in content:
+                # an empty chunk would end the chunked body
+                if len(chunk) > 0:
+                    yield chunk
+            yield b"\r\n"
+        yield ("--%s--\r\n" % self.boundary).encode("utf-8")
+
+    def _part_header(self, name: str, file_name: str | None = None) -> bytes:
+        disposition = 'form-data; name="%s"' % name
+        if file_name is not None:
+            disposition += '; filename="%s"' % file_name
+        return ("--%s\r\nContent-Disposition: %s\r\n" % (self.boundary, disposition)).encode("utf-8")
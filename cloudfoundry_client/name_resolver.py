@@ -0,0 +1,118 @@
+import threading
+import time
+from collections.abc import Callable, Iterable
+from urllib.parse import urlparse
+
+from cloudfoundry_client.v2.entities import EntityManager as EntityManagerV2
+from cloudfoundry_client.v3.entities import EntityManager
+
+NameKey = tuple[str, str, tuple, str]
+
+
+class NameResolver(object):
+    """
+    Resolves names of entities into their guid. Names are looked up by batches (names= filter on v3,
+    q=name IN on v2) and the guids found are kept for a time to live.
+    A request modifying an entity through the client (rename, deletion...) forgets its guid.
+    """
+
+    def __init__(self, ttl: float = 300.0, batch_size: int = 50, clock: Callable[[], float] = time.monotonic):
+        """
+        :param ttl: number of seconds a guid is remembered. 0 disables the cache
+        :param batch_size: number of names looked up by request
+        :param clock: gives the current time in seconds
+        """
+        self.ttl = ttl
+        self.batch_size = batch_size
+        self.clock = clock
+        self._guids: dict[NameKey, tuple[float, str]] = dict()
+        self._lock = threading.Lock()
+
+    def resolve(
+        self, manager: EntityManager | EntityManagerV2, name: str, name_property: str = "name", **filters
+    ) -> str | None:
+        """
+        :param manager: the manager of the entities, v2 or v3
+        :param name: the name looked up
+        :param name_property: the property holding the name
+        :param filters: other filters of the lookup, such as space_guids=... on v3 or space_guid=... on v2
+        :return: the guid of the first entity found, None if not found
+        """
+        return self.resolve_many(manager, [name], name_property, **filters).get(name)
+
+    def resolve_many(
+        self, manager: EntityManager | EntityManagerV2, names: Iterable[str], name_property: str = "name", **filters
+    ) -> dict[str, str]:
+        """
+        :return: the guid of each name found
+        """
+        result = dict()
+        missing = []
+        now = self.clock()
+        with self._lock:
+            for name in names:
+                entry = self._guids.get(NameResolver._key(manager, name_property, filters, name))
+                if entry is not None and entry[0] > now:
+                    result[name] = entry[1]
+                elif name not in missing:
+                    missing.append(name)
+        # the names are joined with commas in the filters
+        single_lookups = [name for name in missing if "," in name]
+        batched_lookups = [name for name in missing if "," not in name]
+        for start in range(0, len(batched_lookups), self.batch_size):
+            result.update(self._lookup(manager, batched_lookups[start:start + self.batch_size], name_property, filters))
+        for name in single_lookups:
+            result.update(self._lookup(manager, name, name_property, filters))
+        return result
+
+    def remembered(
+        self, manager: EntityManager | EntityManagerV2, name: str, name_property: str = "name", **filters
+    ) -> str | None:
+        """
+        :return: the guid of a name if it is still remembered, without looking it up
+        """
+        with self._lock:
+            entry = self._guids.get(NameResolver._key(manager, name_property, filters, name))
+        return entry[1] if entry is not None and entry[0] > self.clock() else None
+
+    def remember(self, manager: EntityManager | EntityManagerV2, name: str, guid: str, name_property: str = "name", **filters):
+        if self.ttl > 0:
+            with self._lock:
+                self._guids[NameResolver._key(manager, name_property, filters, name)] = (self.clock() + self.ttl, guid)
+
+    def forget(self, manager: EntityManager | EntityManagerV2, name: str, name_property: str = "name", **filters):
+        """
+        Forgets the guid of a name, such as when the entity was deleted by another client.
+        """
+        with self._lock:
+            self._guids.pop(NameResolver._key(manager, name_property, filters, name), None)
+
+    def invalidate(self, url: str):
+        segments = set(urlparse(url).path.split("/"))
+        with self._lock:
+            for key in [key for key, (_, guid) in self._guids.items() if guid in segments]:
+                del self._guids[key]
+
+    def clear(self):
+        with self._lock:
+            self._guids.clear()
+
+    def _lookup(
+        self, manager: EntityManager | EntityManagerV2, names: list[str] | str, name_property: str, filters: dict
+    ) -> dict[str, str]:
+        found = dict()
+        if isinstance(manager, EntityManager):
+            query = {"%ss" % name_property: names, "per_page": 5000}
+            for entity in manager.list(raw=True, **query, **filters):
+                found.setdefault(entity[name_property], entity["guid"])
+        else:
+            query = {name_property: names, "results-per-page": 100}
+            for entity in manager.list(raw=True, **query, **filters):
+                found.setdefault(entity["entity"][name_property], entity["metadata"]["guid"])
+        for name, guid in found.items():
+            self.remember(manager, name, guid, name_property, **filters)
+        return found
+
+    @staticmethod
+    def _key(manager: EntityManager | EntityManagerV2, name_property: str, filters: dict, name: str) -> NameKey:
+        return manager.entity_uri, name_property, tuple(sorted((key, str(value)) for key, value in filters.items())), name
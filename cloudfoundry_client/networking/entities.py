@@ -1,4 +1,3 @@
-import logging
 from collections.abc import Callable, Generator
 from functools import reduce
 from typing import Any, TYPE_CHECKING
@@ -8,12 +7,11 @@ from requests import Response
 
 from cloudfoundry_client.errors import InvalidEntity
 from cloudfoundry_client.common_objects import JsonObject, Request
+from cloudfoundry_client.json_decoder import JsonDecoder
 
 if TYPE_CHECKING:
     from cloudfoundry_client.client import CloudFoundryClient
 
-_logger = logging.getLogger(__name__)
-
 
 class Entity(JsonObject):
     def __init__(self, target_endpoint: str, client: "CloudFoundryClient", *args, **kwargs):
@@ -56,7 +54,6 @@ class EntityManager(object):
         url_requested = self._get_url_filtered("%s%s" % (self.target_endpoint, requested_path), **kwargs)
         response = self.client.get(url_requested)
         entity_builder = self._get_entity_builder(entity_builder)
-        _logger.debug("GET - %s - %s", url_requested, response.text)
         response_json = self._read_response(response, JsonObject)
         for resource in response_json["policies"]:
             yield entity_builder(list(resource.items()))
@@ -71,12 +68,10 @@ class EntityManager(object):
 
     def _post(self, url: str, data: dict | None = None, **kwargs):
         response = self.client.post(url, json=data, **kwargs)
-        _logger.debug("POST - %s - %s", url, response.text)
         return self._read_response(response)
 
     def _delete(self, url: str, **kwargs):
-        response = self.client.delete(url, **kwargs)
-        _logger.debug("DELETE - %s - %s", url, response.text)
+        self.client.delete(url, **kwargs)
 
     def __iter__(self) -> Generator[Entity, None, None]:
         return self.list()
@@ -92,7 +87,7 @@ class EntityManager(object):
 
     def _read_response(self, response: Response, other_entity_builder: EntityBuilder | None = None):
         entity_builder = self._get_entity_builder(other_entity_builder)
-        result = response.json(object_pairs_hook=JsonObject)
+        result = JsonDecoder.of(self.client).decode(response)
         return entity_builder(list(result.items()))
 
     @staticmethod
@@ -1,39 +1,135 @@
-import fnmatch
-import logging
 import os
-
-_logger = logging.getLogger(__name__)
+import re
+from collections.abc import Iterable
 
 
 class CfIgnore(object):
-    def __init__(self, application_path: str):
-        ignore_file_path = os.path.join(application_path, ".cfignore")
-        self.ignore_items = []
-        if os.path.isfile(ignore_file_path):
-            with open(ignore_file_path, "r") as ignore_file:
-                for line in ignore_file.readlines():
-                    self.ignore_items.extend(self._pattern(line.strip(" \n")))
+    """
+    The rules of a .cfignore file, compiled once into two regular expressions: one for the files, one for the directories.
+    Blank lines and lines starting with # are skipped, ! re-includes what a previous rule ignored, a trailing / restricts
+    the rule to directories and a leading / anchors it to the application directory. Unlike .gitignore, the other rules
+    match at any depth even when they contain a slash: docs/*.md ignores both docs/a.md and lib/docs/a.md.
+    A file in an ignored directory cannot be re-included, so that ignored directories need not be walked.
+    """
+
+    def __init__(self, application_path: str | None = None, ignore_lines: Iterable[str] | None = None):
+        """
+        :param application_path: the directory whose .cfignore file is read
+        :param ignore_lines: the lines of a .cfignore file read elsewhere, such as in a zip file
+        """
+        if ignore_lines is None and application_path is not None:
+            ignore_file_path = os.path.join(application_path, ".cfignore")
+            if os.path.isfile(ignore_file_path):
+                with open(ignore_file_path, "r") as ignore_file:
+                    ignore_lines = ignore_file.readlines()
+        # (negated, directory only, regular expression) by order of the lines
+        self.rules: list[tuple[bool, bool, str]] = [
+            rule for rule in (CfIgnore._rule(line) for line in ignore_lines or []) if rule is not None
+        ]
+        self._file_matcher = CfIgnore._compile([rule for rule in self.rules if not rule[1]])
+        self._directory_matcher = CfIgnore._compile(self.rules)
 
     def is_entry_ignored(self, relative_file: str) -> bool:
-        def is_relative_file_ignored(cf_ignore_entry):
-            _logger.debug("is_relative_file_ignored - %s - %s", cf_ignore_entry, relative_file)
-            file_path = (
-                "/%s" % relative_file if cf_ignore_entry.startswith("/") and not relative_file.startswith("/") else relative_file
+        """
+        :param relative_file: the path of a file relative to the application directory
+        """
+        relative_file = relative_file.replace(os.sep, "/").lstrip("/")
+        parent_directories = relative_file.split("/")[:-1]
+        for depth in range(1, len(parent_directories) + 1):
+            if self.is_directory_ignored("/".join(parent_directories[:depth])):
+                return True
+        return self.is_file_ignored(relative_file)
+
+    def is_file_ignored(self, relative_file: str) -> bool:
+        """
+        Tells whether a file is ignored by its own rules, its parent directories are expected not to be ignored.
+        :param relative_file: the path of a file relative to the application directory
+        """
+        return CfIgnore._is_ignored(self._file_matcher, relative_file.replace(os.sep, "/").lstrip("/"))
+
+    def is_directory_ignored(self, relative_directory: str) -> bool:
+        """
+        Tells whether a directory is ignored by its own rules, its parent directories are expected not to be ignored
+        as when the directories are walked from the top.
+        :param relative_directory: the path of a directory relative to the application directory
+        """
+        return CfIgnore._is_ignored(self._directory_matcher, relative_directory.replace(os.sep, "/").strip("/"))
+
+    @staticmethod
+    def _is_ignored(matcher: re.Pattern | None, relative_path: str) -> bool:
+        match = matcher.fullmatch(relative_path) if matcher is not None else None
+        # the groups of the rules are in reverse order: the one matched is the last rule matching
+        return match is not None and match.lastgroup.startswith("i")
+
+    @staticmethod
+    def _compile(rules: list[tuple[bool, bool, str]]) -> re.Pattern | None:
+        if len(rules) == 0:
+            return None
+        return re.compile(
+            "|".join(
+                "(?P<%s%d>%s)" % ("n" if negated else "i", index, expression)
+                for index, (negated, _, expression) in reversed(list(enumerate(rules)))
             )
-            return fnmatch.fnmatch(file_path, cf_ignore_entry)
+        )
 
-        return any([is_relative_file_ignored(ignore_item) for ignore_item in self.ignore_items])
+    @staticmethod
+    def _rule(line: str) -> tuple[bool, bool, str] | None:
+        pattern = line.rstrip("\r\n")
+        # trailing spaces are kept when escaped
+        if not pattern.endswith("\\ "):
+            pattern = pattern.rstrip(" ")
+        if len(pattern) == 0 or pattern.startswith("#"):
+            return None
+        negated = pattern.startswith("!")
+        if negated:
+            pattern = pattern[1:]
+        elif pattern.startswith("\\!") or pattern.startswith("\\#"):
+            pattern = pattern[1:]
+        directory_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        anchored = pattern.startswith("/")
+        pattern = pattern.lstrip("/")
+        if len(pattern) == 0:
+            return None
+        expression = CfIgnore._translate(pattern)
+        return negated, directory_only, expression if anchored else "(?:.*/)?%s" % expression
 
     @staticmethod
-    def _pattern(pattern: str) -> list[str]:
-        if pattern.find("/") < 0:
-            return [pattern, os.path.join("**", pattern)]
-        elif pattern.endswith("/"):
-            return [
-                os.path.join("/", pattern, "*"),
-                os.path.join("/", pattern, "**", "*"),
-                os.path.join("/", "**", pattern, "*"),
-                os.path.join("/", "**", pattern, "**", "*"),
-            ]
-        else:
-            return [os.path.join("/", pattern), os.path.join("/", "**", pattern)]
+    def _translate(pattern: str) -> str:
+        expression = []
+        index = 0
+        while index < len(pattern):
+            character = pattern[index]
+            if pattern.startswith("**/", index) and (index == 0 or pattern[index - 1] == "/"):
+                # any number of directories, none included
+                expression.append("(?:.*/)?")
+                index += 3
+            elif pattern.startswith("**", index):
+                expression.append(".*")
+                index += 2
+            elif character == "*":
+                expression.append("[^/]*")
+                index += 1
+            elif character == "?":
+                expression.append("[^/]")
+                index += 1
+            elif character == "[":
+                # a ] right after the opening bracket, or its negation, is part of the class
+                first = index + 2 if pattern.startswith(("[!", "[^"), index) else index + 1
+                end = pattern.find("]", first + 1)
+                if end < 0:
+                    expression.append(re.escape(character))
+                    index += 1
+                else:
+                    characters = pattern[index + 1 : end]
+                    if characters.startswith("!"):
+                        characters = "^" + characters[1:]
+                    expression.append("[%s]" % characters.replace("\\", "\\\\"))
+                    index = end + 1
+            elif character == "\\" and index + 1 < len(pattern):
+                expression.append(re.escape(pattern[index + 1]))
+                index += 2
+            else:
+                expression.append(re.escape(character))
+                index += 1
+        return "".join(expression)
@@ -0,0 +1,181 @@
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from cloudfoundry_client.client import CloudFoundryClient
+from cloudfoundry_client.v3.deployments import DeploymentStrategy
+from cloudfoundry_client.v3.entities import Entity
+from cloudfoundry_client.waiter import Waiter, WaitTimeout
+
+_logger = logging.getLogger(__name__)
+
+
+class DeploymentOperation(object):
+    """
+    Replaces the instances of a started application by those of a new droplet with a v3 deployment: the instances are
+    replaced a few at a time (rolling) or by steps (canary), the application keeps serving while it is deployed.
+    The time spent in each phase of the deployments (staging, deploying, paused...) is kept by application.
+    """
+
+    STAGING_TIMEOUT = 15 * 60
+    DEPLOYMENT_TIMEOUT = 30 * 60
+
+    def __init__(
+        self,
+        client: CloudFoundryClient,
+        strategy: DeploymentStrategy = DeploymentStrategy.ROLLING,
+        max_in_flight: int | None = None,
+        canary_steps: list[dict] | None = None,
+        auto_continue: bool = True,
+        timeout: float = DEPLOYMENT_TIMEOUT,
+        on_progress: Callable[[Entity], None] | None = None,
+    ):
+        """
+        :param client: the client
+        :param strategy: rolling or canary
+        :param max_in_flight: number of instances replaced at the same time, 1 by default
+        :param canary_steps: the instance weights of the steps of a canary deployment, one canary instance by default
+        :param auto_continue: continues a canary deployment as soon as it is paused. Otherwise, the deployment is left paused
+        :param timeout: number of seconds a deployment is waited for
+        :param on_progress: called with the deployment each time it enters a new phase, from the thread waiting for it
+        """
+        self.client = client
+        self.strategy = strategy
+        self.max_in_flight = max_in_flight
+        self.canary_steps = canary_steps
+        self.auto_continue = auto_continue
+        self.timeout = timeout
+        self.on_progress = on_progress
+        self._timings: dict[str, list[tuple[str, float]]] = dict()
+        self._lock = threading.Lock()
+
+    def deploy(self, app_guid: str, droplet_guid: str | None = None) -> Entity:
+        """
+        :param app_guid: the application deployed
+        :param droplet_guid: the droplet deployed, the current droplet of the application by default
+        :return: the deployment once deployed, or paused when auto_continue is not set
+        """
+        started = time.monotonic()
+        deployment = self.client.v3.deployments.create(
+            app_guid,
+            droplet_guid=droplet_guid,
+            strategy=self.strategy,
+            max_in_flight=self.max_in_flight,
+            canary_steps=self.canary_steps,
+        )
+        _logger.debug("Deploying application %s with deployment %s", app_guid, deployment["guid"])
+        phases = _PhaseTimer(started)
+        self._progress(app_guid, phases, deployment)
+        continued_steps = set()
+
+        def is_over(polled: Entity) -> bool:
+            if DeploymentOperation._reason(polled) == "PAUSED":
+                if not self.auto_continue:
+                    return True
+                step = DeploymentOperation._canary_step(polled)
+                if step not in continued_steps:
+                    continued_steps.add(step)
+                    self.client.v3.deployments.continue_deployment(polled["guid"])
+            return DeploymentOperation._is_finalized(polled)
+
+        try:
+            deployment = Waiter(timeout=self.timeout).wait(
+                lambda: self.client.v3.deployments.get(deployment["guid"]),
+                is_over,
+                DeploymentOperation._phase,
+                lambda polled: self._progress(app_guid, phases, polled),
+            )
+        except WaitTimeout:
+            raise AssertionError("Exceeded timeout while waiting for deployment %s" % deployment["guid"])
+        finally:
+            self._end(app_guid, phases)
+        reason = DeploymentOperation._reason(deployment)
+        if reason not in ["DEPLOYED", "PAUSED"]:
+            raise AssertionError("Deployment %s of application %s ended with %s" % (deployment["guid"], app_guid, reason))
+        return deployment
+
+    def deploy_package(self, app_guid: str, package_guid: str) -> Entity:
+        """
+        Stages a package in a new droplet, then deploys it.
+        """
+        started = time.monotonic()
+        build = self.client.v3.builds.create(package_guid)
+        try:
+            build = Waiter(timeout=DeploymentOperation.STAGING_TIMEOUT).wait(
+                lambda: self.client.v3.builds.get(build["guid"]), lambda polled: polled["state"] in ["STAGED", "FAILED"]
+            )
+        except WaitTimeout:
+            raise AssertionError("Exceeded timeout while waiting for build %s" % build["guid"])
+        finally:
+            self._record(app_guid, [("STAGING", time.monotonic() - started)])
+        if build["state"] != "STAGED":
+            raise AssertionError("Staging of application %s failed: %s" % (app_guid, build.get("error")))
+        return self.deploy(app_guid, build["droplet"]["guid"])
+
+    def timings(self) -> dict[str, list[tuple[str, float]]]:
+        """
+        :return: the phases of the deployments by application guid, with the seconds spent in each of them
+        """
+        with self._lock:
+            return {app_guid: list(phases) for app_guid, phases in self._timings.items()}
+
+    def _progress(self, app_guid: str, phases: "_PhaseTimer", deployment: Entity):
+        phase = DeploymentOperation._phase(deployment)
+        if phases.enter(phase):
+            _logger.info("Deployment %s of application %s: %s", deployment["guid"], app_guid, phase)
+            if self.on_progress is not None:
+                self.on_progress(deployment)
+
+    def _end(self, app_guid: str, phases: "_PhaseTimer"):
+        self._record(app_guid, phases.end())
+
+    def _record(self, app_guid: str, phases: list[tuple[str, float]]):
+        with self._lock:
+            self._timings.setdefault(app_guid, []).extend(phases)
+
+    @staticmethod
+    def _phase(deployment: Entity) -> str:
+        step = DeploymentOperation._canary_step(deployment)
+        reason = DeploymentOperation._reason(deployment)
+        return "%s %d/%d" % (reason, step[0], step[1]) if step is not None else reason
+
+    @staticmethod
+    def _reason(deployment: Entity) -> str:
+        # the state was replaced by the status in later versions of the api
+        status = deployment.get("status") or {}
+        return status.get("reason") or deployment.get("state") or "UNKNOWN"
+
+    @staticmethod
+    def _is_finalized(deployment: Entity) -> bool:
+        status = deployment.get("status") or {}
+        if "value" in status:
+            return status["value"] == "FINALIZED"
+        return deployment.get("state") in ["DEPLOYED", "CANCELED"]
+
+    @staticmethod
+    def _canary_step(deployment: Entity) -> tuple[int, int] | None:
+        steps = ((deployment.get("status") or {}).get("canary") or {}).get("steps")
+        return (steps["current"], steps["total"]) if steps is not None else None
+
+
+class _PhaseTimer(object):
+    def __init__(self, started: float):
+        self._phases: list[tuple[str, float]] = []
+        self._phase: str | None = None
+        self._phase_started = started
+
+    def enter(self, phase: str) -> bool:
+        if phase == self._phase:
+            return False
+        self.end()
+        self._phase = phase
+        return True
+
+    def end(self) -> list[tuple[str, float]]:
+        if self._phase is not None:
+            now = time.monotonic()
+            self._phases.append((self._phase, now - self._phase_started))
+            self._phase = None
+            self._phase_started = now
+        return self._phases
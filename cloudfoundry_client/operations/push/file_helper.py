@@ -1,24 +1,261 @@
+import copy
 import hashlib
 import os
 import stat
+import struct
 import zipfile
-from collections.abc import Callable, Generator
+import zlib
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 
+from cloudfoundry_client.operations.push.cf_ignore import CfIgnore
+
+# the types of files already compressed, that deflate would not make smaller
+STORED_EXTENSIONS = frozenset(
+    [
+        ".7z", ".bz2", ".ear", ".gif", ".gz", ".jar", ".jpeg", ".jpg", ".png",
+        ".tgz", ".war", ".webp", ".woff", ".woff2", ".xz", ".zip",
+    ]
+)  # fmt: skip
+
+
+class _ChunkBuffer(object):
+    """
+    The unseekable output of a streamed archive: what is written is kept until it is drained.
+    """
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> Iterator[bytes]:
+        chunks, self._chunks = self._chunks, []
+        return iter(chunks)
+
+
+def _write_raw_entry(
+    archive_out: zipfile.ZipFile, output: _ChunkBuffer, entry: zipfile.ZipInfo, compressed_data: Iterable[bytes]
+) -> Iterator[bytes]:
+    """
+    Appends an entry whose data is already compressed: its crc and sizes must be set.
+    """
+    # the sizes are known: they are written in the local header rather than in a data descriptor,
+    # along with a zip64 extra field if needed
+    entry.flag_bits &= ~0x08
+    entry.extra = b""
+    zip64 = entry.file_size > zipfile.ZIP64_LIMIT or entry.compress_size > zipfile.ZIP64_LIMIT
+    # what ZipFile.mkdir does, followed by the compressed data
+    entry.header_offset = archive_out.fp.tell()
+    archive_out._writecheck(entry)
+    archive_out._didModify = True
+    archive_out.fp.write(entry.FileHeader(zip64))
+    for data in compressed_data:
+        archive_out.fp.write(data)
+        yield from output.drain()
+    archive_out.filelist.append(entry)
+    archive_out.NameToInfo[entry.filename] = entry
+    archive_out.start_dir = archive_out.fp.tell()
+    yield from output.drain()
+
+
+class ZipStream(object):
+    """
+    A zip archive of a directory built while it is read, a chunk at a time: neither the archive nor the files
+    are held in memory and nothing is written on disk. Each iteration builds the archive again.
+    With several workers, the files are compressed concurrently (zlib releases the GIL) and appended in order:
+    the files smaller than BUFFERED_MAX_SIZE are then compressed in memory, a few at a time.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+    BUFFERED_MAX_SIZE = 4 * 1024 * 1024
+
+    def __init__(
+        self,
+        directory_path: str,
+        accept: Callable[[str], bool] | None = None,
+        workers: int = 1,
+        cf_ignore: CfIgnore | None = None,
+    ):
+        """
+        :param directory_path: the directory archived
+        :param accept: tells whether a file, given by its path relative to the directory, is archived
+        :param workers: number of files compressed concurrently
+        :param cf_ignore: the ignored directories are not walked, nor archived
+        """
+        self.directory_path = directory_path
+        self.accept = accept
+        self.workers = workers
+        self.cf_ignore = cf_ignore
+
+    def __iter__(self) -> Iterator[bytes]:
+        output = _ChunkBuffer()
+        # ZipFile writes data descriptors after the entries as the output cannot be sought
+        with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive_out:
+            if self.workers <= 1:
+                for file_location, arc_name in self._entries():
+                    yield from ZipStream._write_entry(archive_out, output, file_location, arc_name)
+            else:
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    # the entries in the order of the archive, compressed or being compressed for some of them
+                    pending: deque[tuple[str, str, Future | None]] = deque()
+                    for file_location, arc_name in self._entries():
+                        compressed = None
+                        if os.path.isfile(file_location) and os.path.getsize(file_location) <= ZipStream.BUFFERED_MAX_SIZE:
+                            compressed = executor.submit(ZipStream._compress, file_location)
+                        pending.append((file_location, arc_name, compressed))
+                        # bounds the memory held by the compressed files waiting to be appended
+                        while len(pending) > 2 * self.workers:
+                            yield from ZipStream._append(archive_out, output, *pending.popleft())
+                    while len(pending) > 0:
+                        yield from ZipStream._append(archive_out, output, *pending.popleft())
+        # the central directory
+        yield from output.drain()
+
+    def _entries(self) -> Iterator[tuple[str, str]]:
+        for dir_path, file_names in FileHelper.walk(self.directory_path, self.cf_ignore):
+            dir_full_location = os.path.join(self.directory_path, dir_path)
+            if len(dir_path) > 0:
+                yield dir_full_location, dir_path
+            for file_name in file_names:
+                file_relative_location = os.path.join(dir_path, file_name)
+                if self.accept is None or self.accept(file_relative_location):
+                    yield os.path.join(dir_full_location, file_name), file_relative_location
 
-class FileHelper(object):
     @staticmethod
-    def zip(file_location: str, directory_path: str, accept: Callable[[str], bool] | None = None):
-        with zipfile.ZipFile(file_location, "w", zipfile.ZIP_DEFLATED) as archive_out:
-            for dir_path, file_names in FileHelper.walk(directory_path):
-                dir_full_location = os.path.join(directory_path, dir_path)
-                if len(dir_path) > 0:
-                    archive_out.write(dir_full_location, dir_path, zipfile.ZIP_STORED)
-                for file_name in file_names:
-                    file_relative_location = os.path.join(dir_path, file_name)
-                    if accept is None or accept(file_relative_location):
-                        archive_out.write(
-                            os.path.join(dir_full_location, file_name), file_relative_location, zipfile.ZIP_DEFLATED
+    def _append(
+        archive_out: zipfile.ZipFile, output: _ChunkBuffer, file_location: str, arc_name: str, compressed: Future | None
+    ) -> Iterator[bytes]:
+        if compressed is None:
+            yield from ZipStream._write_entry(archive_out, output, file_location, arc_name)
+        else:
+            crc, file_size, chunks = compressed.result()
+            entry = zipfile.ZipInfo.from_file(file_location, arc_name)
+            entry.compress_type = FileHelper.compress_type(arc_name)
+            entry.CRC = crc
+            entry.file_size = file_size
+            entry.compress_size = sum(len(chunk) for chunk in chunks)
+            yield from _write_raw_entry(archive_out, output, entry, chunks)
+
+    @staticmethod
+    def _write_entry(archive_out: zipfile.ZipFile, output: _ChunkBuffer, file_location: str, arc_name: str) -> Iterator[bytes]:
+        if os.path.isdir(file_location):
+            archive_out.write(file_location, arc_name, zipfile.ZIP_STORED)
+            yield from output.drain()
+            return
+        entry = zipfile.ZipInfo.from_file(file_location, arc_name)
+        entry.compress_type = FileHelper.compress_type(arc_name)
+        with open(file_location, "rb") as source, archive_out.open(entry, "w") as destination:
+            while True:
+                data = source.read(ZipStream.CHUNK_SIZE)
+                if not data:
+                    break
+                destination.write(data)
+                yield from output.drain()
+        yield from output.drain()
+
+    @staticmethod
+    def _compress(file_location: str) -> tuple[int, int, list[bytes]]:
+        # raw deflate, as in zip entries
+        compressor = (
+            zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+            if FileHelper.compress_type(file_location) == zipfile.ZIP_DEFLATED
+            else None
+        )
+        crc = 0
+        file_size = 0
+        chunks = []
+        with open(file_location, "rb") as source:
+            while True:
+                data = source.read(ZipStream.CHUNK_SIZE)
+                if not data:
+                    break
+                crc = zlib.crc32(data, crc)
+                file_size += len(data)
+                chunks.append(compressor.compress(data) if compressor is not None else data)
+        if compressor is not None:
+            chunks.append(compressor.flush())
+        return crc, file_size, [chunk for chunk in chunks if len(chunk) > 0]
+
+
+class ZipCopyStream(object):
+    """
+    A zip archive of some entries of another zip file, built while it is read like ZipStream: the compressed data
+    of the entries is copied as is, it is neither extracted nor compressed again.
+    """
+
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, zip_location: str, accept: Callable[[str], bool] | None = None):
+        """
+        :param zip_location: the zip file copied
+        :param accept: tells whether a file entry is copied. Directory entries are always copied
+        """
+        self.zip_location = zip_location
+        self.accept = accept
+
+    def __iter__(self) -> Iterator[bytes]:
+        output = _ChunkBuffer()
+        with open(self.zip_location, "rb") as source, zipfile.ZipFile(source, "r") as archive_in:
+            with zipfile.ZipFile(output, "w") as archive_out:
+                for entry in archive_in.infolist():
+                    if entry.is_dir() or self.accept is None or self.accept(entry.filename):
+                        yield from _write_raw_entry(
+                            archive_out, output, copy.copy(entry), ZipCopyStream._read_compressed_data(source, entry)
                         )
+        # the central directory
+        yield from output.drain()
+
+    @staticmethod
+    def _read_compressed_data(source, entry: zipfile.ZipInfo) -> Iterator[bytes]:
+        source.seek(entry.header_offset)
+        local_header = struct.unpack(zipfile.structFileHeader, source.read(zipfile.sizeFileHeader))
+        if local_header[0] != zipfile.stringFileHeader:
+            raise zipfile.BadZipFile("Bad magic number for file header of %s" % entry.filename)
+        # skips the file name and the extra field
+        source.seek(local_header[10] + local_header[11], os.SEEK_CUR)
+        remaining = entry.compress_size
+        while remaining > 0:
+            data = source.read(min(ZipCopyStream.CHUNK_SIZE, remaining))
+            if not data:
+                raise zipfile.BadZipFile("Truncated data of %s" % entry.filename)
+            remaining -= len(data)
+            yield data
+
+
+class FileHelper(object):
+    @staticmethod
+    def zip(file_location: str, directory_path: str, accept: Callable[[str], bool] | None = None, workers: int = 1):
+        FileHelper.write_chunks(file_location, ZipStream(directory_path, accept, workers))
+
+    @staticmethod
+    def write_chunks(file_location: str, chunks: Iterable[bytes]):
+        with open(file_location, "wb") as file_out:
+            for chunk in chunks:
+                file_out.write(chunk)
+
+    @staticmethod
+    def zip_stream(
+        directory_path: str,
+        accept: Callable[[str], bool] | None = None,
+        workers: int = 1,
+        cf_ignore: CfIgnore | None = None,
+    ) -> ZipStream:
+        return ZipStream(directory_path, accept, workers, cf_ignore)
+
+    @staticmethod
+    def zip_copy_stream(zip_location: str, accept: Callable[[str], bool] | None = None) -> ZipCopyStream:
+        return ZipCopyStream(zip_location, accept)
+
+    @staticmethod
+    def compress_type(file_location: str) -> int:
+        return zipfile.ZIP_STORED if os.path.splitext(file_location)[1].lower() in STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
 
     @staticmethod
     def unzip(path: str, tmp_dir: str):
@@ -32,19 +269,79 @@ class FileHelper(object):
                     zip_ref.extract(entry, tmp_dir)
 
     @staticmethod
-    def walk(path: str) -> Generator[tuple[str, list[str]], None, None]:
-        for dir_path, _, files in os.walk(path, topdown=True):
-            yield dir_path[len(path) :].lstrip("/"), files
+    def walk(path: str, cf_ignore: CfIgnore | None = None) -> Generator[tuple[str, list[str]], None, None]:
+        """
+        :param cf_ignore: the ignored directories are not walked, the ignored files are not listed
+        """
+        for dir_path, directory_names, files in os.walk(path, topdown=True):
+            relative_dir_path = dir_path[len(path) :].lstrip("/")
+            if cf_ignore is not None:
+                directory_names[:] = [
+                    directory_name
+                    for directory_name in directory_names
+                    if not cf_ignore.is_directory_ignored(os.path.join(relative_dir_path, directory_name))
+                ]
+                files = [file for file in files if not cf_ignore.is_file_ignored(os.path.join(relative_dir_path, file))]
+            yield relative_dir_path, files
+
+    @staticmethod
+    def scan(
+        path: str, relative_path: str = "", cf_ignore: CfIgnore | None = None
+    ) -> Generator[tuple[str, os.DirEntry], None, None]:
+        """
+        Lists the files like walk does (symbolic links to directories are not followed), along with their entry
+        whose stat results are cached: a single stat call per file is needed to get its size and mode.
+        """
+        sub_directories = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                relative_entry_path = os.path.join(relative_path, entry.name)
+                if entry.is_dir():
+                    if not entry.is_symlink() and (cf_ignore is None or not cf_ignore.is_directory_ignored(relative_entry_path)):
+                        sub_directories.append((entry, relative_entry_path))
+                elif cf_ignore is None or not cf_ignore.is_file_ignored(relative_entry_path):
+                    yield relative_entry_path, entry
+        for sub_directory, relative_sub_directory_path in sub_directories:
+            yield from FileHelper.scan(sub_directory.path, relative_sub_directory_path, cf_ignore)
+
+    @staticmethod
+    def sha1_all(file_locations: Iterable[str], workers: int) -> list[str]:
+        """
+        Hashes the files on a pool of workers threads: hashlib releases the GIL while hashing.
+        """
+        if workers <= 1:
+            return [FileHelper.sha1(file_location) for file_location in file_locations]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(FileHelper.sha1, file_locations))
+
+    @staticmethod
+    def sha1_all_entries(archive: zipfile.ZipFile, entry_names: Iterable[str], workers: int) -> list[str]:
+        """
+        Hashes the entries of a zip file while they are decompressed, on a pool of workers threads like sha1_all.
+        """
+        if workers <= 1:
+            return [FileHelper.sha1_entry(archive, entry_name) for entry_name in entry_names]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda entry_name: FileHelper.sha1_entry(archive, entry_name), entry_names))
 
     @staticmethod
     def sha1(file_location: str) -> str:
-        sha1 = hashlib.sha1()
         with open(file_location, "rb") as f:
-            while True:
-                data = f.read(64 * 1024)
-                if not data:
-                    break
-                sha1.update(data)
+            return FileHelper._sha1_content(f)
+
+    @staticmethod
+    def sha1_entry(archive: zipfile.ZipFile, entry_name: str) -> str:
+        with archive.open(entry_name, "r") as f:
+            return FileHelper._sha1_content(f)
+
+    @staticmethod
+    def _sha1_content(f) -> str:
+        sha1 = hashlib.sha1()
+        while True:
+            data = f.read(64 * 1024)
+            if not data:
+                break
+            sha1.update(data)
         return sha1.hexdigest()
 
     @staticmethod
@@ -53,5 +350,15 @@ class FileHelper(object):
 
     @staticmethod
     def mode(file_location: str) -> str:
-        mode = str(oct(stat.S_IMODE(os.lstat(file_location).st_mode)))
+        return FileHelper.format_mode(os.lstat(file_location).st_mode)
+
+    @staticmethod
+    def entry_mode(entry: zipfile.ZipInfo) -> str:
+        # the unix mode is absent of the zip files built elsewhere than on unix
+        st_mode = entry.external_attr >> 16
+        return FileHelper.format_mode(st_mode) if st_mode != 0 else "644"
+
+    @staticmethod
+    def format_mode(st_mode: int) -> str:
+        mode = str(oct(stat.S_IMODE(st_mode)))
         return mode[len(mode) - 3 :]
@@ -0,0 +1,72 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+_logger = logging.getLogger(__name__)
+
+
+class FingerprintCache(object):
+    """
+    Remembers the sha1 of the files of an application directory between pushes.
+    A sha1 is reused only when the size, modification time, change time and inode of the file are unchanged.
+    Files modified within the last seconds are not remembered, as a later modification within the
+    resolution of the file system clock would not change their modification time.
+    """
+
+    VERSION = 1
+    RACY_DELAY = 2.0
+
+    def __init__(self, cache_file: str):
+        self.cache_file = cache_file
+        self._fingerprints: dict[str, list] = dict()
+        self._seen: dict[str, list] = dict()
+        self._load()
+
+    @staticmethod
+    def for_directory(top_directory: str) -> "FingerprintCache":
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        directory_key = hashlib.sha1(os.path.realpath(top_directory).encode("utf-8")).hexdigest()
+        return FingerprintCache(os.path.join(cache_home, "cf-python-client", "fingerprints", "%s.json" % directory_key))
+
+    def get(self, relative_path: str, stat_result: os.stat_result) -> str | None:
+        fingerprint = self._fingerprints.get(relative_path)
+        if fingerprint is not None and fingerprint[:-1] == FingerprintCache._key(stat_result):
+            self._seen[relative_path] = fingerprint
+            return fingerprint[-1]
+        return None
+
+    def put(self, relative_path: str, stat_result: os.stat_result, sha1: str):
+        if stat_result.st_mtime_ns / 1e9 < time.time() - FingerprintCache.RACY_DELAY:
+            self._seen[relative_path] = FingerprintCache._key(stat_result) + [sha1]
+
+    def save(self):
+        """
+        Writes the fingerprints got or put since the cache was loaded: those of deleted files are dropped.
+        """
+        try:
+            directory = os.path.dirname(self.cache_file)
+            os.makedirs(directory, exist_ok=True)
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=directory)
+            with os.fdopen(file_descriptor, "w") as f:
+                json.dump(dict(version=FingerprintCache.VERSION, fingerprints=self._seen), f)
+            os.replace(temporary_path, self.cache_file)
+        except OSError as ex:
+            _logger.warning("Could not save fingerprints in %s: %s", self.cache_file, ex)
+
+    def _load(self):
+        try:
+            with open(self.cache_file, "r") as f:
+                content = json.load(f)
+            if content.get("version") == FingerprintCache.VERSION:
+                self._fingerprints = content["fingerprints"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, AttributeError) as ex:
+            _logger.warning("Ignoring fingerprints of %s: %s", self.cache_file, ex)
+
+    @staticmethod
+    def _key(stat_result: os.stat_result) -> list:
+        return [stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ctime_ns, stat_result.st_ino]
@@ -2,45 +2,174 @@ import json
 import logging
 import os
 import re
-import shutil
 import tempfile
+import threading
 import time
+import zipfile
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
 
 from cloudfoundry_client.client import CloudFoundryClient
+from cloudfoundry_client.errors import InvalidStatusCode
 from cloudfoundry_client.operations.push.cf_ignore import CfIgnore
+from cloudfoundry_client.operations.push.deployment import DeploymentOperation
 from cloudfoundry_client.operations.push.file_helper import FileHelper
+from cloudfoundry_client.operations.push.fingerprint_cache import FingerprintCache
+from cloudfoundry_client.operations.push.resource_matcher import ResourceMatcher
 from cloudfoundry_client.operations.push.validation.manifest import ManifestReader
 from cloudfoundry_client.v2.entities import Entity
+from cloudfoundry_client.waiter import Waiter, WaitTimeout
 
 _logger = logging.getLogger(__name__)
 
 
+class PushError(AssertionError):
+    """
+    Raised when some applications of a manifest pushed concurrently could not be pushed.
+    """
+
+    def __init__(self, errors: dict[str, Exception]):
+        """
+        :param errors: the error of each application that could not be pushed, by name
+        """
+        super(PushError, self).__init__(
+            "Could not push %s" % ", ".join("%s (%s)" % (name, error) for name, error in errors.items())
+        )
+        self.errors = errors
+
+
+class PushLookups(object):
+    """
+    The entities shared by the applications of a push, looked up once when first needed.
+    """
+
+    def __init__(self, client: CloudFoundryClient, organization: Entity, space: Entity):
+        self.client = client
+        self.organization = organization
+        self.space = space
+        self._entities: dict[str, list[Entity]] = dict()
+        self._lock = threading.Lock()
+
+    def shared_domains(self) -> list[Entity]:
+        return self._get("shared_domains", lambda: [domain for domain in self.client.v2.shared_domains.list()])
+
+    def private_domains(self) -> list[Entity]:
+        return self._get("private_domains", lambda: [domain for domain in self.organization.private_domains()])
+
+    def service_instances(self) -> list[Entity]:
+        return self._get(
+            "service_instances",
+            lambda: [
+                service_instance
+                for service_instance in self.space.service_instances(return_user_provided_service_instances="true")
+            ],
+        )
+
+    def _get(self, name: str, load: Callable[[], list[Entity]]) -> list[Entity]:
+        # the other applications wait for the entities rather than looking them up too
+        with self._lock:
+            if name not in self._entities:
+                self._entities[name] = load()
+            return self._entities[name]
+
+
 class PushOperation(object):
     UPLOAD_TIMEOUT = 15 * 60
 
     SPLIT_ROUTE_PATTERN = re.compile(r"(?P<protocol>[a-z]+://)?(?P<domain>[^:/]+)(?P<port>:\d+)?(?P<path>/.*)?")
 
-    def __init__(self, client: CloudFoundryClient):
+    def __init__(
+        self,
+        client: CloudFoundryClient,
+        hash_workers: int = min(32, (os.cpu_count() or 1) + 4),
+        use_fingerprint_cache: bool = True,
+        compress_workers: int = os.cpu_count() or 1,
+        resource_matcher: ResourceMatcher | None = None,
+        deployment_operation: DeploymentOperation | None = None,
+        stream_uploads: bool = False,
+    ):
+        """
+        :param client: the client
+        :param hash_workers: number of threads hashing the files of the applications. 1 hashes them sequentially
+        :param use_fingerprint_cache: remembers the sha1 of the files of an application directory in the user cache
+            directory, so that the unchanged files are not hashed again by the next push
+        :param compress_workers: number of threads compressing the files uploaded. 1 compresses them sequentially
+        :param resource_matcher: finds the files already known by the cloud controller. Defaults to a ResourceMatcher
+            with the default bounds of the resource pool of the cloud controller
+        :param deployment_operation: replaces the instances of the applications already started with a rolling or canary
+            deployment of their new bits, instead of stopping then starting them
+        :param stream_uploads: compresses the files while they are uploaded, in a chunked request, instead of writing
+            the zip to a temporary file first and uploading it with its length
+        """
         self.client = client
-
-    def push(self, space_id: str, manifest_path: str, restart: bool = True):
+        self.hash_workers = hash_workers
+        self.use_fingerprint_cache = use_fingerprint_cache
+        self.compress_workers = compress_workers
+        self.resource_matcher = resource_matcher if resource_matcher is not None else ResourceMatcher(client)
+        self.deployment_operation = deployment_operation
+        self.stream_uploads = stream_uploads
+
+    def push(self, space_id: str, manifest_path: str, restart: bool = True, max_workers: int = 1) -> dict[str, Entity]:
+        """
+        :param space_id: the guid of the space the applications are pushed in
+        :param manifest_path: the manifest of the applications
+        :param restart: restarts the applications once pushed
+        :param max_workers: number of applications pushed concurrently. With 1, they are pushed one after the other and
+            the first error stops the push. Otherwise, all the applications are pushed and a PushError is raised
+            with the error of each application that could not be pushed
+        :return: the applications pushed, by name
+        """
         app_manifests = ManifestReader.load_application_manifests(manifest_path)
         organization, space = self._retrieve_space_and_organization(space_id)
+        lookups = PushLookups(self.client, organization, space)
+        # resolves all the names at once rather than one request by application
+        self.client.name_resolver.resolve_many(
+            self.client.v2.apps, [app_manifest["name"] for app_manifest in app_manifests], space_guid=space["metadata"]["guid"]
+        )
+        self.client.name_resolver.resolve_many(
+            self.client.v2.stacks, {app_manifest["stack"] for app_manifest in app_manifests if "stack" in app_manifest}
+        )
 
-        for app_manifest in app_manifests:
-            if "path" in app_manifest or "docker" in app_manifest:
-                self._push_application(organization, space, app_manifest, restart)
+        app_manifests = [app_manifest for app_manifest in app_manifests if "path" in app_manifest or "docker" in app_manifest]
+        if max_workers <= 1 or len(app_manifests) <= 1:
+            return {
+                app_manifest["name"]: self._push_application(lookups, app_manifest, restart) for app_manifest in app_manifests
+            }
+        progress_lock = threading.Lock()
+        ended: list[str] = []
+
+        def push_application(app_manifest: dict) -> Entity | Exception:
+            started = time.time()
+            try:
+                result = self._push_application(lookups, app_manifest, restart)
+                _logger.info("Pushed %s in %.1fs", app_manifest["name"], time.time() - started)
+            except Exception as ex:
+                _logger.error("Could not push %s: %s", app_manifest["name"], ex)
+                result = ex
+            with progress_lock:
+                ended.append(app_manifest["name"])
+                _logger.info("%d / %d applications ended", len(ended), len(app_manifests))
+            return result
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(app_manifests))) as executor:
+            results = dict(
+                zip([app_manifest["name"] for app_manifest in app_manifests], executor.map(push_application, app_manifests))
+            )
+        errors = {name: result for name, result in results.items() if isinstance(result, Exception)}
+        if len(errors) > 0:
+            raise PushError(errors)
+        return results
 
     def _retrieve_space_and_organization(self, space_id: str) -> tuple[Entity, Entity]:
         space = self.client.v2.spaces.get(space_id)
         organization = space.organization()
         return organization, space
 
-    def _push_application(self, organization: Entity, space: Entity, app_manifest: dict, restart: bool):
-        app = self._init_application(space, app_manifest)
+    def _push_application(self, lookups: PushLookups, app_manifest: dict, restart: bool) -> Entity:
+        app = self._init_application(lookups.space, app_manifest)
         self._route_application(
-            organization,
-            space,
+            lookups,
             app,
             app_manifest.get("no-route", False),
             app_manifest.get("routes", []),
@@ -48,13 +177,38 @@ class PushOperation(object):
         )
         if "path" in app_manifest:
             self._upload_application(app, app_manifest["path"])
-        self._bind_services(space, app, app_manifest.get("services", []))
+        self._bind_services(lookups, app, app_manifest.get("services", []))
         if restart:
-            PushOperation._restart_application(app)
+            if self.deployment_operation is not None and app["entity"]["state"] == "STARTED":
+                self._deploy_application(app)
+            else:
+                PushOperation._restart_application(app)
+        return app
 
     def _init_application(self, space: Entity, app_manifest: dict) -> Entity:
-        app = self.client.v2.apps.get_first(name=app_manifest["name"], space_guid=space["metadata"]["guid"])
-        return self._update_application(app, app_manifest) if app is not None else self._create_application(space, app_manifest)
+        app = self._find_application(space["metadata"]["guid"], app_manifest["name"])
+        if app is not None:
+            return self._update_application(app, app_manifest)
+        app = self._create_application(space, app_manifest)
+        self.client.name_resolver.remember(
+            self.client.v2.apps, app_manifest["name"], app["metadata"]["guid"], space_guid=space["metadata"]["guid"]
+        )
+        return app
+
+    def _find_application(self, space_guid: str, name: str) -> Entity | None:
+        app_guid = self.client.name_resolver.resolve(self.client.v2.apps, name, space_guid=space_guid)
+        if app_guid is None:
+            return None
+        try:
+            return self.client.v2.apps.get(app_guid)
+        except InvalidStatusCode as ex:
+            if ex.status_code != HTTPStatus.NOT_FOUND:
+                raise
+        # the guid remembered is the one of an application deleted since by another client
+        _logger.debug("Application %s was deleted, looking it up again", name)
+        self.client.name_resolver.forget(self.client.v2.apps, name, space_guid=space_guid)
+        app_guid = self.client.name_resolver.resolve(self.client.v2.apps, name, space_guid=space_guid)
+        return self.client.v2.apps.get(app_guid) if app_guid is not None else None
 
     def _create_application(self, space: Entity, app_manifest: dict) -> Entity:
         _logger.debug("Creating application %s", app_manifest["name"])
@@ -80,9 +234,11 @@ class PushOperation(object):
     def _build_request_from_manifest(self, app_manifest: dict) -> dict:
         request = dict()
         request.update(app_manifest)
-        stack = self.client.v2.stacks.get_first(name=app_manifest["stack"]) if "stack" in app_manifest else None
-        if stack is not None:
-            request["stack_guid"] = stack["metadata"]["guid"]
+        stack_guid = (
+            self.client.name_resolver.resolve(self.client.v2.stacks, app_manifest["stack"]) if "stack" in app_manifest else None
+        )
+        if stack_guid is not None:
+            request["stack_guid"] = stack_guid
         docker = request.pop("docker", None)
         if docker is not None and "image" in docker:
             request["docker_image"] = docker["image"]
@@ -103,24 +259,23 @@ class PushOperation(object):
             environment.update(app_manifest["env"])
         return environment
 
-    def _route_application(
-        self, organization: Entity, space: Entity, app: Entity, no_route: bool, routes: list[str], random_route: bool
-    ):
+    def _route_application(self, lookups: PushLookups, app: Entity, no_route: bool, routes: list[str], random_route: bool):
         existing_routes = [route for route in app.routes()]
         if no_route:
             self._remove_all_routes(app, existing_routes)
         elif len(routes) == 0 and len(existing_routes) == 0:
-            self._build_default_route(space, app, random_route)
+            self._build_default_route(lookups, app, random_route)
         else:
-            self._build_new_requested_routes(organization, space, app, existing_routes, routes)
+            self._build_new_requested_routes(lookups, app, existing_routes, routes)
 
     def _remove_all_routes(self, app: Entity, routes: list[Entity]):
         for route in routes:
             self.client.v2.apps.remove_route(app["metadata"]["guid"], route["metadata"]["guid"])
 
-    def _build_default_route(self, space: Entity, app: Entity, random_route: bool):
+    def _build_default_route(self, lookups: PushLookups, app: Entity, random_route: bool):
+        space = lookups.space
         shared_domain = None
-        for domain in self.client.v2.shared_domains.list():
+        for domain in lookups.shared_domains():
             if not domain["entity"].get("internal", False):
                 shared_domain = domain
                 break
@@ -141,10 +296,11 @@ class PushOperation(object):
         self.client.v2.apps.associate_route(app["metadata"]["guid"], route["metadata"]["guid"])
 
     def _build_new_requested_routes(
-        self, organization: Entity, space: Entity, app: Entity, existing_routes: list[Entity], requested_routes: list[str]
+        self, lookups: PushLookups, app: Entity, existing_routes: list[Entity], requested_routes: list[str]
     ):
-        private_domains = {domain["entity"]["name"]: domain for domain in organization.private_domains()}
-        shared_domains = {domain["entity"]["name"]: domain for domain in self.client.v2.shared_domains.list()}
+        space = lookups.space
+        private_domains = {domain["entity"]["name"]: domain for domain in lookups.private_domains()}
+        shared_domains = {domain["entity"]["name"]: domain for domain in lookups.shared_domains()}
         for requested_route in requested_routes:
             route, port, path = PushOperation._split_route(requested_route)
             if len(path) > 0 and port is not None:
@@ -245,76 +401,124 @@ class PushOperation(object):
             raise AssertionError("Path %s is neither a directory nor a file" % application_path)
 
     def _upload_application_zip(self, app: Entity, path: str):
-        _logger.debug("Unzipping file %s", path)
-        tmp_dir = tempfile.mkdtemp()
-        try:
-            FileHelper.unzip(path, tmp_dir)
-            self._upload_application_directory(app, tmp_dir)
-        finally:
-            shutil.rmtree(tmp_dir)
+        _logger.debug("Uploading application from zip file %s", path)
+        resource_descriptions_by_path = PushOperation._load_all_zip_resources(path, self.hash_workers)
+        # the entries to upload are copied from the zip file without being extracted
+        self._upload_resources(app, resource_descriptions_by_path, lambda accept: FileHelper.zip_copy_stream(path, accept))
 
     def _upload_application_directory(self, app: Entity, application_path: str):
         _logger.debug("Uploading application from directory %s", application_path)
-        _, temp_file = tempfile.mkstemp()
-        try:
-            resource_descriptions_by_path = PushOperation._load_all_resources(application_path)
-
-            def generate_key(item: dict):
-                return "%s-%d" % (item["sha1"], item["size"])
-
-            already_uploaded_entries = [
-                generate_key(item)
-                for item in self.client.v2.resources.match(
-                    [dict(sha1=item["sha1"], size=item["size"]) for item in resource_descriptions_by_path.values()]
-                )
-            ]
-            _logger.debug("Already uploaded %d / %d items", len(already_uploaded_entries), len(resource_descriptions_by_path))
+        fingerprint_cache = FingerprintCache.for_directory(application_path) if self.use_fingerprint_cache else None
+        resource_descriptions_by_path = PushOperation._load_all_resources(
+            application_path, self.hash_workers, fingerprint_cache
+        )
+        self._upload_resources(
+            app,
+            resource_descriptions_by_path,
+            lambda accept: FileHelper.zip_stream(application_path, accept, self.compress_workers, CfIgnore(application_path)),
+        )
 
-            FileHelper.zip(
-                temp_file,
-                application_path,
-                lambda item: item in resource_descriptions_by_path
-                and generate_key(resource_descriptions_by_path[item]) not in already_uploaded_entries,
+    def _upload_resources(
+        self,
+        app: Entity,
+        resource_descriptions_by_path: dict,
+        build_archive: Callable[[Callable[[str], bool]], Iterable[bytes]],
+    ):
+        already_uploaded_paths = self.resource_matcher.match(resource_descriptions_by_path)
+        application_zip = build_archive(
+            lambda item: item in resource_descriptions_by_path and item not in already_uploaded_paths
+        )
+        resources = [
+            dict(
+                fn=resource_path,
+                sha1=resource_description["sha1"],
+                size=resource_description["size"],
+                mode=resource_description["mode"],
             )
-            _logger.debug("Diff zip file built: %s", temp_file)
-            resources = [
-                dict(
-                    fn=resource_path,
-                    sha1=resource_description["sha1"],
-                    size=resource_description["size"],
-                    mode=resource_description["mode"],
-                )
-                for resource_path, resource_description in resource_descriptions_by_path.items()
-                if generate_key(resource_description) in already_uploaded_entries
-            ]
-            _logger.debug("Uploading bits of application")
-            job = self.client.v2.apps.upload(app["metadata"]["guid"], resources, temp_file, True)
-            self._poll_job(job)
+            for resource_path, resource_description in resource_descriptions_by_path.items()
+            if resource_path in already_uploaded_paths
+        ]
+        _logger.debug("Uploading bits of application")
+        if self.stream_uploads:
+            # the diff zip is built while it is uploaded
+            job = self.client.v2.apps.upload_stream(app["metadata"]["guid"], resources, application_zip, True)
+        else:
+            job = PushOperation._upload_archive_file(
+                application_zip,
+                lambda archive_file: self.client.v2.apps.upload(app["metadata"]["guid"], resources, archive_file, True),
+            )
+        self._poll_job(job)
+
+    @staticmethod
+    def _upload_archive_file(archive: Iterable[bytes], upload: Callable[[str], Entity]) -> Entity:
+        file_descriptor, archive_file = tempfile.mkstemp(suffix=".zip")
+        os.close(file_descriptor)
+        try:
+            FileHelper.write_chunks(archive_file, archive)
+            _logger.debug("Diff zip file built: %s", archive_file)
+            return upload(archive_file)
         finally:
-            _logger.debug("Skipping remove of zip file")
+            os.remove(archive_file)
 
     @staticmethod
-    def _load_all_resources(top_directory: str) -> dict:
-        application_items = {}
-        cf_ignore = CfIgnore(top_directory)
-        for directory, file_names in FileHelper.walk(top_directory):
-            for file_name in file_names:
-                relative_file_location = os.path.join(directory, file_name)
-                if not cf_ignore.is_entry_ignored(relative_file_location):
-                    absolute_file_location = os.path.join(top_directory, relative_file_location)
-                    application_items[relative_file_location] = dict(
-                        sha1=FileHelper.sha1(absolute_file_location),
-                        size=FileHelper.size(absolute_file_location),
-                        mode=FileHelper.mode(absolute_file_location),
-                    )
-        return application_items
+    def _load_all_zip_resources(zip_location: str, hash_workers: int = 1) -> dict:
+        with zipfile.ZipFile(zip_location, "r") as archive:
+            try:
+                cf_ignore = CfIgnore(ignore_lines=archive.read(".cfignore").decode("utf-8").splitlines())
+            except KeyError:
+                cf_ignore = CfIgnore()
+            entries = [
+                entry
+                for entry in archive.infolist()
+                if not entry.is_dir() and not cf_ignore.is_entry_ignored(entry.filename)
+            ]
+            _logger.debug("Hashing %d entries", len(entries))
+            sha1s = FileHelper.sha1_all_entries(archive, [entry.filename for entry in entries], hash_workers)
+        return {
+            entry.filename: dict(sha1=sha1, size=entry.file_size, mode=FileHelper.entry_mode(entry))
+            for entry, sha1 in zip(entries, sha1s)
+        }
 
-    def _bind_services(self, space: Entity, app: Entity, services: list[str]):
-        service_instances = [
-            service_instance for service_instance in space.service_instances(return_user_provided_service_instances="true")
+    @staticmethod
+    def _load_all_resources(
+        top_directory: str, hash_workers: int = 1, fingerprint_cache: FingerprintCache | None = None
+    ) -> dict:
+        # the ignored directories are not walked
+        entries = [
+            (relative_file_location, entry, entry.stat())
+            for relative_file_location, entry in FileHelper.scan(top_directory, cf_ignore=CfIgnore(top_directory))
         ]
+        sha1s = {}
+        if fingerprint_cache is not None:
+            for relative_file_location, _, stat_result in entries:
+                sha1 = fingerprint_cache.get(relative_file_location, stat_result)
+                if sha1 is not None:
+                    sha1s[relative_file_location] = sha1
+        to_hash = [description for description in entries if description[0] not in sha1s]
+        _logger.debug("Hashing %d / %d files", len(to_hash), len(entries))
+        for (relative_file_location, _, stat_result), sha1 in zip(
+            to_hash, FileHelper.sha1_all([entry.path for _, entry, _ in to_hash], hash_workers)
+        ):
+            sha1s[relative_file_location] = sha1
+            if fingerprint_cache is not None:
+                fingerprint_cache.put(relative_file_location, stat_result, sha1)
+        if fingerprint_cache is not None:
+            fingerprint_cache.save()
+        return {
+            relative_file_location: dict(
+                sha1=sha1s[relative_file_location],
+                size=stat_result.st_size,
+                mode=FileHelper.format_mode(entry.stat(follow_symlinks=False).st_mode),
+            )
+            for relative_file_location, entry, stat_result in entries
+        }
+
+    def _bind_services(self, lookups: PushLookups, app: Entity, services: list[str]):
+        if len(services) == 0:
+            return
         service_name_to_instance_guid = {
-            service_instance["entity"]["name"]: service_instance["metadata"]["guid"] for service_instance in service_instances
+            service_instance["entity"]["name"]: service_instance["metadata"]["guid"]
+            for service_instance in lookups.service_instances()
         }
         existing_service_instance_guid = [
             service_binding["entity"]["service_instance_guid"] for service_binding in app.service_bindings()
@@ -330,27 +534,34 @@ class PushOperation(object):
                 self.client.v2.service_bindings.create(app["metadata"]["guid"], service_instance_guid)
 
     def _poll_job(self, job: Entity):
-        def job_not_ended(j):
-            return j["entity"]["status"] in ["queued", "running"]
+        def job_ended(j):
+            return j["entity"]["status"] not in ["queued", "running"]
 
         job_guid = job["metadata"]["guid"]
         _logger.debug("Waiting for upload of application to be complete. Polling job %s...", job_guid)
-        started_time = time.time()
-        elapsed_time = 0
-
-        while job_not_ended(job) and elapsed_time < PushOperation.UPLOAD_TIMEOUT:
-            _logger.debug("Getting job status %s..", job_guid)
-            job = self.client.v2.jobs.get(job_guid)
-            if job_not_ended(job):
-                time.sleep(5)
-                elapsed_time = int(time.time() - started_time)
-        if job_not_ended(job):
-            raise AssertionError("Exceeded timeout while polling job of upload")
-        elif job["entity"]["status"] == "failed":
+        if not job_ended(job):
+            try:
+                job = Waiter(timeout=PushOperation.UPLOAD_TIMEOUT).wait(
+                    lambda: self.client.v2.jobs.get(job_guid),
+                    job_ended,
+                    lambda j: j["entity"]["status"],
+                    lambda j: _logger.debug("Job %s is %s", job_guid, j["entity"]["status"]),
+                )
+            except WaitTimeout:
+                raise AssertionError("Exceeded timeout while polling job of upload")
+        if job["entity"]["status"] == "failed":
             raise AssertionError("Job of upload exceeded in error: %s", json.dumps(job["entity"]["error_details"]))
         else:
             _logger.debug("Job ended with status %s", job["entity"]["status"])
 
+    def _deploy_application(self, app: Entity):
+        # the bits uploaded through the v2 api are the last package of the application
+        app_guid = app["metadata"]["guid"]
+        package = next(iter(self.client.v3.apps.list_packages(app_guid, order_by="-created_at", per_page=1)), None)
+        if package is None:
+            raise AssertionError("No package to deploy for application %s" % app["entity"]["name"])
+        self.deployment_operation.deploy_package(app_guid, package["guid"])
+
     @staticmethod
     def _restart_application(app: Entity):
         _logger.debug("Restarting application")
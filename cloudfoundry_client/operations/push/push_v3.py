@@ -0,0 +1,212 @@
+import json
+import logging
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from cloudfoundry_client.client import CloudFoundryClient
+from cloudfoundry_client.operations.push.cf_ignore import CfIgnore
+from cloudfoundry_client.operations.push.deployment import DeploymentOperation
+from cloudfoundry_client.operations.push.file_helper import FileHelper
+from cloudfoundry_client.operations.push.fingerprint_cache import FingerprintCache
+from cloudfoundry_client.operations.push.push import PushError, PushOperation
+from cloudfoundry_client.operations.push.resource_matcher import ResourceMatcher
+from cloudfoundry_client.operations.push.validation.manifest import ManifestReader
+from cloudfoundry_client.v3.entities import Entity
+from cloudfoundry_client.v3.packages import PackageType
+from cloudfoundry_client.waiter import Waiter, WaitTimeout
+
+_logger = logging.getLogger(__name__)
+
+
+class PushOperationV3(object):
+    """
+    Pushes the applications of a manifest through the v3 api. The manifest is applied to the space (routes, services,
+    scale, environment...), then the bits of each application are uploaded in a package, staged by a build, and the
+    droplet built becomes the current one of the application before it is restarted.
+    Each application is staged as soon as its package is ready: the staging overlaps with the upload of the others.
+    """
+
+    PACKAGE_TIMEOUT = 15 * 60
+    STAGING_TIMEOUT = 15 * 60
+
+    def __init__(
+        self,
+        client: CloudFoundryClient,
+        hash_workers: int = min(32, (os.cpu_count() or 1) + 4),
+        use_fingerprint_cache: bool = True,
+        compress_workers: int = os.cpu_count() or 1,
+        resource_matcher: ResourceMatcher | None = None,
+        deployment_operation: DeploymentOperation | None = None,
+        stream_uploads: bool = False,
+    ):
+        """
+        The parameters are the ones of PushOperation; the resources are matched through /v3/resource_matches by default.
+        """
+        self.client = client
+        self.hash_workers = hash_workers
+        self.use_fingerprint_cache = use_fingerprint_cache
+        self.compress_workers = compress_workers
+        self.resource_matcher = resource_matcher if resource_matcher is not None else ResourceMatcher(client, api_version=3)
+        self.deployment_operation = deployment_operation
+        self.stream_uploads = stream_uploads
+
+    def push(self, space_id: str, manifest_path: str, restart: bool = True, max_workers: int = 1) -> dict[str, Entity]:
+        """
+        :param space_id: the guid of the space the applications are pushed in
+        :param manifest_path: the manifest of the applications
+        :param restart: restarts the applications with their new droplet. Otherwise, the droplet is used by the next start
+        :param max_workers: number of applications uploaded concurrently. The stagings are not bounded
+        :return: the applications pushed, by name. A PushError tells the error of each application that could not be pushed
+        """
+        app_manifests = [
+            app_manifest
+            for app_manifest in ManifestReader.load_application_manifests(manifest_path)
+            if "path" in app_manifest or "docker" in app_manifest
+        ]
+        app_guids = self._init_applications(space_id, app_manifests)
+        self._apply_manifest(space_id, app_manifests)
+
+        results: dict[str, Entity | Exception] = dict()
+        with ThreadPoolExecutor(max_workers=max(1, len(app_manifests))) as staging_executor:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as upload_executor:
+
+                def upload(app_manifest: dict) -> Future:
+                    package = self._create_package(app_guids[app_manifest["name"]], app_manifest)
+                    return staging_executor.submit(self._stage, app_guids[app_manifest["name"]], package, restart)
+
+                uploads = {app_manifest["name"]: upload_executor.submit(upload, app_manifest) for app_manifest in app_manifests}
+                for name, uploaded in uploads.items():
+                    try:
+                        results[name] = uploaded.result().result()
+                        _logger.info("Pushed %s", name)
+                    except Exception as ex:
+                        _logger.error("Could not push %s: %s", name, ex)
+                        results[name] = ex
+        errors = {name: result for name, result in results.items() if isinstance(result, Exception)}
+        if len(errors) > 0:
+            raise PushError(errors)
+        return results
+
+    def _init_applications(self, space_id: str, app_manifests: list[dict]) -> dict[str, str]:
+        names = [app_manifest["name"] for app_manifest in app_manifests]
+        # the applications may have been deleted or recreated by another client since their guid was remembered:
+        # they are looked up again, all of them in a single request
+        for name in names:
+            self.client.name_resolver.forget(self.client.v3.apps, name, space_guids=space_id)
+        app_guids = self.client.name_resolver.resolve_many(self.client.v3.apps, names, space_guids=space_id)
+        for app_manifest in app_manifests:
+            if app_manifest["name"] not in app_guids:
+                _logger.debug("Creating application %s", app_manifest["name"])
+                app = self.client.v3.apps.create(
+                    app_manifest["name"], space_id, lifecycle=dict(type="docker", data={}) if "docker" in app_manifest else None
+                )
+                app_guids[app_manifest["name"]] = app["guid"]
+                self.client.name_resolver.remember(self.client.v3.apps, app_manifest["name"], app["guid"], space_guids=space_id)
+        return app_guids
+
+    def _apply_manifest(self, space_id: str, app_manifests: list[dict]):
+        _logger.debug("Applying manifest of %d applications", len(app_manifests))
+        job_guid = self.client.v3.spaces.apply_manifest(
+            space_id, dict(applications=[PushOperationV3._applied_manifest(app_manifest) for app_manifest in app_manifests])
+        )
+        if job_guid is not None:
+            job = self.client.v3.jobs.wait_for_job_completion(job_guid)
+            if job["state"] == "FAILED":
+                raise AssertionError("Could not apply manifest: %s" % json.dumps(job.get("errors")))
+
+    def _create_package(self, app_guid: str, app_manifest: dict) -> Entity:
+        if "docker" in app_manifest:
+            docker_manifest = app_manifest["docker"]
+            return self.client.v3.packages.create(
+                app_guid,
+                PackageType.DOCKER,
+                package_data={key: docker_manifest[key] for key in ["image", "username", "password"] if key in docker_manifest},
+            )
+        package = self.client.v3.packages.create(app_guid, PackageType.BITS)
+        self._upload_package(package, app_manifest["path"])
+        return self._wait_for_state(
+            lambda: self.client.v3.packages.get(package["guid"]), "READY", ["FAILED", "EXPIRED"], PushOperationV3.PACKAGE_TIMEOUT
+        )
+
+    def _upload_package(self, package: Entity, application_path: str):
+        _logger.debug("Uploading package %s from %s", package["guid"], application_path)
+        if os.path.isfile(application_path):
+            resource_descriptions_by_path = PushOperation._load_all_zip_resources(application_path, self.hash_workers)
+
+            def build_archive(accept: Callable[[str], bool]):
+                return FileHelper.zip_copy_stream(application_path, accept)
+
+        elif os.path.isdir(application_path):
+            fingerprint_cache = FingerprintCache.for_directory(application_path) if self.use_fingerprint_cache else None
+            resource_descriptions_by_path = PushOperation._load_all_resources(
+                application_path, self.hash_workers, fingerprint_cache
+            )
+
+            def build_archive(accept: Callable[[str], bool]):
+                return FileHelper.zip_stream(application_path, accept, self.compress_workers, CfIgnore(application_path))
+
+        else:
+            raise AssertionError("Path %s is neither a directory nor a file" % application_path)
+        already_uploaded_paths = self.resource_matcher.match(resource_descriptions_by_path)
+        resources = [
+            dict(
+                path=resource_path,
+                mode=resource_description["mode"],
+                checksum=dict(value=resource_description["sha1"]),
+                size_in_bytes=resource_description["size"],
+            )
+            for resource_path, resource_description in resource_descriptions_by_path.items()
+            if resource_path in already_uploaded_paths
+        ]
+        bits = build_archive(lambda item: item in resource_descriptions_by_path and item not in already_uploaded_paths)
+        if self.stream_uploads:
+            self.client.v3.packages.upload(package["guid"], bits, resources)
+        else:
+            PushOperation._upload_archive_file(
+                bits, lambda bits_file: self.client.v3.packages.upload_file(package["guid"], bits_file, resources)
+            )
+
+    def _stage(self, app_guid: str, package: Entity, restart: bool) -> Entity:
+        _logger.debug("Staging package %s", package["guid"])
+        build = self.client.v3.builds.create(package["guid"])
+        build = self._wait_for_state(
+            lambda: self.client.v3.builds.get(build["guid"]), "STAGED", ["FAILED"], PushOperationV3.STAGING_TIMEOUT
+        )
+        if restart and self.deployment_operation is not None and self.client.v3.apps.get(app_guid)["state"] == "STARTED":
+            # the started instances are replaced a few at a time by those of the new droplet
+            self.deployment_operation.deploy(app_guid, build["droplet"]["guid"])
+            return self.client.v3.apps.get(app_guid)
+        self.client.v3.apps.set_current_droplet(app_guid, build["droplet"]["guid"])
+        if restart:
+            return self.client.v3.apps.restart(app_guid)
+        return self.client.v3.apps.get(app_guid)
+
+    @staticmethod
+    def _wait_for_state(get: Callable[[], Entity], expected_state: str, failed_states: list[str], timeout: float) -> Entity:
+        started = time.time()
+        try:
+            entity = Waiter(timeout=timeout).wait(
+                get, lambda polled: polled["state"] == expected_state or polled["state"] in failed_states
+            )
+        except WaitTimeout:
+            raise AssertionError("Exceeded timeout while waiting for state %s" % expected_state)
+        if entity["state"] != expected_state:
+            raise AssertionError(
+                "%s %s ended in state %s: %s" % (entity.get("type", ""), entity["guid"], entity["state"], entity.get("error"))
+            )
+        _logger.debug("%s reached state %s in %.1fs", entity["guid"], expected_state, time.time() - started)
+        return entity
+
+    @staticmethod
+    def _applied_manifest(app_manifest: dict) -> dict:
+        # the path is read locally, the sizes were converted in megabytes by the reader
+        applied = {key: value for key, value in app_manifest.items() if key != "path"}
+        for field_name in ["memory", "disk_quota"]:
+            if isinstance(applied.get(field_name), int):
+                applied[field_name] = "%dM" % applied[field_name]
+        if "docker" in applied:
+            # the password of the registry is given to the package
+            applied["docker"] = {key: value for key, value in applied["docker"].items() if key != "password"}
+        return applied
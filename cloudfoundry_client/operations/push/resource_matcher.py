@@ -0,0 +1,101 @@
+import logging
+import threading
+
+from cloudfoundry_client.client import CloudFoundryClient
+
+_logger = logging.getLogger(__name__)
+
+ResourceKey = tuple[str, int]
+
+
+class ResourceMatcher(object):
+    """
+    Finds the files of an application whose content is already known by the cloud controller, which are not uploaded.
+    Only the files whose size is within the bounds of the resource pool of the cloud controller may be known:
+    the others are not looked up. Each content is looked up once, however many files hold it.
+    """
+
+    def __init__(
+        self,
+        client: CloudFoundryClient,
+        minimum_size: int = 64 * 1024,
+        maximum_size: int = 512 * 1024 * 1024,
+        chunk_size: int = 1000,
+        max_workers: int = 4,
+        api_version: int = 2,
+    ):
+        """
+        :param client: the client
+        :param minimum_size: size under which the files are not kept by the cloud controller (resource_pool.minimum_size)
+        :param maximum_size: size over which the files are not kept by the cloud controller (resource_pool.maximum_size)
+        :param chunk_size: number of resources matched by request
+        :param max_workers: number of match requests sent concurrently
+        :param api_version: 2 matches through /v2/resource_match, 3 through /v3/resource_matches
+        """
+        self.client = client
+        self.minimum_size = minimum_size
+        self.maximum_size = maximum_size
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.api_version = api_version
+        self.files = 0
+        self.looked_up = 0
+        self.matched = 0
+        self._lock = threading.Lock()
+
+    def match(self, resource_descriptions_by_path: dict[str, dict]) -> set[str]:
+        """
+        :param resource_descriptions_by_path: the sha1 and size of the files, by path
+        :return: the paths of the files already known
+        """
+        candidates = {
+            ResourceMatcher._key(description)
+            for description in resource_descriptions_by_path.values()
+            if self.minimum_size <= description["size"] <= self.maximum_size
+        }
+        known = self._look_up(candidates)
+        matched_paths = {
+            path for path, description in resource_descriptions_by_path.items() if ResourceMatcher._key(description) in known
+        }
+        _logger.debug(
+            "Already uploaded %d / %d files (%d / %d contents looked up)",
+            len(matched_paths),
+            len(resource_descriptions_by_path),
+            len(known),
+            len(candidates),
+        )
+        with self._lock:
+            self.files += len(resource_descriptions_by_path)
+            self.looked_up += len(candidates)
+            self.matched += len(matched_paths)
+        return matched_paths
+
+    def counters(self) -> dict:
+        with self._lock:
+            return dict(
+                files=self.files,
+                looked_up=self.looked_up,
+                matched=self.matched,
+                match_ratio=self.matched / self.files if self.files > 0 else 0.0,
+            )
+
+    def _look_up(self, candidates: set[ResourceKey]) -> set[ResourceKey]:
+        if self.api_version == 3:
+            return {
+                (resource["checksum"]["value"], resource["size_in_bytes"])
+                for resource in self.client.v3.resource_matches.match_many(
+                    [dict(checksum=dict(value=sha1), size_in_bytes=size) for sha1, size in candidates],
+                    self.chunk_size,
+                    self.max_workers,
+                )
+            }
+        return {
+            ResourceMatcher._key(item)
+            for item in self.client.v2.resources.match_many(
+                [dict(sha1=sha1, size=size) for sha1, size in candidates], self.chunk_size, self.max_workers
+            )
+        }
+
+    @staticmethod
+    def _key(description: dict) -> ResourceKey:
+        return description["sha1"], description["size"]
@@ -0,0 +1,153 @@
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from requests import Response
+
+T = TypeVar("T")
+
+RateLimitState = dict[str, Any]
+
+
+class MemoryRateLimitStore(object):
+    """
+    Keeps the state of a rate limiter in memory, shared by the threads of the process.
+    """
+
+    def __init__(self):
+        self._state: RateLimitState = dict()
+        self._lock = threading.Lock()
+
+    def transaction(self, function: Callable[[RateLimitState], T]) -> T:
+        with self._lock:
+            return function(self._state)
+
+
+class FileRateLimitStore(object):
+    """
+    Keeps the state of a rate limiter in a file locked during each transaction, so that the processes
+    using the same credentials on a host share a single budget. Relies on fcntl, hence POSIX only.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def transaction(self, function: Callable[[RateLimitState], T]) -> T:
+        import fcntl
+
+        with self._lock, open(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600), "r+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                content = f.read()
+                state = json.loads(content) if len(content) > 0 else dict()
+                result = function(state)
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(state))
+                return result
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+class RateLimiter(object):
+    """
+    A token bucket throttling the requests sent by the client.
+    Its capacity and its tokens are calibrated with the X-RateLimit-Limit and X-RateLimit-Remaining headers
+    returned by the Cloud Controller. Once the budget is exhausted, requests wait until X-RateLimit-Reset; the budget of
+    the next window is then the one given by the server.
+    """
+
+    def __init__(
+        self,
+        limit: int | None = None,
+        period: float = 3600.0,
+        store: MemoryRateLimitStore | FileRateLimitStore | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        :param limit: number of requests allowed per period. None waits for the first response headers
+            to know it, and does not throttle until then
+        :param period: number of seconds needed to refill the bucket. The Cloud Controller resets the budgets every hour
+        :param store: where the state is kept. Defaults to the memory of the process
+        :param clock: gives the current time, in seconds since epoch
+        """
+        self.limit = limit
+        self.period = period
+        self.store = store if store is not None else MemoryRateLimitStore()
+        self.clock = clock
+
+    def acquire(self):
+        """
+        Takes a token, waiting for it if needed.
+        """
+        wait = self.try_acquire()
+        while wait > 0:
+            time.sleep(wait)
+            wait = self.try_acquire()
+
+    def try_acquire(self) -> float:
+        """
+        :return: 0 when a token was taken, else the number of seconds to wait before trying again
+        """
+        return self.store.transaction(self._take)
+
+    def update(self, response: Response):
+        limit = RateLimiter._header(response, "X-RateLimit-Limit")
+        remaining = RateLimiter._header(response, "X-RateLimit-Remaining")
+        reset = RateLimiter._header(response, "X-RateLimit-Reset")
+        if limit is not None or remaining is not None:
+            self.store.transaction(lambda state: self._calibrate(state, limit, remaining, reset))
+
+    def _take(self, state: RateLimitState) -> float:
+        now = self.clock()
+        blocked_until = state.get("blocked_until", 0)
+        if blocked_until > now:
+            return blocked_until - now
+        capacity = state.get("limit", self.limit)
+        if capacity is None or capacity <= 0:
+            return 0
+        tokens = self._refill(state, capacity, now)
+        if tokens >= 1:
+            state.update(tokens=tokens - 1, updated=now)
+            return 0
+        state.update(tokens=tokens, updated=now)
+        return (1 - tokens) * self.period / capacity
+
+    def _calibrate(self, state: RateLimitState, limit: float | None, remaining: float | None, reset: float | None):
+        now = self.clock()
+        if limit is not None:
+            state["limit"] = limit
+        capacity = state.get("limit", self.limit)
+        if remaining is None:
+            return
+        window = state.get("reset")
+        if reset is not None and window is not None and reset < window:
+            # the response of a request sent before the budget was reset
+            return
+        if reset is not None and reset != window:
+            # a new window: the server budget replaces what was left of the previous one
+            state.update(tokens=remaining, updated=now, reset=reset)
+            state.pop("blocked_until", None)
+        else:
+            tokens = self._refill(state, capacity, now) if capacity is not None else remaining
+            # responses to concurrent requests arrive in any order: the lowest count is trusted
+            state.update(tokens=min(tokens, remaining), updated=now)
+        if remaining <= 0 and reset is not None:
+            state["blocked_until"] = reset
+
+    def _refill(self, state: RateLimitState, capacity: float, now: float) -> float:
+        tokens = state.get("tokens", capacity)
+        elapsed = max(now - state.get("updated", now), 0)
+        return min(capacity, tokens + elapsed * capacity / self.period)
+
+    @staticmethod
+    def _header(response: Response, name: str) -> float | None:
+        value = response.headers.get(name)
+        try:
+            return float(value) if value is not None else None
+        except ValueError:
+            return None
@@ -0,0 +1,60 @@
+import logging
+import time
+from collections.abc import Callable
+
+from requests import Response
+
+RequestHook = Callable[[str, str, Response, float | None], None]
+
+
+class RequestLogger(object):
+    """
+    Instrumentation of the requests sent by the client.
+    Nothing is formatted unless debug is enabled on the logger, and the response body is read only in this case.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        max_body_length: int | None = 4096,
+        timing: bool = False,
+        hook: RequestHook | None = None,
+    ):
+        """
+        :param logger: the logger requests are logged to, with debug level
+        :param max_body_length: number of bytes of the response body that are logged. None logs the whole body
+        :param timing: adds the duration of each request to the log
+        :param hook: called after each request with the method, the url, the response
+            and the duration in seconds (None when neither timing nor hook are set)
+        """
+        self.logger = logger
+        self.max_body_length = max_body_length
+        self.timing = timing
+        self.hook = hook
+
+    def start(self) -> float | None:
+        return time.perf_counter() if self.timing or self.hook is not None else None
+
+    def log(self, method: str, url: str, response: Response, started: float | None = None):
+        elapsed = time.perf_counter() - started if started is not None else None
+        if self.hook is not None:
+            self.hook(method, url, response, elapsed)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "%s: url=%s - status_code=%s - vcap-request-id=%s%s - response=%s",
+                method,
+                url,
+                response.status_code,
+                response.headers.get("x-vcap-request-id", "N/A"),
+                " - elapsed=%.1fms" % (elapsed * 1000) if self.timing and elapsed is not None else "",
+                self._body(response),
+            )
+
+    def _body(self, response: Response) -> str:
+        content = response.content
+        if self.max_body_length is None or len(content) <= self.max_body_length:
+            return response.text
+        return "%s... (%d bytes truncated)" % (
+            content[: self.max_body_length].decode(response.encoding or "utf-8", errors="replace"),
+            len(content) - self.max_body_length,
+        )
@@ -0,0 +1,116 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from urllib.parse import urlencode, urlparse
+
+from requests import Response
+
+CacheKey = tuple[str, str]
+
+
+class ResponseCache(object):
+    """
+    A size-bounded cache of the responses to GET requests, evicting the least recently used ones.
+    The time to live of the entries depends on the type of resource requested (organizations, spaces...):
+    only the types given a positive time to live are cached.
+    A mutation of a resource invalidates the cached responses of the resource, of its sub-resources
+    and of its parents (its collection for instance).
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float = 0,
+        max_size: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param ttls: time to live in seconds by type of resource, such as dict(organizations=300, stacks=3600).
+            The type of resource is the first segment of the path after the api version.
+        :param default_ttl: time to live of the other types. Defaults to 0: they are not cached
+        :param max_size: maximum number of responses cached
+        :param clock: gives the current time in seconds
+        """
+        self.ttls = ttls if ttls is not None else dict()
+        self.default_ttl = default_ttl
+        self.max_size = max_size
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries: OrderedDict[CacheKey, tuple[float, Response]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url: str, params: dict | None = None) -> Response | None:
+        key = ResponseCache._key(url, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self.clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, url: str, params: dict | None, response: Response):
+        path, _ = key = ResponseCache._key(url, params)
+        ttl = self.ttls.get(ResponseCache._resource_type(path), self.default_ttl)
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self.clock() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, url: str):
+        mutated_path = ResponseCache._path(url)
+        with self._lock:
+            invalidated = [
+                key
+                for key in self._entries
+                if key[0] == mutated_path
+                or key[0].startswith(mutated_path + "/")
+                or mutated_path.startswith(key[0] + "/")
+            ]
+            for key in invalidated:
+                del self._entries[key]
+            self.invalidations += len(invalidated)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def counters(self) -> dict:
+        with self._lock:
+            return dict(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                invalidations=self.invalidations,
+                size=len(self._entries),
+            )
+
+    @staticmethod
+    def _key(url: str, params: dict | None) -> CacheKey:
+        parsed = urlparse(url)
+        query = [parsed.query] if parsed.query else []
+        if params:
+            query.append(urlencode(sorted(params.items()), doseq=True))
+        return ResponseCache._path(url), "%s://%s?%s" % (parsed.scheme, parsed.netloc, "&".join(query))
+
+    @staticmethod
+    def _path(url: str) -> str:
+        return urlparse(url).path.rstrip("/")
+
+    @staticmethod
+    def _resource_type(path: str) -> str:
+        segments = path.strip("/").split("/")
+        if len(segments) > 1 and segments[0] in ("v2", "v3"):
+            return segments[1]
+        return segments[0]
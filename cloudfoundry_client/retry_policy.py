@@ -0,0 +1,97 @@
+import random
+import threading
+import time
+from collections import Counter
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+
+from requests import Response
+
+DEFAULT_RETRIED_STATUS_CODES = frozenset(
+    [
+        HTTPStatus.TOO_MANY_REQUESTS.value,
+        HTTPStatus.BAD_GATEWAY.value,
+        HTTPStatus.SERVICE_UNAVAILABLE.value,
+        HTTPStatus.GATEWAY_TIMEOUT.value,
+    ]
+)
+
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+
+class RetryPolicy(object):
+    """
+    Decides whether a response is retried and how long to wait before.
+    The delay is given by the Retry-After header, then by the X-RateLimit-Reset header for rate-limited requests,
+    and defaults to an exponential backoff with full jitter.
+    Counters are updated from any thread.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        max_delay: float = 60.0,
+        status_codes: frozenset[int] = DEFAULT_RETRIED_STATUS_CODES,
+        methods: frozenset[str] = IDEMPOTENT_METHODS,
+    ):
+        """
+        :param max_retries: number of retries of a request, on top of the first attempt
+        :param backoff_factor: the backoff before the n-th retry is a random value between 0 and backoff_factor * 2^n seconds
+        :param max_delay: maximum number of seconds waited before a retry, whatever the headers say
+        :param status_codes: the status codes retried
+        :param methods: the methods retried. Non idempotent ones (POST, PATCH) are not retried by default
+        """
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_delay = max_delay
+        self.status_codes = status_codes
+        self.methods = methods
+        self.retries = 0
+        self.retries_by_status = Counter()
+        self.exhausted = 0
+        self._lock = threading.Lock()
+
+    def delay(self, method: str, response: Response, attempt: int) -> float | None:
+        """
+        :param method: the method of the request
+        :param response: the response received
+        :param attempt: number of retries already done for this request
+        :return: the number of seconds to wait before retrying, None when the response must not be retried
+        """
+        if method.upper() not in self.methods or response.status_code not in self.status_codes:
+            return None
+        with self._lock:
+            if attempt >= self.max_retries:
+                self.exhausted += 1
+                return None
+            self.retries += 1
+            self.retries_by_status[response.status_code] += 1
+        server_delay = RetryPolicy._server_delay(response)
+        if server_delay is None:
+            server_delay = random.uniform(0, self.backoff_factor * (2**attempt))
+        return min(max(server_delay, 0.0), self.max_delay)
+
+    def counters(self) -> dict:
+        with self._lock:
+            return dict(retries=self.retries, retries_by_status=dict(self.retries_by_status), exhausted=self.exhausted)
+
+    @staticmethod
+    def _server_delay(response: Response) -> float | None:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                try:
+                    return parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    pass
+        rate_limit_reset = response.headers.get("X-RateLimit-Reset")
+        # the Cloud Controller sends this header with all the responses, it only matters when the budget is exhausted
+        if rate_limit_reset is not None and response.status_code == HTTPStatus.TOO_MANY_REQUESTS.value:
+            try:
+                return float(rate_limit_reset) - time.time()
+            except ValueError:
+                pass
+        return None
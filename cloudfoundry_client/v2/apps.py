@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+from collections.abc import Iterable
 from http import HTTPStatus
 from time import sleep
 from typing import TYPE_CHECKING
@@ -8,6 +9,8 @@ from typing import TYPE_CHECKING
 from cloudfoundry_client.doppler.client import EnvelopeStream
 from cloudfoundry_client.errors import InvalidStatusCode
 from cloudfoundry_client.common_objects import JsonObject, Pagination
+from cloudfoundry_client.json_decoder import JsonDecoder
+from cloudfoundry_client.multipart import MultipartStream
 from cloudfoundry_client.v2.entities import Entity, EntityManager
 
 if TYPE_CHECKING:
@@ -155,7 +158,7 @@ class AppManager(EntityManager):
     def upload(self, application_guid: str, resources, application: str, asynchronous: bool | None = False):
         application_size = os.path.getsize(application)
         with open(application, "rb") as binary_file:
-            return self.client.put(
+            response = self.client.put(
                 "%s%s/%s/bits" % (self.target_endpoint, self.entity_uri, application_guid),
                 params={"async": "true" if asynchronous else "false"} if asynchronous else None,
                 data=dict(resources=json.dumps(resources)),
@@ -167,7 +170,26 @@ class AppManager(EntityManager):
                         {"Content-Length": application_size, "Content-Transfer-Encoding": "binary"},
                     )
                 ),
-            ).json(object_pairs_hook=JsonObject)
+            )
+        return JsonDecoder.of(self.client).decode(response)
+
+    def upload_stream(
+        self, application_guid: str, resources, application: Iterable[bytes], asynchronous: bool | None = False
+    ):
+        """
+        Uploads the bits of an application while they are produced, such as the chunks of a ZipStream.
+        :param application: the zip archive of the application. It is iterated again if the request is sent again
+        """
+        body = MultipartStream(
+            dict(resources=json.dumps(resources)), dict(application=("application.zip", application, "application/zip"))
+        )
+        response = self.client.put(
+            "%s%s/%s/bits" % (self.target_endpoint, self.entity_uri, application_guid),
+            params={"async": "true" if asynchronous else "false"} if asynchronous else None,
+            data=body,
+            headers={"Content-Type": body.content_type},
+        )
+        return JsonDecoder.of(self.client).decode(response)
 
     @staticmethod
     def _generate_application_update_request(**kwargs) -> dict:
@@ -0,0 +1,100 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from typing import TYPE_CHECKING
+
+from cloudfoundry_client.common_objects import AsyncPagination, JsonObject, chunk_guids
+from cloudfoundry_client.v2.entities import Entity, EntityBuilder, EntityManager
+
+if TYPE_CHECKING:
+    from cloudfoundry_client.async_client import AsyncCloudFoundryClient
+
+
+class AsyncEntity(Entity):
+    @staticmethod
+    def _default_manager(target_endpoint: str, client: "AsyncCloudFoundryClient") -> "AsyncEntityManager":
+        return AsyncEntityManager(target_endpoint, client, "")
+
+
+class AsyncEntityManager(EntityManager):
+    """
+    Asynchronous counterpart of EntityManager. Url building and response parsing are inherited,
+    only the methods doing I/O are coroutines.
+    """
+
+    def __init__(
+        self,
+        target_endpoint: str,
+        client: "AsyncCloudFoundryClient",
+        entity_uri: str,
+        entity_builder: EntityBuilder | None = None,
+    ):
+        super().__init__(
+            target_endpoint,
+            client,
+            entity_uri,
+            entity_builder if entity_builder is not None else lambda pairs: AsyncEntity(target_endpoint, client, pairs),
+        )
+
+    async def _list(
+        self,
+        requested_path: str,
+        entity_builder: EntityBuilder | None = None,
+        raw: bool = False,
+        project: Iterable[str] | None = None,
+        **kwargs
+    ) -> AsyncPagination[Entity]:
+        url_requested = self._get_url_filtered("%s%s" % (self.target_endpoint, requested_path), **kwargs)
+        response_json = self._read_response(await self.client.get(url_requested), JsonObject)
+        return AsyncPagination(response_json, response_json.get("total_results", 0),
+                               self._next_page,
+                               lambda page: page["resources"],
+                               self._instance_creator(entity_builder, raw, project))
+
+    async def _next_page(self, current_page: JsonObject) -> JsonObject | None:
+        next_url = current_page.get("next_url")
+        if next_url is None:
+            return None
+        url_requested = "%s%s" % (self.target_endpoint, next_url)
+        return self._read_response(await self.client.get(url_requested), JsonObject)
+
+    async def _remove(self, resource_id: str, **kwargs):
+        url = "%s%s/%s" % (self.target_endpoint, self.entity_uri, resource_id)
+        await self._delete(url, **kwargs)
+
+    async def _get(self, requested_path: str, entity_builder: EntityBuilder | None = None) -> Entity:
+        url = "%s%s" % (self.target_endpoint, requested_path)
+        response = await self.client.get(url)
+        return self._read_response(response, entity_builder)
+
+    async def _post(self, url: str, data: dict | None = None, **kwargs):
+        response = await self.client.post(url, json=data, **kwargs)
+        return self._read_response(response)
+
+    async def _put(self, url: str, data: dict | None = None, **kwargs):
+        response = await self.client.put(url, json=data, **kwargs)
+        return self._read_response(response)
+
+    async def _delete(self, url: str, **kwargs):
+        await self.client.delete(url, **kwargs)
+
+    async def __aiter__(self) -> AsyncIterator[Entity]:
+        async for entity in await self.list():
+            yield entity
+
+    def __iter__(self):
+        raise TypeError("'%s' is asynchronous, use 'async for' on list()" % type(self).__name__)
+
+    async def get_first(self, **kwargs) -> Entity | None:
+        kwargs.setdefault("results-per-page", 1)
+        async for entity in await self._list(self.entity_uri, **kwargs):
+            return entity
+        return None
+
+    async def get_many(self, guids: Iterable[str], chunk_size: int = 50, raw: bool = False, **kwargs) -> dict[str, Entity]:
+        kwargs.setdefault("results-per-page", min(chunk_size, 100))
+
+        async def get_chunk(chunk: list[str]) -> list[Entity]:
+            return [entity async for entity in await self._list(self.entity_uri, raw=raw, guid=chunk, **kwargs)]
+
+        results = await asyncio.gather(*[get_chunk(chunk) for chunk in chunk_guids(guids, chunk_size)])
+        return {entity["metadata"]["guid"]: entity for result in results for entity in result}
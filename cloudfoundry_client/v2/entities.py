@@ -1,11 +1,13 @@
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial, reduce
 from typing import Any, TYPE_CHECKING
 from urllib.parse import quote
 from requests import Response
 
 from cloudfoundry_client.errors import InvalidEntity
-from cloudfoundry_client.common_objects import JsonObject, Request, Pagination
+from cloudfoundry_client.common_objects import JsonObject, Request, Pagination, Projection, chunk_guids
+from cloudfoundry_client.json_decoder import JsonDecoder
 
 if TYPE_CHECKING:
     from cloudfoundry_client.client import CloudFoundryClient
@@ -29,7 +31,7 @@ class Entity(JsonObject):
                     except AttributeError:
                         # generic manager
 
-                        other_manager = EntityManager(target_endpoint, client, "")
+                        other_manager = self._default_manager(target_endpoint, client)
                     if domain_name.endswith("s"):
                         new_method = partial(other_manager._list, value)
                     else:
@@ -39,6 +41,10 @@ class Entity(JsonObject):
         except KeyError:
             raise InvalidEntity(**self)
 
+    @staticmethod
+    def _default_manager(target_endpoint: str, client: "CloudFoundryClient") -> "EntityManager":
+        return EntityManager(target_endpoint, client, "")
+
 
 EntityBuilder = Callable[[list[tuple[str, Any]]], Entity]
 
@@ -60,14 +66,31 @@ class EntityManager(object):
             entity_builder if entity_builder is not None else lambda pairs: Entity(target_endpoint, client, pairs)
         )
 
-    def _list(self, requested_path: str, entity_builder: EntityBuilder | None = None, **kwargs) -> Pagination[Entity]:
+    def _list(
+        self,
+        requested_path: str,
+        entity_builder: EntityBuilder | None = None,
+        raw: bool = False,
+        project: Iterable[str] | None = None,
+        **kwargs
+    ) -> Pagination[Entity]:
         url_requested = self._get_url_filtered("%s%s" % (self.target_endpoint, requested_path), **kwargs)
-        current_builder = self._get_entity_builder(entity_builder)
         response_json = self._read_response(self.client.get(url_requested), JsonObject)
         return Pagination(response_json, response_json.get("total_results", 0),
                           self._next_page,
                           lambda page: page["resources"],
-                          lambda json_object: current_builder(list(json_object.items())))
+                          self._instance_creator(entity_builder, raw, project))
+
+    def _instance_creator(
+        self, entity_builder: EntityBuilder | None, raw: bool, project: Iterable[str] | None
+    ) -> Callable[[JsonObject], Entity | JsonObject | tuple]:
+        if project is not None:
+            return Projection(project)
+        elif raw:
+            return lambda json_object: json_object
+        else:
+            current_builder = self._get_entity_builder(entity_builder)
+            return lambda json_object: current_builder(list(json_object.items()))
 
     def _next_page(self, current_page: JsonObject) -> JsonObject | None:
         next_url = current_page.get("next_url")
@@ -119,6 +142,27 @@ class EntityManager(object):
             return entity
         return None
 
+    def get_many(
+        self, guids: Iterable[str], chunk_size: int = 50, max_workers: int = 4, raw: bool = False, **kwargs
+    ) -> dict[str, Entity]:
+        """
+        Gets entities with a q=guid IN filter, split in chunks of chunk_size guids so that the urls stay short.
+        The chunks are requested concurrently on at most max_workers threads.
+        :return: the entities found, by guid. Unknown guids are missing.
+        """
+        kwargs.setdefault("results-per-page", min(chunk_size, 100))
+        chunks = chunk_guids(guids, chunk_size)
+
+        def get_chunk(chunk: list[str]) -> list[Entity]:
+            return [entity for entity in self._list(self.entity_uri, raw=raw, guid=chunk, **kwargs)]
+
+        if len(chunks) <= 1 or max_workers <= 1:
+            results = [get_chunk(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                results = list(executor.map(get_chunk, chunks))
+        return {entity["metadata"]["guid"]: entity for result in results for entity in result}
+
     def get(self, entity_id: str, *extra_paths) -> Entity:
         if len(extra_paths) == 0:
             requested_path = "%s/%s" % (self.entity_uri, entity_id)
@@ -128,7 +172,7 @@ class EntityManager(object):
 
     def _read_response(self, response: Response, other_entity_builder: EntityBuilder | None = None):
         entity_builder = self._get_entity_builder(other_entity_builder)
-        result = response.json(object_pairs_hook=JsonObject)
+        result = JsonDecoder.of(self.client).decode(response)
         return entity_builder(list(result.items()))
 
     @staticmethod
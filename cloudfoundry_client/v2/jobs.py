@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
 from cloudfoundry_client.common_objects import JsonObject
+from cloudfoundry_client.json_decoder import JsonDecoder
 
 if TYPE_CHECKING:
     from cloudfoundry_client.client import CloudFoundryClient
@@ -12,4 +13,4 @@ class JobManager(object):
         self.client = client
 
     def get(self, job_guid: str) -> JsonObject:
-        return self.client.get("%s/v2/jobs/%s" % (self.target_endpoint, job_guid)).json(object_pairs_hook=JsonObject)
+        return JsonDecoder.of(self.client).decode(self.client.get("%s/v2/jobs/%s" % (self.target_endpoint, job_guid)))
@@ -1,6 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
-from cloudfoundry_client.common_objects import JsonObject
+from cloudfoundry_client.json_decoder import JsonDecoder
 
 if TYPE_CHECKING:
     from cloudfoundry_client.client import CloudFoundryClient
@@ -11,6 +12,20 @@ class ResourceManager(object):
         self.target_endpoint = target_endpoint
         self.client = client
 
-    def match(self, items: list[dict]) -> list[JsonObject]:
+    def match(self, items: list[dict]) -> list[dict]:
         response = self.client.put("%s/v2/resource_match" % self.client.info.api_endpoint, json=items)
-        return response.json(object_pairs_hook=JsonObject)
+        return JsonDecoder.of(self.client).decode(response)
+
+    def match_many(self, items: list[dict], chunk_size: int = 1000, max_workers: int = 4) -> list[dict]:
+        """
+        Matches the items by chunks of chunk_size, so that each request stays small.
+        The chunks are sent concurrently on at most max_workers threads.
+        :return: the items known by the cloud controller
+        """
+        chunks = [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+        if len(chunks) <= 1 or max_workers <= 1:
+            results = [self.match(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                results = list(executor.map(self.match, chunks))
+        return [item for result in results for item in result]
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 import sys
 
 if sys.version_info < (3, 13):
@@ -7,7 +7,7 @@ else:
     from warnings import deprecated
 
 from cloudfoundry_client.common_objects import JsonObject, Pagination
-from cloudfoundry_client.v3.entities import EntityManager, Entity
+from cloudfoundry_client.v3.entities import EntityManager, Entity, ToOneRelationship
 
 if TYPE_CHECKING:
     from cloudfoundry_client.client import CloudFoundryClient
@@ -17,6 +17,42 @@ class AppManager(EntityManager[Entity]):
     def __init__(self, target_endpoint: str, client: "CloudFoundryClient"):
         super().__init__(target_endpoint, client, "/v3/apps")
 
+    def create(
+        self,
+        name: str,
+        space_guid: str,
+        lifecycle: dict | None = None,
+        environment_variables: dict | None = None,
+        meta_labels: dict | None = None,
+        meta_annotations: dict | None = None,
+    ) -> Entity:
+        data: dict[str, Any] = {
+            "name": name,
+            "relationships": {
+                "space": ToOneRelationship(space_guid)
+            },
+        }
+        if lifecycle is not None:
+            data["lifecycle"] = lifecycle
+        if environment_variables is not None:
+            data["environment_variables"] = environment_variables
+        self._metadata(data, meta_labels, meta_annotations)
+        return super()._create(data)
+
+    def start(self, application_guid: str) -> Entity:
+        return super()._post("%s%s/%s/actions/start" % (self.target_endpoint, self.entity_uri, application_guid))
+
+    def stop(self, application_guid: str) -> Entity:
+        return super()._post("%s%s/%s/actions/stop" % (self.target_endpoint, self.entity_uri, application_guid))
+
+    def set_current_droplet(self, application_guid: str, droplet_guid: str) -> ToOneRelationship:
+        return ToOneRelationship.from_json_object(
+            super()._patch(
+                "%s%s/%s/relationships/current_droplet" % (self.target_endpoint, self.entity_uri, application_guid),
+                ToOneRelationship(droplet_guid),
+            )
+        )
+
     def restart(self, application_guid: str):
         return super()._post("%s%s/%s/actions/restart" % (self.target_endpoint, self.entity_uri, application_guid))
 
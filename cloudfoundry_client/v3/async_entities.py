@@ -0,0 +1,154 @@
+import asyncio
+from typing import Any, TYPE_CHECKING, Type
+from collections.abc import AsyncIterator, Iterable
+
+from cloudfoundry_client.common_objects import AsyncPagination, JsonObject, chunk_guids
+from cloudfoundry_client.v3.entities import Entity, EntityManager, ENTITY_TYPE
+
+if TYPE_CHECKING:
+    from cloudfoundry_client.async_client import AsyncCloudFoundryClient
+
+
+class AsyncEntity(Entity):
+    @staticmethod
+    def _default_manager(target_endpoint: str, client: "AsyncCloudFoundryClient") -> "AsyncEntityManager":
+        return AsyncEntityManager(target_endpoint, client, "")
+
+
+class AsyncEntityManager(EntityManager[ENTITY_TYPE]):
+    """
+    Asynchronous counterpart of EntityManager. Url building and response parsing are inherited,
+    only the methods doing I/O are coroutines.
+    """
+
+    def __init__(
+            self,
+            target_endpoint: str,
+            client: "AsyncCloudFoundryClient",
+            entity_uri: str,
+            entity_type: type[ENTITY_TYPE] = AsyncEntity
+    ):
+        super().__init__(target_endpoint, client, entity_uri, entity_type)
+
+    async def _get(self, url: str, entity_type: type[ENTITY_TYPE] | None = None, **kwargs) -> ENTITY_TYPE:
+        url_requested = EntityManager._get_url_with_encoded_params(url, **kwargs)
+        response = await self.client.get(url_requested)
+        return self._read_response(response, entity_type)
+
+    async def _post(
+            self,
+            url: str,
+            entity_type: type[ENTITY_TYPE] | None = None,
+            data: dict | None = None,
+            params: dict | None = None,
+            files: Any = None
+    ) -> ENTITY_TYPE:
+        response = await self.client.post(
+            url if params is None else EntityManager._get_url_with_encoded_params(url, **params),
+            json=data,
+            files=files
+        )
+        return self._read_response(response, entity_type)
+
+    async def _put(self, url: str, data: dict, entity_type: type[ENTITY_TYPE] | None = None) -> ENTITY_TYPE:
+        response = await self.client.put(url, json=data)
+        return self._read_response(response, entity_type)
+
+    async def _patch(self, url: str, data: dict, entity_type: type[ENTITY_TYPE] | None = None) -> ENTITY_TYPE:
+        response = await self.client.patch(url, json=data)
+        return self._read_response(response, entity_type)
+
+    async def _delete(self, url: str) -> str | None:
+        response = await self.client.delete(url)
+        return self._location(response)
+
+    async def _remove(self, resource_id: str) -> str | None:
+        url = "%s%s/%s" % (self.target_endpoint, self.entity_uri, resource_id)
+        job_location = await self._delete(url)
+        return self._extract_job_guid(job_location) if job_location is not None else None
+
+    async def _list(
+            self,
+            requested_path: str,
+            entity_type: type[ENTITY_TYPE] | None = None,
+            prefetch: int = 0,
+            raw: bool = False,
+            project: Iterable[str] | None = None,
+            **kwargs
+    ) -> AsyncPagination[ENTITY_TYPE]:
+        if prefetch > 0:
+            # the pages would otherwise be loaded on threads, and the parameter sent to the server
+            raise ValueError("prefetch is only supported by the synchronous client")
+        url_requested = EntityManager._get_url_with_encoded_params("%s%s" % (self.target_endpoint, requested_path), **kwargs)
+        response_json = self._read_response(await self.client.get(url_requested), JsonObject)
+        return self._pagination(response_json, entity_type, raw=raw, project=project)
+
+    async def _attempt_to_paginate(self, url_requested: str, entity_type: type[ENTITY_TYPE] | None = None) \
+            -> AsyncPagination[ENTITY_TYPE] | ENTITY_TYPE:
+        response_json = self._read_response(await self.client.get(url_requested), JsonObject)
+        if "resources" in response_json:
+            return self._pagination(response_json, entity_type)
+        else:
+            return response_json
+
+    def _pagination(
+            self,
+            page: JsonObject,
+            entity_type: type[ENTITY_TYPE] | None = None,
+            raw: bool = False,
+            project: Iterable[str] | None = None
+    ) -> AsyncPagination[ENTITY_TYPE]:
+        return AsyncPagination(page,
+                               page.get("pagination", {}).get("total_results", 0),
+                               self._next_page,
+                               lambda p: p["resources"],
+                               self._instance_creator(entity_type, raw, project))
+
+    async def _next_page(self, current_page: JsonObject) -> JsonObject | None:
+        pagination = current_page.get("pagination")
+        if (
+                pagination is None
+                or "next" not in pagination
+                or pagination["next"] is None
+                or pagination["next"].get("href") is None
+        ):
+            return None
+        return self._read_response(await self.client.get(current_page["pagination"]["next"]["href"]), JsonObject)
+
+    async def __aiter__(self) -> AsyncIterator[ENTITY_TYPE]:
+        async for entity in await self.list():
+            yield entity
+
+    def __iter__(self):
+        raise TypeError("'%s' is asynchronous, use 'async for' on list()" % type(self).__name__)
+
+    def __len__(self):
+        raise TypeError("'%s' is asynchronous, use 'await len()'" % type(self).__name__)
+
+    async def len(self, **kwargs) -> int:
+        url_requested = EntityManager._get_url_with_encoded_params("%s%s" % (self.target_endpoint, self.entity_uri), **kwargs)
+        response_json = self._read_response(await self.client.get(url_requested), JsonObject)
+        pagination = response_json.get("pagination")
+        if pagination is not None:
+            return pagination.get("total_results", 0)
+        else:
+            return 0
+
+    async def get_first(self, **kwargs) -> ENTITY_TYPE | None:
+        kwargs.setdefault("per_page", 1)
+        async for entity in await self._list(self.entity_uri, **kwargs):
+            return entity
+        return None
+
+    async def get_many(self, guids: Iterable[str], chunk_size: int = 50, raw: bool = False, **kwargs) -> dict[str, ENTITY_TYPE]:
+        kwargs.setdefault("per_page", chunk_size)
+
+        async def get_chunk(chunk: list[str]) -> list[ENTITY_TYPE]:
+            return [entity async for entity in await self._list(self.entity_uri, raw=raw, guids=chunk, **kwargs)]
+
+        results = await asyncio.gather(*[get_chunk(chunk) for chunk in chunk_guids(guids, chunk_size)])
+        return {entity["guid"]: entity for result in results for entity in result}
+
+    @staticmethod
+    def _get_entity_type(entity_name: str) -> Type[ENTITY_TYPE]:
+        return AsyncEntity
@@ -0,0 +1,42 @@
+from typing import TYPE_CHECKING, Any
+
+from cloudfoundry_client.v3.entities import EntityManager, Entity
+
+if TYPE_CHECKING:
+    from cloudfoundry_client.client import CloudFoundryClient
+
+
+class BuildManager(EntityManager[Entity]):
+    def __init__(self, target_endpoint: str, client: "CloudFoundryClient"):
+        super().__init__(target_endpoint, client, "/v3/builds")
+
+    def create(self,
+               package_guid: str,
+               lifecycle: dict | None = None,
+               staging_memory_in_mb: int | None = None,
+               staging_disk_in_mb: int | None = None,
+               meta_labels: dict | None = None,
+               meta_annotations: dict | None = None,
+               ) -> Entity:
+        data: dict[str, Any] = {
+            "package": {
+                "guid": package_guid
+            },
+        }
+        if lifecycle is not None:
+            data["lifecycle"] = lifecycle
+        if staging_memory_in_mb is not None:
+            data["staging_memory_in_mb"] = staging_memory_in_mb
+        if staging_disk_in_mb is not None:
+            data["staging_disk_in_mb"] = staging_disk_in_mb
+        self._metadata(data, meta_labels, meta_annotations)
+        return super()._create(data)
+
+    def update(self,
+               build_guid: str,
+               meta_labels: dict | None = None,
+               meta_annotations: dict | None = None,
+               ) -> Entity:
+        data: dict[str, Any] = {}
+        self._metadata(data, meta_labels, meta_annotations)
+        return super()._update(build_guid, data)
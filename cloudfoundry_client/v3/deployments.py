@@ -0,0 +1,68 @@
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from cloudfoundry_client.v3.entities import EntityManager, Entity, ToOneRelationship
+
+if TYPE_CHECKING:
+    from cloudfoundry_client.client import CloudFoundryClient
+
+
+class DeploymentStrategy(Enum):
+    ROLLING = "rolling"
+    CANARY = "canary"
+
+
+class DeploymentManager(EntityManager[Entity]):
+    def __init__(self, target_endpoint: str, client: "CloudFoundryClient"):
+        super().__init__(target_endpoint, client, "/v3/deployments")
+
+    def create(
+        self,
+        app_guid: str,
+        droplet_guid: str | None = None,
+        revision_guid: str | None = None,
+        strategy: DeploymentStrategy = DeploymentStrategy.ROLLING,
+        max_in_flight: int | None = None,
+        canary_steps: list[dict] | None = None,
+        meta_labels: dict | None = None,
+        meta_annotations: dict | None = None,
+    ) -> Entity:
+        """
+        :param droplet_guid: the droplet deployed, the current droplet of the application by default
+        :param revision_guid: the revision rolled back to, instead of a droplet
+        :param max_in_flight: number of instances replaced at the same time
+        :param canary_steps: the steps of a canary deployment, such as [dict(instance_weight=20), dict(instance_weight=60)]
+        """
+        data: dict[str, Any] = {
+            "strategy": strategy.value,
+            "relationships": {
+                "app": ToOneRelationship(app_guid)
+            },
+        }
+        if droplet_guid is not None:
+            data["droplet"] = {"guid": droplet_guid}
+        if revision_guid is not None:
+            data["revision"] = {"guid": revision_guid}
+        options: dict[str, Any] = {}
+        if max_in_flight is not None:
+            options["max_in_flight"] = max_in_flight
+        if canary_steps is not None:
+            options["canary"] = {"steps": canary_steps}
+        if len(options) > 0:
+            data["options"] = options
+        self._metadata(data, meta_labels, meta_annotations)
+        return super()._create(data)
+
+    def update(self, deployment_guid: str, meta_labels: dict | None = None, meta_annotations: dict | None = None) -> Entity:
+        data: dict[str, Any] = {}
+        self._metadata(data, meta_labels, meta_annotations)
+        return super()._update(deployment_guid, data)
+
+    def cancel(self, deployment_guid: str) -> Entity:
+        return super()._post("%s%s/%s/actions/cancel" % (self.target_endpoint, self.entity_uri, deployment_guid))
+
+    def continue_deployment(self, deployment_guid: str) -> Entity:
+        """
+        Resumes a canary deployment paused at one of its steps.
+        """
+        return super()._post("%s%s/%s/actions/continue" % (self.target_endpoint, self.entity_uri, deployment_guid))
@@ -1,5 +1,8 @@
 import functools
-from collections.abc import Callable
+import re
+from collections import deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from json import JSONDecodeError
 from typing import Any, TypeVar, TYPE_CHECKING, Type, Generic
 from urllib.parse import quote, urlparse
@@ -7,7 +10,8 @@ from urllib.parse import quote, urlparse
 from requests import Response
 
 from cloudfoundry_client.errors import InvalidEntity
-from cloudfoundry_client.common_objects import JsonObject, Request, Pagination
+from cloudfoundry_client.common_objects import JsonObject, Request, Pagination, Projection, chunk_guids
+from cloudfoundry_client.json_decoder import JsonDecoder
 
 if TYPE_CHECKING:
     from cloudfoundry_client.client import CloudFoundryClient, V3
@@ -20,26 +24,35 @@ def plural(name: str) -> str:
 class Entity(JsonObject):
     def __init__(self, target_endpoint: str, client: "CloudFoundryClient", **kwargs):
         super().__init__(**kwargs)
-        default_manager = self._default_manager(target_endpoint, client)
-        self._create_navigable_links(client.v3, default_manager)
-        self._create_navigable_included_entities(client.v3, default_manager)
-
-    def _create_navigable_links(self, v3_client: "V3", default_manager: "EntityManager") -> None:
+        self._target_endpoint = target_endpoint
+        self._client = client
+        if "_included" in self:
+            self._create_navigable_included_entities(client.v3, self._default_manager(target_endpoint, client))
+
+    def __getattr__(self, name: str) -> Callable:
+        # links are only turned into methods when first accessed, most entities are never navigated
+        link = self.get("links", {}).get(name) if not name.startswith("_") and name != "self" else None
+        if link is None:
+            raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, name))
+        navigable_link = self._navigable_link(name, link)
+        setattr(self, name, navigable_link)
+        return navigable_link
+
+    def _navigable_link(self, link_name: str, link: JsonObject) -> Callable:
         try:
-            default_method = self._default_method()
-            for link_name, link in self.get("links", {}).items():
-                if link_name != "self":
-                    link_method = link.get("method", "GET").lower()
-                    manager_method = self._manager_method(link_name, link_method)
-                    ref = link["href"]
-                    if manager_method is not None:
-                        manager_name = plural(link_name)
-                        other_manager = getattr(v3_client, manager_name, default_manager)
-                        new_method = functools.partial(getattr(other_manager, manager_method), ref)
-                    else:
-                        new_method = functools.partial(default_method, link_method, ref)
-                    new_method.__name__ = link_name
-                    setattr(self, link_name, new_method)
+            link_method = link.get("method", "GET").lower()
+            manager_method = self._manager_method(link_name, link_method)
+            ref = link["href"]
+            if manager_method is not None:
+                manager_name = plural(link_name)
+                other_manager = getattr(self._client.v3, manager_name, None)
+                if other_manager is None:
+                    other_manager = self._default_manager(self._target_endpoint, self._client)
+                new_method = functools.partial(getattr(other_manager, manager_method), ref)
+            else:
+                new_method = functools.partial(self._default_method(), link_method, ref)
+            new_method.__name__ = link_name
+            return new_method
         except KeyError:
             raise InvalidEntity(**self)
 
@@ -114,6 +127,59 @@ class ToManyRelationship(JsonObject):
 ENTITY_TYPE = TypeVar("ENTITY_TYPE", bound=Entity, covariant=True)
 
 
+class PagePrefetcher(object):
+    """
+    Next page loader that keeps up to `prefetch` of the following pages in flight on a thread pool
+    while the current one is consumed. Pages are returned in order.
+    """
+
+    PAGE_PARAMETER = re.compile(r"([?&])page=(\d+)")
+
+    def __init__(self, page_loader: Callable[[str], JsonObject], next_url: str, total_pages: int, prefetch: int):
+        match = PagePrefetcher.PAGE_PARAMETER.search(next_url)
+        first_page_number = int(match.group(2))
+        self._page_loader = page_loader
+        self._urls = iter(
+            [
+                PagePrefetcher.PAGE_PARAMETER.sub(r"\g<1>page=%d" % page_number, next_url)
+                for page_number in range(first_page_number, total_pages + 1)
+            ]
+        )
+        self._executor = ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="cf-page-prefetch")
+        self._pending: deque[Future] = deque()
+        for _ in range(prefetch):
+            self._submit_next()
+
+    @staticmethod
+    def accepts(next_url: str | None, total_pages: int | None) -> bool:
+        return next_url is not None and total_pages is not None and PagePrefetcher.PAGE_PARAMETER.search(next_url) is not None
+
+    def __call__(self, current_page: JsonObject) -> JsonObject | None:
+        if len(self._pending) == 0:
+            self.close()
+            return None
+        future = self._pending.popleft()
+        self._submit_next()
+        try:
+            return future.result()
+        except Exception:
+            self.close()
+            raise
+
+    def close(self):
+        """
+        Cancels the pages not loaded yet, when the iteration stops early or fails.
+        """
+        while len(self._pending) > 0:
+            self._pending.popleft().cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit_next(self):
+        url = next(self._urls, None)
+        if url is not None:
+            self._pending.append(self._executor.submit(self._page_loader, url))
+
+
 class EntityManager(Generic[ENTITY_TYPE]):
     def __init__(
             self,
@@ -183,10 +249,18 @@ class EntityManager(Generic[ENTITY_TYPE]):
         job_guid = job_url.path.rsplit("/", 1)[-1]
         return job_guid
 
-    def _list(self, requested_path: str, entity_type: type[ENTITY_TYPE] | None = None, **kwargs) -> Pagination[ENTITY_TYPE]:
+    def _list(
+            self,
+            requested_path: str,
+            entity_type: type[ENTITY_TYPE] | None = None,
+            prefetch: int = 0,
+            raw: bool = False,
+            project: Iterable[str] | None = None,
+            **kwargs
+    ) -> Pagination[ENTITY_TYPE]:
         url_requested = EntityManager._get_url_with_encoded_params("%s%s" % (self.target_endpoint, requested_path), **kwargs)
         response_json = self._read_response(self.client.get(url_requested), JsonObject)
-        return self._pagination(response_json, entity_type)
+        return self._pagination(response_json, entity_type, prefetch, raw, project)
 
     def _attempt_to_paginate(self, url_requested: str, entity_type: type[ENTITY_TYPE] | None = None) \
             -> Pagination[ENTITY_TYPE] | ENTITY_TYPE:
@@ -196,15 +270,42 @@ class EntityManager(Generic[ENTITY_TYPE]):
         else:
             return response_json
 
-    def _pagination(self, page: JsonObject, entity_type: type[ENTITY_TYPE] | None = None) -> Pagination[ENTITY_TYPE]:
-        def _entity(json_object: JsonObject) -> ENTITY_TYPE:
-            return self._entity(json_object, entity_type)
-
+    def _pagination(
+            self,
+            page: JsonObject,
+            entity_type: type[ENTITY_TYPE] | None = None,
+            prefetch: int = 0,
+            raw: bool = False,
+            project: Iterable[str] | None = None
+    ) -> Pagination[ENTITY_TYPE]:
         return Pagination(page,
                           page.get("pagination", {}).get("total_results", 0),
-                          self._next_page,
+                          self._next_page_loader(page, prefetch),
                           lambda p: p["resources"],
-                          _entity)
+                          self._instance_creator(entity_type, raw, project))
+
+    def _instance_creator(
+            self,
+            entity_type: type[ENTITY_TYPE] | None,
+            raw: bool,
+            project: Iterable[str] | None
+    ) -> Callable[[JsonObject], ENTITY_TYPE | JsonObject | tuple]:
+        if project is not None:
+            return Projection(project)
+        elif raw:
+            return lambda json_object: json_object
+        else:
+            return lambda json_object: self._entity(json_object, entity_type)
+
+    def _next_page_loader(self, first_page: JsonObject, prefetch: int) -> Callable[[JsonObject], JsonObject | None]:
+        pagination = first_page.get("pagination") or {}
+        next_url = (pagination.get("next") or {}).get("href")
+        total_pages = pagination.get("total_pages")
+        if prefetch > 0 and PagePrefetcher.accepts(next_url, total_pages):
+            return PagePrefetcher(
+                lambda url: self._read_response(self.client.get(url), JsonObject), next_url, total_pages, prefetch
+            )
+        return self._next_page
 
     def _next_page(self, current_page: JsonObject) -> JsonObject | None:
         pagination = current_page.get("pagination")
@@ -257,6 +358,27 @@ class EntityManager(Generic[ENTITY_TYPE]):
             return entity
         return None
 
+    def get_many(
+            self, guids: Iterable[str], chunk_size: int = 50, max_workers: int = 4, raw: bool = False, **kwargs
+    ) -> dict[str, ENTITY_TYPE]:
+        """
+        Gets entities with a guids filter, split in chunks of chunk_size guids so that the urls stay short.
+        The chunks are requested concurrently on at most max_workers threads.
+        :return: the entities found, by guid. Unknown guids are missing.
+        """
+        kwargs.setdefault("per_page", chunk_size)
+        chunks = chunk_guids(guids, chunk_size)
+
+        def get_chunk(chunk: list[str]) -> list[ENTITY_TYPE]:
+            return [entity for entity in self._list(self.entity_uri, raw=raw, guids=chunk, **kwargs)]
+
+        if len(chunks) <= 1 or max_workers <= 1:
+            results = [get_chunk(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                results = list(executor.map(get_chunk, chunks))
+        return {entity["guid"]: entity for result in results for entity in result}
+
     def get(self, entity_id: str, *extra_paths, **kwargs) -> ENTITY_TYPE:
         if len(extra_paths) == 0:
             requested_path = "%s%s/%s" % (self.target_endpoint, self.entity_uri, entity_id)
@@ -270,7 +392,7 @@ class EntityManager(Generic[ENTITY_TYPE]):
             entity_type: type[ENTITY_TYPE] | type[JsonObject] | None
     ) -> JsonObject | ENTITY_TYPE:
         try:
-            result = response.json(object_pairs_hook=JsonObject)
+            result = JsonDecoder.of(self.client).decode(response)
         except JSONDecodeError:
             # assume that response is empty
             result = {"links": {}}
@@ -290,21 +412,32 @@ class EntityManager(Generic[ENTITY_TYPE]):
     def _mixin_included_resources(self, result: JsonObject) -> JsonObject:
         if "included" not in result:
             return result
+        included_by_guid = {}
+        for resources_name, included_resources in result["included"].items():
+            resources_by_guid = included_by_guid.setdefault(resources_name, {})
+            for included_resource in included_resources:
+                resources_by_guid.setdefault(included_resource.get("guid"), included_resource)
+        resolved = set()
         for resource in result.get("resources", [result]):
-            self._include_resources(resource, result)
+            self._include_resources(resource, included_by_guid, resolved)
         del result["included"]
         return result
 
-    def _include_resources(self, resource: JsonObject, result: JsonObject) -> None:
+    def _include_resources(self, resource: JsonObject, included_by_guid: dict[str, dict[str, JsonObject]], resolved: set[int]) \
+            -> None:
+        # included resources are shared between the resources referencing them: resolve each of them once
+        if id(resource) in resolved:
+            return
+        resolved.add(id(resource))
         for relationship_name, relationship in resource.get("relationships", {}).items():
             relationship_guid = (relationship.get("data") or {}).get("guid")
-            included_resources = result["included"].get(plural(relationship_name))
-            if relationship_guid is not None and included_resources is not None:
-                included_resource = next((r for r in included_resources if relationship_guid == r.get("guid")), None)
-                if included_resource is not None:
-                    self._include_resources(included_resource, result)
-                    included = resource.setdefault("_included", {})
-                    included.update({relationship_name: included_resource})
+            if relationship_guid is None:
+                continue
+            included_resource = included_by_guid.get(plural(relationship_name), {}).get(relationship_guid)
+            if included_resource is not None:
+                self._include_resources(included_resource, included_by_guid, resolved)
+                included = resource.setdefault("_included", {})
+                included.update({relationship_name: included_resource})
 
     @staticmethod
     def _get_entity_type(entity_name: str) -> Type[ENTITY_TYPE]:
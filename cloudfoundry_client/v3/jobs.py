@@ -1,15 +1,14 @@
-import types
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
-import polling2
-
 from cloudfoundry_client.v3.entities import EntityManager, Entity
+from cloudfoundry_client.waiter import Waiter, WaitTimeout
 
 if TYPE_CHECKING:
     from cloudfoundry_client.client import CloudFoundryClient
 
 
-class JobTimeout(Exception):
+class JobTimeout(WaitTimeout):
     pass
 
 
@@ -20,19 +19,31 @@ class JobManager(EntityManager[Entity]):
     def wait_for_job_completion(
         self,
         job_guid: str,
-        step: int = 1,
-        step_function: types.FunctionType = lambda step: min(step + step, 60),
+        step: float = Waiter.INITIAL_INTERVAL,
+        step_function: Callable[[float], float] | None = None,
         poll_forever: bool = False,
-        timeout: int = 600,
+        timeout: float = Waiter.TIMEOUT,
+        max_step: float = Waiter.MAX_INTERVAL,
+        jitter: float = Waiter.JITTER,
+        on_state_change: Callable[[Entity], None] | None = None,
     ) -> Entity:
+        """
+        :param step: number of seconds before the second poll of the job
+        :param step_function: gives the next interval from the previous one, doubles it by default
+        :param poll_forever: ignores the timeout
+        :param timeout: number of seconds after which a JobTimeout is raised
+        :param max_step: cap of the interval between two polls
+        :param jitter: ratio of each interval randomly added or removed
+        :param on_state_change: called with the job each time its state changes
+        :return: the job, either COMPLETE or FAILED
+        """
+        waiter = Waiter(step, max_step, None if poll_forever else timeout, jitter, step_function)
         try:
-            return polling2.poll(
+            return waiter.wait(
                 lambda: self.get(job_guid),
-                step=step,
-                step_function=step_function,
-                poll_forever=poll_forever,
-                timeout=timeout,
-                check_success=lambda job: job["state"] == "FAILED" or job["state"] == "COMPLETE",
+                lambda job: job["state"] == "FAILED" or job["state"] == "COMPLETE",
+                lambda job: job["state"],
+                on_state_change,
             )
-        except polling2.TimeoutException as e:
+        except WaitTimeout as e:
             raise JobTimeout(e)
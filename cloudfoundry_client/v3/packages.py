@@ -1,7 +1,11 @@
+import json
+import os
+from collections.abc import Iterable
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
 from cloudfoundry_client.common_objects import Pagination
+from cloudfoundry_client.multipart import MultipartStream
 from cloudfoundry_client.v3.entities import EntityManager, Entity, ToOneRelationship
 
 if TYPE_CHECKING:
@@ -22,16 +26,60 @@ class PackageManager(EntityManager[Entity]):
                package_type: PackageType,
                meta_labels: dict | None = None,
                meta_annotations: dict | None = None,
+               package_data: dict | None = None,
                ) -> Entity:
+        """
+        :param package_data: the image, username and password of a docker package
+        """
         data: dict[str, Any] = {
             "type": package_type.value,
             "relationships": {
                 "app": ToOneRelationship(app_guid)
             },
         }
+        if package_data is not None:
+            data["data"] = package_data
         self._metadata(data, meta_labels, meta_annotations)
         return super()._create(data)
 
+    def upload(self, package_guid: str, bits: Iterable[bytes], resources: list[dict] | None = None) -> Entity:
+        """
+        Uploads the bits of a package while they are produced, such as the chunks of a ZipStream.
+        :param bits: the zip archive of the files that are not already known. It is iterated again if the request is sent again
+        :param resources: the files already known, with their path, mode, checksum and size_in_bytes
+        """
+        body = MultipartStream(
+            dict(resources=json.dumps(resources if resources is not None else [])),
+            dict(bits=("application.zip", bits, "application/zip")),
+        )
+        response = self.client.post(
+            "%s%s/%s/upload" % (self.target_endpoint, self.entity_uri, package_guid),
+            data=body,
+            headers={"Content-Type": body.content_type},
+        )
+        return self._read_response(response, None)
+
+    def upload_file(self, package_guid: str, bits_file: str, resources: list[dict] | None = None) -> Entity:
+        """
+        Uploads the bits of a package from a zip file, sent with its length rather than chunked.
+        :param bits_file: the path of the zip archive of the files that are not already known
+        :param resources: the files already known, with their path, mode, checksum and size_in_bytes
+        """
+        with open(bits_file, "rb") as binary_file:
+            response = self.client.post(
+                "%s%s/%s/upload" % (self.target_endpoint, self.entity_uri, package_guid),
+                data=dict(resources=json.dumps(resources if resources is not None else [])),
+                files=dict(
+                    bits=(
+                        "application.zip",
+                        binary_file,
+                        "application/zip",
+                        {"Content-Length": os.path.getsize(bits_file), "Content-Transfer-Encoding": "binary"},
+                    )
+                ),
+            )
+        return self._read_response(response, None)
+
     def copy(self,
              package_guid: str,
              app_guid: str,
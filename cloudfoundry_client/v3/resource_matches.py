@@ -0,0 +1,33 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from cloudfoundry_client.json_decoder import JsonDecoder
+
+if TYPE_CHECKING:
+    from cloudfoundry_client.client import CloudFoundryClient
+
+
+class ResourceMatchManager(object):
+    def __init__(self, target_endpoint: str, client: "CloudFoundryClient"):
+        self.target_endpoint = target_endpoint
+        self.client = client
+
+    def match(self, resources: list[dict]) -> list[dict]:
+        """
+        :param resources: the checksum (as dict(value=sha1)) and size_in_bytes of the resources
+        :return: the resources known by the cloud controller
+        """
+        response = self.client.post("%s/v3/resource_matches" % self.target_endpoint, json=dict(resources=resources))
+        return JsonDecoder.of(self.client).decode(response)["resources"]
+
+    def match_many(self, resources: list[dict], chunk_size: int = 1000, max_workers: int = 4) -> list[dict]:
+        """
+        Matches the resources by chunks of chunk_size, sent concurrently on at most max_workers threads.
+        """
+        chunks = [resources[start:start + chunk_size] for start in range(0, len(resources), chunk_size)]
+        if len(chunks) <= 1 or max_workers <= 1:
+            results = [self.match(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                results = list(executor.map(self.match, chunks))
+        return [resource for result in results for resource in result]
@@ -1,5 +1,7 @@
 from typing import TYPE_CHECKING
 
+import yaml
+
 from cloudfoundry_client.v3.entities import EntityManager, ToOneRelationship, Entity
 
 if TYPE_CHECKING:
@@ -31,5 +33,18 @@ class SpaceManager(EntityManager[Entity]):
             )
         )
 
+    def apply_manifest(self, space_guid: str, manifest: dict) -> str | None:
+        """
+        :param manifest: the manifest, with an applications entry
+        :return: the guid of the job applying the manifest
+        """
+        response = self.client.post(
+            "%s%s/%s/actions/apply_manifest" % (self.target_endpoint, self.entity_uri, space_guid),
+            data=yaml.safe_dump(manifest),
+            headers={"Content-Type": "application/x-yaml"},
+        )
+        job_location = self._location(response)
+        return self._extract_job_guid(job_location) if job_location is not None else None
+
     def remove(self, space_guid: str):
         super()._remove(space_guid)
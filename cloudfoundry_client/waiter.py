@@ -0,0 +1,94 @@
+import logging
+import random
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+_logger = logging.getLogger(__name__)
+
+POLLED_TYPE = TypeVar("POLLED_TYPE")
+
+
+class WaitTimeout(Exception):
+    pass
+
+
+class Waiter(object):
+    """
+    Polls something until it is done, such as a job or a build. The first intervals are short so that quick operations
+    are not waited for long after they ended, then they grow exponentially up to a cap. Each interval is jittered so
+    that the operations waited for concurrently are not polled at the same time.
+    """
+
+    INITIAL_INTERVAL = 0.25
+    MULTIPLIER = 2.0
+    MAX_INTERVAL = 10.0
+    JITTER = 0.1
+    TIMEOUT = 600.0
+
+    def __init__(
+        self,
+        initial_interval: float = INITIAL_INTERVAL,
+        max_interval: float = MAX_INTERVAL,
+        timeout: float | None = TIMEOUT,
+        jitter: float = JITTER,
+        step_function: Callable[[float], float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] | None = None,
+    ):
+        """
+        :param initial_interval: number of seconds before the second poll
+        :param max_interval: cap of the interval between two polls
+        :param timeout: number of seconds after which the wait fails with a WaitTimeout. None waits forever
+        :param jitter: ratio of each interval randomly added or removed
+        :param step_function: gives the next interval from the previous one, doubles it by default
+        :param clock: gives the current time in seconds
+        :param sleep: waits for a number of seconds, time.sleep by default
+        """
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.timeout = timeout
+        self.jitter = jitter
+        self.step_function = step_function if step_function is not None else lambda interval: interval * Waiter.MULTIPLIER
+        self.clock = clock
+        self.sleep = sleep
+
+    def wait(
+        self,
+        poll: Callable[[], POLLED_TYPE],
+        is_done: Callable[[POLLED_TYPE], bool],
+        state: Callable[[POLLED_TYPE], Any] | None = None,
+        on_state_change: Callable[[POLLED_TYPE], None] | None = None,
+    ) -> POLLED_TYPE:
+        """
+        :param poll: gets the current value, such as the job
+        :param is_done: tells whether the value polled is the last one. It is done either in success or in error
+        :param state: gives the state of the value polled, compared to the previous one
+        :param on_state_change: called with the value polled each time its state changes, the first one included
+        :return: the last value polled
+        """
+        deadline = self.clock() + self.timeout if self.timeout is not None else None
+        interval = self.initial_interval
+        previous_state = None
+        polls = 0
+        while True:
+            polled = poll()
+            polls += 1
+            if on_state_change is not None:
+                current_state = state(polled) if state is not None else polled
+                if polls == 1 or current_state != previous_state:
+                    on_state_change(polled)
+                previous_state = current_state
+            if is_done(polled):
+                return polled
+            delay = interval
+            if self.jitter > 0:
+                delay = min(interval * (1 + random.uniform(-self.jitter, self.jitter)), self.max_interval)
+            if deadline is not None:
+                remaining = deadline - self.clock()
+                if remaining <= 0:
+                    raise WaitTimeout("Not done after %d polls in %.1f seconds" % (polls, self.timeout))
+                delay = min(delay, remaining)
+            _logger.debug("Polling again in %.2fs", delay)
+            (self.sleep or time.sleep)(delay)
+            interval = min(self.step_function(interval), self.max_interval)
@@ -69,7 +69,7 @@ class AbstractTestCase(object):
             del links["cloud_controller_v2"]
         if not with_v3:
             del links["cloud_controller_v3"]
-        requests.get.side_effect = [
+        requests.Session.return_value.get.side_effect = [
             MockResponse(
                 "%s/" % AbstractTestCase.TARGET_ENDPOINT,
                 status_code=HTTPStatus.OK.value,
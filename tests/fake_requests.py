@@ -14,6 +14,8 @@ class MockSession(object):
         self.proxies = None
         self.verify = True
         self.trust_env = False
+        self.get = MagicMock()
+        self.mount = MagicMock()
 
 
 class MockResponse(object):
@@ -21,6 +23,8 @@ class MockResponse(object):
         self.status_code = status_code
         self.url = url
         self.text = text
+        self.content = text.encode("utf-8") if isinstance(text, str) else text
+        self.encoding = None
         self.headers = dict()
         self.is_redirect = status_code == HTTPStatus.SEE_OTHER
         if headers is not None:
@@ -43,3 +47,16 @@ class FakeRequests(object):
         self.get = MagicMock()
         self.put = MagicMock()
         self.patch = MagicMock()
+
+
+class FakeClock(object):
+    def __init__(self, now: float = 0.0):
+        self.now = now
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
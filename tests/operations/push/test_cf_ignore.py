@@ -49,3 +49,49 @@ class TestCfIgnore(TestCase):
             self.assertTrue(cf_ignore.is_entry_ignored("/some/sub/directory/containing/ignored/directory/resource.file"))
             # File in fact
             self.assertFalse(cf_ignore.is_entry_ignored("ignored/resource.file"))
+
+    def test_ignore_with_negation(self):
+        cf_ignore = CfIgnore(ignore_lines=["# logs", "", "*.log", "!important.log", "logs/", "!logs/kept.log"])
+
+        self.assertTrue(cf_ignore.is_entry_ignored("debug.log"))
+        self.assertFalse(cf_ignore.is_entry_ignored("important.log"))
+        self.assertFalse(cf_ignore.is_entry_ignored("sub/important.log"))
+        self.assertFalse(cf_ignore.is_entry_ignored("# logs"))
+        # a file in an ignored directory cannot be included again
+        self.assertTrue(cf_ignore.is_entry_ignored("logs/kept.log"))
+        self.assertTrue(cf_ignore.is_directory_ignored("sub/logs"))
+        self.assertFalse(cf_ignore.is_file_ignored("sub/logs"))
+
+    def test_ignore_anchored(self):
+        cf_ignore = CfIgnore(ignore_lines=["/build", "/node_modules/"])
+
+        self.assertTrue(cf_ignore.is_entry_ignored("build"))
+        self.assertTrue(cf_ignore.is_entry_ignored("build/output.txt"))
+        self.assertTrue(cf_ignore.is_entry_ignored("node_modules/module/index.js"))
+        self.assertFalse(cf_ignore.is_entry_ignored("src/build"))
+        self.assertFalse(cf_ignore.is_entry_ignored("src/node_modules/module/index.js"))
+
+    def test_ignore_globs(self):
+        cf_ignore = CfIgnore(ignore_lines=["docs/**/*.md", "file-?.[ch]", "tmp[!0-9]", "\\!bang"])
+
+        self.assertTrue(cf_ignore.is_entry_ignored("docs/readme.md"))
+        self.assertTrue(cf_ignore.is_entry_ignored("docs/api/v2/readme.md"))
+        self.assertFalse(cf_ignore.is_entry_ignored("readme.md"))
+        self.assertTrue(cf_ignore.is_entry_ignored("file-1.c"))
+        self.assertTrue(cf_ignore.is_entry_ignored("src/file-2.h"))
+        self.assertFalse(cf_ignore.is_entry_ignored("file-10.c"))
+        self.assertTrue(cf_ignore.is_entry_ignored("tmpa"))
+        self.assertFalse(cf_ignore.is_entry_ignored("tmp1"))
+        self.assertTrue(cf_ignore.is_entry_ignored("!bang"))
+
+    def test_star_does_not_match_separators(self):
+        cf_ignore = CfIgnore(ignore_lines=["src/*.py"])
+
+        self.assertTrue(cf_ignore.is_entry_ignored("src/main.py"))
+        self.assertFalse(cf_ignore.is_entry_ignored("src/package/main.py"))
+
+    def test_no_rules(self):
+        cf_ignore = CfIgnore()
+
+        self.assertFalse(cf_ignore.is_entry_ignored("any/file"))
+        self.assertFalse(cf_ignore.is_directory_ignored("any"))
@@ -0,0 +1,111 @@
+from unittest import TestCase
+from unittest.mock import call, patch
+
+from abstract_test_case import AbstractTestCase
+from cloudfoundry_client.operations.push.deployment import DeploymentOperation
+from cloudfoundry_client.v3.deployments import DeploymentStrategy
+
+
+def deployment(reason: str, value: str = "ACTIVE", step: int | None = None) -> dict:
+    status = dict(value=value, reason=reason)
+    if step is not None:
+        status["canary"] = dict(steps=dict(current=step, total=2))
+    return dict(guid="deployment-guid", status=status)
+
+
+@patch("time.sleep", lambda seconds: None)
+class TestDeploymentOperation(TestCase, AbstractTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_client_class()
+
+    def setUp(self):
+        self.build_client()
+
+    def test_deploy(self):
+        progress = []
+        operation = DeploymentOperation(self.client, max_in_flight=2, on_progress=lambda polled: progress.append(polled))
+        with patch.object(
+            self.client.v3.deployments, "create", return_value=deployment("DEPLOYING")
+        ) as mock_create, patch.object(
+            self.client.v3.deployments,
+            "get",
+            side_effect=[deployment("DEPLOYING"), deployment("DEPLOYING"), deployment("DEPLOYED", "FINALIZED")],
+        ):
+            result = operation.deploy("app-guid", "droplet-guid")
+
+        mock_create.assert_called_once_with(
+            "app-guid", droplet_guid="droplet-guid", strategy=DeploymentStrategy.ROLLING, max_in_flight=2, canary_steps=None
+        )
+        self.assertEqual("DEPLOYED", result["status"]["reason"])
+        self.assertEqual(["DEPLOYING", "DEPLOYED"], [polled["status"]["reason"] for polled in progress])
+        self.assertEqual(["DEPLOYING", "DEPLOYED"], [phase for phase, _ in operation.timings()["app-guid"]])
+
+    def test_deploy_continues_canary_steps(self):
+        operation = DeploymentOperation(self.client, strategy=DeploymentStrategy.CANARY)
+        with patch.object(
+            self.client.v3.deployments, "create", return_value=deployment("DEPLOYING")
+        ), patch.object(
+            self.client.v3.deployments,
+            "get",
+            side_effect=[
+                deployment("PAUSED", step=1),
+                deployment("PAUSED", step=1),
+                deployment("PAUSED", step=2),
+                deployment("DEPLOYING"),
+                deployment("DEPLOYED", "FINALIZED"),
+            ],
+        ), patch.object(
+            self.client.v3.deployments, "continue_deployment"
+        ) as mock_continue:
+            operation.deploy("app-guid")
+
+        self.assertEqual([call("deployment-guid"), call("deployment-guid")], mock_continue.call_args_list)
+        self.assertEqual(
+            ["DEPLOYING", "PAUSED 1/2", "PAUSED 2/2", "DEPLOYING", "DEPLOYED"],
+            [phase for phase, _ in operation.timings()["app-guid"]],
+        )
+
+    def test_deploy_left_paused(self):
+        operation = DeploymentOperation(self.client, strategy=DeploymentStrategy.CANARY, auto_continue=False)
+        with patch.object(
+            self.client.v3.deployments, "create", return_value=deployment("DEPLOYING")
+        ), patch.object(
+            self.client.v3.deployments, "get", return_value=deployment("PAUSED", step=1)
+        ), patch.object(
+            self.client.v3.deployments, "continue_deployment"
+        ) as mock_continue:
+            result = operation.deploy("app-guid")
+
+        mock_continue.assert_not_called()
+        self.assertEqual("PAUSED", result["status"]["reason"])
+
+    def test_deploy_canceled(self):
+        operation = DeploymentOperation(self.client)
+        with patch.object(
+            self.client.v3.deployments, "create", return_value=deployment("DEPLOYING")
+        ), patch.object(
+            self.client.v3.deployments, "get", return_value=deployment("CANCELED", "FINALIZED")
+        ):
+            self.assertRaisesRegex(AssertionError, "ended with CANCELED", operation.deploy, "app-guid")
+
+    def test_deploy_package(self):
+        operation = DeploymentOperation(self.client)
+        with patch.object(
+            self.client.v3.builds, "create", return_value=dict(guid="build-guid", state="STAGING")
+        ), patch.object(
+            self.client.v3.builds,
+            "get",
+            side_effect=[
+                dict(guid="build-guid", state="STAGING"),
+                dict(guid="build-guid", state="STAGED", droplet=dict(guid="d")),
+            ],
+        ), patch.object(
+            self.client.v3.deployments, "create", return_value=deployment("DEPLOYED", "FINALIZED")
+        ) as mock_create, patch.object(
+            self.client.v3.deployments, "get", return_value=deployment("DEPLOYED", "FINALIZED")
+        ):
+            operation.deploy_package("app-guid", "package-guid")
+
+        self.assertEqual("d", mock_create.call_args.kwargs["droplet_guid"])
+        self.assertEqual(["STAGING", "DEPLOYED"], [phase for phase, _ in operation.timings()["app-guid"]])
@@ -1,10 +1,13 @@
+import io
 import os
 import shutil
 import tempfile
 import zipfile
 from unittest import TestCase
+from unittest.mock import call, patch
 
-from cloudfoundry_client.operations.push.file_helper import FileHelper
+from cloudfoundry_client.operations.push.cf_ignore import CfIgnore
+from cloudfoundry_client.operations.push.file_helper import FileHelper, ZipCopyStream, ZipStream
 
 
 class TestUnzipHelper(TestCase):
@@ -44,3 +47,136 @@ class TestUnzipHelper(TestCase):
         self.assertTrue(os.path.isfile(os.path.join(self.output_dirpath, "file.txt")))
         self.assertTrue(os.path.isdir(os.path.join(self.output_dirpath, "some_dir")))
         self.assertTrue(os.path.isdir(os.path.join(self.output_dirpath, "some_dir", "subdir")))
+
+
+class TestZipStream(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.directory, "some_dir"))
+        with open(os.path.join(self.directory, "small.txt"), "wb") as f:
+            f.write(b"small content")
+        with open(os.path.join(self.directory, "some_dir", "large.bin"), "wb") as f:
+            f.write(os.urandom(3 * ZipStream.CHUNK_SIZE))
+        with open(os.path.join(self.directory, "some_dir", "ignored.txt"), "wb") as f:
+            f.write(b"ignored")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_zip_stream(self):
+        stream = FileHelper.zip_stream(self.directory, lambda path: path != os.path.join("some_dir", "ignored.txt"))
+
+        chunks = list(stream)
+
+        self.assertGreater(len(chunks), 3)
+        with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as archive:
+            self.assertEqual(["small.txt", "some_dir/", "some_dir/large.bin"], sorted(archive.namelist()))
+            self.assertIsNone(archive.testzip())
+            self.assertEqual(b"small content", archive.read("small.txt"))
+            with open(os.path.join(self.directory, "some_dir", "large.bin"), "rb") as f:
+                self.assertEqual(f.read(), archive.read("some_dir/large.bin"))
+
+    def test_zip_stream_in_parallel(self):
+        with open(os.path.join(self.directory, "some_dir", "library.jar"), "wb") as f:
+            f.write(b"already compressed" * 1000)
+        sequential = b"".join(FileHelper.zip_stream(self.directory))
+
+        with patch.object(ZipStream, "BUFFERED_MAX_SIZE", 2 * ZipStream.CHUNK_SIZE):
+            parallel = b"".join(FileHelper.zip_stream(self.directory, workers=4))
+
+        with zipfile.ZipFile(io.BytesIO(sequential)) as sequential_archive, zipfile.ZipFile(io.BytesIO(parallel)) as archive:
+            self.assertIsNone(archive.testzip())
+            self.assertEqual(sequential_archive.namelist(), archive.namelist())
+            for name in archive.namelist():
+                self.assertEqual(sequential_archive.read(name), archive.read(name))
+                self.assertEqual(sequential_archive.getinfo(name).compress_type, archive.getinfo(name).compress_type)
+            self.assertEqual(zipfile.ZIP_STORED, archive.getinfo("some_dir/library.jar").compress_type)
+            self.assertEqual(zipfile.ZIP_DEFLATED, archive.getinfo("small.txt").compress_type)
+
+    def test_zip_stream_can_be_read_again(self):
+        stream = FileHelper.zip_stream(self.directory)
+
+        first = b"".join(stream)
+        second = b"".join(stream)
+
+        with zipfile.ZipFile(io.BytesIO(first)) as first_archive, zipfile.ZipFile(io.BytesIO(second)) as second_archive:
+            self.assertEqual(sorted(first_archive.namelist()), sorted(second_archive.namelist()))
+
+
+class TestZipCopyStream(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.zip_location = os.path.join(self.directory, "application.zip")
+        self.contents = {"app.py": b"print('hello')" * 100, "lib/data.bin": os.urandom(3 * ZipCopyStream.CHUNK_SIZE)}
+        with zipfile.ZipFile(self.zip_location, "w", zipfile.ZIP_DEFLATED) as archive:
+            # ZipFile.mkdir only exists from python 3.11
+            directory = zipfile.ZipInfo("lib/")
+            directory.external_attr = 0o40775 << 16 | 0x10
+            archive.writestr(directory, b"")
+            archive.writestr("app.py", self.contents["app.py"])
+            archive.writestr("lib/data.bin", self.contents["lib/data.bin"], zipfile.ZIP_STORED)
+            archive.writestr("ignored.txt", b"ignored")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_zip_copy_stream(self):
+        stream = FileHelper.zip_copy_stream(self.zip_location, lambda name: name != "ignored.txt")
+
+        copied = b"".join(stream)
+
+        with zipfile.ZipFile(io.BytesIO(copied)) as archive, zipfile.ZipFile(self.zip_location) as source:
+            self.assertEqual(["app.py", "lib/", "lib/data.bin"], sorted(archive.namelist()))
+            self.assertIsNone(archive.testzip())
+            for name, content in self.contents.items():
+                self.assertEqual(content, archive.read(name))
+                self.assertEqual(source.getinfo(name).compress_type, archive.getinfo(name).compress_type)
+                self.assertEqual(source.getinfo(name).compress_size, archive.getinfo(name).compress_size)
+
+    def test_zip_copy_stream_of_streamed_archive(self):
+        application_directory = os.path.join(self.directory, "application")
+        FileHelper.unzip(self.zip_location, application_directory)
+        # the entries are followed by data descriptors
+        streamed_location = os.path.join(self.directory, "streamed.zip")
+        with open(streamed_location, "wb") as f:
+            for chunk in FileHelper.zip_stream(application_directory):
+                f.write(chunk)
+        with zipfile.ZipFile(streamed_location) as streamed:
+            self.assertTrue(streamed.getinfo("lib/data.bin").flag_bits & 0x08)
+
+        copied = b"".join(FileHelper.zip_copy_stream(streamed_location))
+
+        with zipfile.ZipFile(io.BytesIO(copied)) as archive:
+            self.assertIsNone(archive.testzip())
+            self.assertEqual(self.contents["lib/data.bin"], archive.read("lib/data.bin"))
+
+
+class TestWalkWithCfIgnore(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        for relative_path in ["app.py", "debug.log", "node_modules/module/index.js", "src/main.py", "src/node_modules/kept.js"]:
+            os.makedirs(os.path.dirname(os.path.join(self.directory, relative_path)), exist_ok=True)
+            with open(os.path.join(self.directory, relative_path), "w") as f:
+                f.write(relative_path)
+        self.cf_ignore = CfIgnore(ignore_lines=["/node_modules/", "*.log"])
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_walk(self):
+        with patch.object(self.cf_ignore, "is_directory_ignored", wraps=self.cf_ignore.is_directory_ignored) as spy:
+            walked = {
+                os.path.join(dir_path, file_name)
+                for dir_path, file_names in FileHelper.walk(self.directory, self.cf_ignore)
+                for file_name in file_names
+            }
+
+        self.assertEqual({"app.py", os.path.join("src", "main.py"), os.path.join("src", "node_modules", "kept.js")}, walked)
+        # the ignored directory is not walked
+        self.assertIn(call("node_modules"), spy.call_args_list)
+        self.assertNotIn(call(os.path.join("node_modules", "module")), spy.call_args_list)
+
+    def test_scan(self):
+        scanned = {relative_path for relative_path, _ in FileHelper.scan(self.directory, cf_ignore=self.cf_ignore)}
+
+        self.assertEqual({"app.py", os.path.join("src", "main.py"), os.path.join("src", "node_modules", "kept.js")}, scanned)
@@ -0,0 +1,72 @@
+import os
+import tempfile
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from cloudfoundry_client.operations.push.fingerprint_cache import FingerprintCache
+from cloudfoundry_client.operations.push.push import PushOperation
+
+
+class TestFingerprintCache(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.directory.name, "cache", "fingerprints.json")
+        self.file = os.path.join(self.directory.name, "file.txt")
+        self._write("content")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_fingerprint_is_saved(self):
+        cache = FingerprintCache(self.cache_file)
+        cache.put("file.txt", os.stat(self.file), "sha1")
+        cache.save()
+        self.assertEqual("sha1", FingerprintCache(self.cache_file).get("file.txt", os.stat(self.file)))
+
+    def test_modified_file_is_not_found(self):
+        cache = FingerprintCache(self.cache_file)
+        cache.put("file.txt", os.stat(self.file), "sha1")
+        cache.save()
+        self._write("other content")
+        self.assertIsNone(FingerprintCache(self.cache_file).get("file.txt", os.stat(self.file)))
+
+    def test_recently_modified_file_is_not_remembered(self):
+        self._write("content", age=0)
+        cache = FingerprintCache(self.cache_file)
+        cache.put("file.txt", os.stat(self.file), "sha1")
+        cache.save()
+        self.assertIsNone(FingerprintCache(self.cache_file).get("file.txt", os.stat(self.file)))
+
+    def test_unused_fingerprints_are_dropped(self):
+        cache = FingerprintCache(self.cache_file)
+        cache.put("file.txt", os.stat(self.file), "sha1")
+        cache.save()
+        FingerprintCache(self.cache_file).save()
+        self.assertIsNone(FingerprintCache(self.cache_file).get("file.txt", os.stat(self.file)))
+
+    def test_corrupted_cache_is_ignored(self):
+        os.makedirs(os.path.dirname(self.cache_file))
+        with open(self.cache_file, "w") as f:
+            f.write("{not json")
+        self.assertIsNone(FingerprintCache(self.cache_file).get("file.txt", os.stat(self.file)))
+
+    def test_unchanged_files_are_not_hashed_again(self):
+        application_directory = os.path.join(self.directory.name, "application")
+        os.makedirs(application_directory)
+        for name in ["first.txt", "second.txt"]:
+            self._write(name, path=os.path.join(application_directory, name))
+        first_push = PushOperation._load_all_resources(application_directory, 1, FingerprintCache(self.cache_file))
+        self._write("modified", path=os.path.join(application_directory, "second.txt"))
+        with patch("cloudfoundry_client.operations.push.file_helper.FileHelper.sha1", return_value="new-sha1") as sha1:
+            second_push = PushOperation._load_all_resources(application_directory, 1, FingerprintCache(self.cache_file))
+        sha1.assert_called_once_with(os.path.join(application_directory, "second.txt"))
+        self.assertEqual(first_push["first.txt"], second_push["first.txt"])
+        self.assertEqual("new-sha1", second_push["second.txt"]["sha1"])
+
+    def _write(self, content: str, path: str | None = None, age: float = 10.0):
+        path = path if path is not None else self.file
+        with open(path, "w") as f:
+            f.write(content)
+        modification_time = time.time() - age
+        os.utime(path, (modification_time, modification_time))
@@ -1,13 +1,23 @@
+import hashlib
+import io
+import os
 import sys
+import tempfile
+import threading
+import zipfile
+from http import HTTPStatus
 from unittest import TestCase
 from unittest.mock import patch, MagicMock
 
 import cloudfoundry_client.main.main as main
 from abstract_test_case import AbstractTestCase
-from cloudfoundry_client.operations.push.push import PushOperation
+from cloudfoundry_client.errors import InvalidStatusCode
+from cloudfoundry_client.operations.push.push import PushError, PushLookups, PushOperation
 
 
 class TestPushOperation(TestCase, AbstractTestCase):
+    SPACE = dict(metadata=dict(guid="space_id"))
+
     @classmethod
     def setUpClass(cls):
         cls.mock_client_class()
@@ -15,6 +25,232 @@ class TestPushOperation(TestCase, AbstractTestCase):
     def setUp(self):
         self.build_client()
 
+    def test_load_all_resources(self):
+        with tempfile.TemporaryDirectory() as top_directory:
+            os.makedirs(os.path.join(top_directory, "sub", "ignored"))
+            contents = {"app.py": b"print('hello')", os.path.join("sub", "data.bin"): os.urandom(200 * 1024)}
+            for relative_path, content in contents.items():
+                with open(os.path.join(top_directory, relative_path), "wb") as f:
+                    f.write(content)
+            with open(os.path.join(top_directory, "sub", "ignored", "file.txt"), "w") as f:
+                f.write("ignored")
+            with open(os.path.join(top_directory, ".cfignore"), "w") as f:
+                f.write("ignored/\n")
+            os.chmod(os.path.join(top_directory, "app.py"), 0o755)
+
+            sequential = PushOperation._load_all_resources(top_directory)
+            parallel = PushOperation._load_all_resources(top_directory, hash_workers=4)
+
+            self.assertEqual(sequential, parallel)
+            self.assertEqual({"app.py", ".cfignore", os.path.join("sub", "data.bin")}, set(parallel))
+            for relative_path, content in contents.items():
+                self.assertEqual(hashlib.sha1(content).hexdigest(), parallel[relative_path]["sha1"])
+                self.assertEqual(len(content), parallel[relative_path]["size"])
+            self.assertEqual("755", parallel["app.py"]["mode"])
+
+    def test_load_all_zip_resources(self):
+        with tempfile.TemporaryDirectory() as top_directory:
+            zip_location = os.path.join(top_directory, "application.zip")
+            contents = {"app.py": b"print('hello')", "sub/data.bin": os.urandom(200 * 1024)}
+            with zipfile.ZipFile(zip_location, "w", zipfile.ZIP_DEFLATED) as archive:
+                # ZipFile.mkdir only exists from python 3.11
+                directory = zipfile.ZipInfo("sub/")
+                directory.external_attr = 0o40775 << 16 | 0x10
+                archive.writestr(directory, b"")
+                for name, content in contents.items():
+                    archive.writestr(name, content)
+                archive.writestr("sub/ignored/file.txt", b"ignored")
+                archive.writestr(".cfignore", b"ignored/\n")
+                executable = zipfile.ZipInfo("run.sh")
+                executable.external_attr = 0o100755 << 16
+                archive.writestr(executable, b"#!/bin/sh")
+
+            sequential = PushOperation._load_all_zip_resources(zip_location)
+            parallel = PushOperation._load_all_zip_resources(zip_location, hash_workers=4)
+
+            self.assertEqual(sequential, parallel)
+            self.assertEqual({"app.py", ".cfignore", "sub/data.bin", "run.sh"}, set(parallel))
+            for name, content in contents.items():
+                self.assertEqual(hashlib.sha1(content).hexdigest(), parallel[name]["sha1"])
+                self.assertEqual(len(content), parallel[name]["size"])
+            self.assertEqual("755", parallel["run.sh"]["mode"])
+
+    def test_push_concurrently(self):
+        app_manifests = [dict(name="app-%d" % i, docker=dict(image="image")) for i in range(4)] + [dict(name="no-bits")]
+        push_operation = PushOperation(self.client)
+        barrier = threading.Barrier(4, timeout=5)
+
+        def push_application(lookups: PushLookups, app_manifest: dict, restart: bool) -> dict:
+            # all the applications are being pushed at the same time
+            barrier.wait()
+            return dict(name=app_manifest["name"], space=lookups.space)
+
+        with patch(
+            "cloudfoundry_client.operations.push.push.ManifestReader.load_application_manifests", return_value=app_manifests
+        ), patch.object(
+            push_operation, "_retrieve_space_and_organization", return_value=("organization", self.SPACE)
+        ), patch.object(
+            push_operation, "_push_application", side_effect=push_application
+        ), patch.object(
+            self.client.name_resolver, "resolve_many"
+        ):
+            pushed = push_operation.push("space_id", "manifest.yml", max_workers=4)
+
+        self.assertEqual(["app-0", "app-1", "app-2", "app-3"], list(pushed))
+        self.assertEqual(dict(name="app-2", space=self.SPACE), pushed["app-2"])
+
+    def test_push_concurrently_aggregates_errors(self):
+        app_manifests = [dict(name="app-%d" % i, docker=dict(image="image")) for i in range(3)]
+        push_operation = PushOperation(self.client)
+
+        def push_application(lookups: PushLookups, app_manifest: dict, restart: bool) -> dict:
+            if app_manifest["name"] != "app-1":
+                raise AssertionError("Failure of %s" % app_manifest["name"])
+            return dict(name=app_manifest["name"])
+
+        with patch(
+            "cloudfoundry_client.operations.push.push.ManifestReader.load_application_manifests", return_value=app_manifests
+        ), patch.object(
+            push_operation, "_retrieve_space_and_organization", return_value=("organization", self.SPACE)
+        ), patch.object(
+            push_operation, "_push_application", side_effect=push_application
+        ) as mock_push_application, patch.object(
+            self.client.name_resolver, "resolve_many"
+        ):
+            with self.assertRaises(PushError) as context:
+                push_operation.push("space_id", "manifest.yml", max_workers=2)
+
+        self.assertEqual(3, mock_push_application.call_count)
+        self.assertEqual({"app-0", "app-2"}, set(context.exception.errors))
+        self.assertEqual("Failure of app-2", str(context.exception.errors["app-2"]))
+        self.assertIsInstance(context.exception, AssertionError)
+
+    def test_push_deploys_started_application(self):
+        deployment_operation = MagicMock()
+        push_operation = PushOperation(self.client, deployment_operation=deployment_operation)
+        app = MagicMock()
+        app.__getitem__.side_effect = dict(metadata=dict(guid="app-guid"), entity=dict(name="app", state="STARTED")).__getitem__
+
+        with patch.object(push_operation, "_init_application", return_value=app), patch.object(
+            push_operation, "_route_application"
+        ), patch.object(push_operation, "_bind_services"), patch.object(
+            self.client.v3.apps, "list_packages", return_value=iter([dict(guid="package-guid")])
+        ) as mock_list_packages:
+            push_operation._push_application(MagicMock(), dict(name="app", docker=dict(image="image")), True)
+
+        mock_list_packages.assert_called_once_with("app-guid", order_by="-created_at", per_page=1)
+        deployment_operation.deploy_package.assert_called_once_with("app-guid", "package-guid")
+        app.stop.assert_not_called()
+        app.start.assert_not_called()
+
+    def test_upload_application_directory_from_file(self):
+        push_operation = PushOperation(self.client, use_fingerprint_cache=False)
+        app = dict(metadata=dict(guid="app_id"), entity=dict(name="app"))
+        uploaded = dict()
+
+        def upload(application_guid: str, resources: list, application: str, asynchronous: bool) -> dict:
+            with zipfile.ZipFile(application) as archive:
+                uploaded["names"] = archive.namelist()
+            uploaded["file"] = application
+            return dict(metadata=dict(guid="job-guid"), entity=dict(status="finished"))
+
+        with tempfile.TemporaryDirectory() as application_path:
+            with open(os.path.join(application_path, "app.py"), "w") as f:
+                f.write("print('hello')")
+            with patch.object(push_operation.resource_matcher, "match", return_value=set()), patch.object(
+                self.client.v2.apps, "upload", side_effect=upload
+            ), patch.object(self.client.v2.apps, "upload_stream") as mock_upload_stream:
+                push_operation._upload_application(app, application_path)
+
+        self.assertEqual(["app.py"], uploaded["names"])
+        # the temporary zip file is removed once uploaded
+        self.assertFalse(os.path.exists(uploaded["file"]))
+        mock_upload_stream.assert_not_called()
+
+    def test_upload_application_directory_streamed(self):
+        push_operation = PushOperation(self.client, use_fingerprint_cache=False, stream_uploads=True)
+        app = dict(metadata=dict(guid="app_id"), entity=dict(name="app"))
+        uploaded = dict()
+
+        def upload_stream(application_guid: str, resources: list, application, asynchronous: bool) -> dict:
+            with zipfile.ZipFile(io.BytesIO(b"".join(application))) as archive:
+                uploaded["names"] = archive.namelist()
+            return dict(metadata=dict(guid="job-guid"), entity=dict(status="finished"))
+
+        with tempfile.TemporaryDirectory() as application_path:
+            with open(os.path.join(application_path, "app.py"), "w") as f:
+                f.write("print('hello')")
+            with patch.object(push_operation.resource_matcher, "match", return_value=set()), patch.object(
+                self.client.v2.apps, "upload_stream", side_effect=upload_stream
+            ), patch.object(self.client.v2.apps, "upload") as mock_upload:
+                push_operation._upload_application(app, application_path)
+
+        self.assertEqual(["app.py"], uploaded["names"])
+        mock_upload.assert_not_called()
+
+    @patch("time.sleep", lambda seconds: None)
+    def test_poll_job(self):
+        push_operation = PushOperation(self.client)
+        jobs = [dict(metadata=dict(guid="job-guid"), entity=dict(status=status)) for status in ["queued", "running", "finished"]]
+
+        with patch.object(self.client.v2.jobs, "get", side_effect=jobs[1:]) as mock_get:
+            push_operation._poll_job(jobs[0])
+
+        self.assertEqual(2, mock_get.call_count)
+
+    @patch("time.sleep", lambda seconds: None)
+    def test_poll_job_failed(self):
+        push_operation = PushOperation(self.client)
+        job = dict(metadata=dict(guid="job-guid"), entity=dict(status="failed", error_details=dict(code=1)))
+
+        with patch.object(self.client.v2.jobs, "get", return_value=job):
+            self.assertRaises(AssertionError, push_operation._poll_job, dict(job, entity=dict(status="queued")))
+
+    def test_init_application_looks_up_deleted_application_again(self):
+        push_operation = PushOperation(self.client)
+        self.client.name_resolver.remember(self.client.v2.apps, "app", "stale-guid", space_guid="space_id")
+        recreated = dict(metadata=dict(guid="new-guid"), entity=dict(name="app"))
+
+        def get(app_guid: str) -> dict:
+            if app_guid == "stale-guid":
+                raise InvalidStatusCode(HTTPStatus.NOT_FOUND, "not found")
+            return recreated
+
+        with patch.object(self.client.v2.apps, "get", side_effect=get), patch.object(
+            self.client.v2.apps, "list", return_value=iter([recreated])
+        ), patch.object(push_operation, "_update_application", side_effect=lambda app, app_manifest: app) as mock_update:
+            app = push_operation._init_application(self.SPACE, dict(name="app"))
+
+        self.assertIs(recreated, app)
+        mock_update.assert_called_once_with(recreated, dict(name="app"))
+        self.assertEqual("new-guid", self.client.name_resolver.resolve(self.client.v2.apps, "app", space_guid="space_id"))
+
+    def test_init_application_creates_deleted_application(self):
+        push_operation = PushOperation(self.client)
+        self.client.name_resolver.remember(self.client.v2.apps, "app", "stale-guid", space_guid="space_id")
+        created = dict(metadata=dict(guid="new-guid"), entity=dict(name="app"))
+
+        with patch.object(
+            self.client.v2.apps, "get", side_effect=InvalidStatusCode(HTTPStatus.NOT_FOUND, "not found")
+        ), patch.object(self.client.v2.apps, "list", return_value=iter([])), patch.object(
+            push_operation, "_create_application", return_value=created
+        ) as mock_create:
+            app = push_operation._init_application(self.SPACE, dict(name="app"))
+
+        self.assertIs(created, app)
+        mock_create.assert_called_once_with(self.SPACE, dict(name="app"))
+
+    def test_push_lookups_are_loaded_once(self):
+        organization = MagicMock()
+        organization.private_domains.return_value = iter([dict(entity=dict(name="private.domain"))])
+        lookups = PushLookups(self.client, organization, MagicMock())
+
+        with patch.object(self.client.v2.shared_domains, "list", return_value=iter([dict(entity=dict(name="shared"))])):
+            results = [lookups.private_domains() for _ in range(3)] + [lookups.shared_domains() for _ in range(3)]
+
+        organization.private_domains.assert_called_once()
+        self.assertEqual([[dict(entity=dict(name="private.domain"))]] * 3 + [[dict(entity=dict(name="shared"))]] * 3, results)
+
     def test_split_route_with_port_and_path(self):
         domain, port, path = PushOperation._split_route(dict(route="foo-((suffix)).apps.internal:666/some/path"))
         self.assertEqual("foo-((suffix)).apps.internal", domain)
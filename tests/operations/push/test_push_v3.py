@@ -0,0 +1,192 @@
+import os
+import tempfile
+import threading
+import zipfile
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from abstract_test_case import AbstractTestCase
+from cloudfoundry_client.operations.push.push import PushError
+from cloudfoundry_client.operations.push.push_v3 import PushOperationV3
+from cloudfoundry_client.v3.packages import PackageType
+
+
+class TestPushOperationV3(TestCase, AbstractTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_client_class()
+
+    def setUp(self):
+        self.build_client()
+
+    def test_applied_manifest(self):
+        applied = PushOperationV3._applied_manifest(
+            dict(
+                name="app",
+                path="/tmp/app",
+                memory=256,
+                disk_quota=1024,
+                routes=[dict(route="app.example.org")],
+                docker=dict(image="image", username="user", password="secret"),
+            )
+        )
+        self.assertEqual(
+            dict(
+                name="app",
+                memory="256M",
+                disk_quota="1024M",
+                routes=[dict(route="app.example.org")],
+                docker=dict(image="image", username="user"),
+            ),
+            applied,
+        )
+
+    def test_push(self):
+        with tempfile.TemporaryDirectory() as application_path:
+            with open(os.path.join(application_path, "app.py"), "w") as f:
+                f.write("print('hello')")
+            app_manifests = [dict(name="bits-app", path=application_path), dict(name="docker-app", docker=dict(image="image"))]
+            staging_started = threading.Event()
+            uploaded = dict()
+
+            def create_package(app_guid: str, package_type: PackageType, package_data: dict | None = None) -> dict:
+                if package_type == PackageType.DOCKER:
+                    # the bits application is staged while the docker one is uploaded
+                    self.assertTrue(staging_started.wait(5))
+                return dict(guid="package-%s" % app_guid, state="PROCESSING_UPLOAD")
+
+            def upload(package_guid: str, bits, resources: list) -> dict:
+                uploaded[package_guid] = b"".join(bits)
+                return dict(guid=package_guid)
+
+            def create_build(package_guid: str) -> dict:
+                staging_started.set()
+                return dict(guid="build-%s" % package_guid, state="STAGING")
+
+            push_operation = PushOperationV3(self.client, use_fingerprint_cache=False, stream_uploads=True)
+            with patch(
+                "cloudfoundry_client.operations.push.push_v3.ManifestReader.load_application_manifests",
+                return_value=app_manifests,
+            ), patch.object(
+                self.client.name_resolver, "resolve_many", return_value={"bits-app": "bits-guid"}
+            ), patch.object(
+                self.client.v3.apps, "create", return_value=dict(guid="docker-guid")
+            ) as mock_create_app, patch.object(
+                self.client.v3.spaces, "apply_manifest", return_value=None
+            ) as mock_apply_manifest, patch.object(
+                self.client.v3.packages, "create", side_effect=create_package
+            ) as mock_create_package, patch.object(
+                self.client.v3.packages, "upload", side_effect=upload
+            ), patch.object(
+                self.client.v3.packages, "get", side_effect=lambda guid: dict(guid=guid, state="READY")
+            ), patch.object(
+                self.client.v3.builds, "create", side_effect=create_build
+            ), patch.object(
+                self.client.v3.builds,
+                "get",
+                side_effect=lambda guid: dict(guid=guid, state="STAGED", droplet=dict(guid="droplet-%s" % guid)),
+            ), patch.object(
+                self.client.v3.apps, "set_current_droplet"
+            ) as mock_set_current_droplet, patch.object(
+                self.client.v3.apps, "restart", side_effect=lambda guid: dict(guid=guid, state="STARTED")
+            ), patch.object(
+                self.client.v3.resource_matches, "match_many", return_value=[]
+            ):
+                pushed = push_operation.push("space_id", "manifest.yml")
+
+        self.assertEqual(dict(guid="bits-guid", state="STARTED"), pushed["bits-app"])
+        self.assertEqual(dict(guid="docker-guid", state="STARTED"), pushed["docker-app"])
+        mock_create_app.assert_called_once_with("docker-app", "space_id", lifecycle=dict(type="docker", data={}))
+        mock_apply_manifest.assert_called_once_with(
+            "space_id", dict(applications=[dict(name="bits-app"), dict(name="docker-app", docker=dict(image="image"))])
+        )
+        mock_create_package.assert_any_call("docker-guid", PackageType.DOCKER, package_data=dict(image="image"))
+        self.assertIn(b"app.py", uploaded["package-bits-guid"])
+        mock_set_current_droplet.assert_any_call("bits-guid", "droplet-build-package-bits-guid")
+
+    def test_push_deploys_started_application(self):
+        deployment_operation = MagicMock()
+        push_operation = PushOperationV3(self.client, deployment_operation=deployment_operation)
+        with patch.object(
+            self.client.v3.builds, "create", return_value=dict(guid="build-guid")
+        ), patch.object(
+            self.client.v3.builds, "get", return_value=dict(guid="build-guid", state="STAGED", droplet=dict(guid="droplet-guid"))
+        ), patch.object(
+            self.client.v3.apps, "get", return_value=dict(guid="app-guid", state="STARTED")
+        ), patch.object(
+            self.client.v3.apps, "set_current_droplet"
+        ) as mock_set_current_droplet, patch.object(
+            self.client.v3.apps, "restart"
+        ) as mock_restart:
+            push_operation._stage("app-guid", dict(guid="package-guid"), True)
+
+        deployment_operation.deploy.assert_called_once_with("app-guid", "droplet-guid")
+        mock_set_current_droplet.assert_not_called()
+        mock_restart.assert_not_called()
+
+    def test_upload_package_from_file(self):
+        push_operation = PushOperationV3(self.client, use_fingerprint_cache=False)
+        uploaded = dict()
+
+        def upload_file(package_guid: str, bits_file: str, resources: list) -> dict:
+            with zipfile.ZipFile(bits_file) as archive:
+                uploaded["names"] = archive.namelist()
+            uploaded["file"] = bits_file
+            return dict(guid=package_guid)
+
+        with tempfile.TemporaryDirectory() as application_path:
+            with open(os.path.join(application_path, "app.py"), "w") as f:
+                f.write("print('hello')")
+            with patch.object(push_operation.resource_matcher, "match", return_value=set()), patch.object(
+                self.client.v3.packages, "upload_file", side_effect=upload_file
+            ), patch.object(self.client.v3.packages, "upload") as mock_upload:
+                push_operation._upload_package(dict(guid="package-guid"), application_path)
+
+        self.assertEqual(["app.py"], uploaded["names"])
+        self.assertFalse(os.path.exists(uploaded["file"]))
+        mock_upload.assert_not_called()
+
+    def test_init_applications_looks_up_remembered_applications_again(self):
+        push_operation = PushOperationV3(self.client)
+        self.client.name_resolver.remember(self.client.v3.apps, "app", "stale-guid", space_guids="space_id")
+
+        with patch.object(self.client.v3.apps, "list", return_value=iter([])) as mock_list, patch.object(
+            self.client.v3.apps, "create", return_value=dict(guid="new-guid")
+        ) as mock_create:
+            app_guids = push_operation._init_applications("space_id", [dict(name="app", path="/tmp/app")])
+
+        mock_list.assert_called_once()
+        mock_create.assert_called_once_with("app", "space_id", lifecycle=None)
+        self.assertEqual(dict(app="new-guid"), app_guids)
+
+    def test_push_aggregates_staging_failures(self):
+        app_manifests = [dict(name="app-%d" % i, docker=dict(image="image")) for i in range(2)]
+        push_operation = PushOperationV3(self.client)
+
+        def get_build(guid: str) -> dict:
+            if guid == "build-package-guid-app-0":
+                return dict(guid=guid, type="build", state="FAILED", error="NoAppDetectedError")
+            return dict(guid=guid, state="STAGED", droplet=dict(guid="droplet"))
+
+        with patch(
+            "cloudfoundry_client.operations.push.push_v3.ManifestReader.load_application_manifests", return_value=app_manifests
+        ), patch.object(
+            self.client.name_resolver, "resolve_many", return_value={"app-0": "guid-app-0", "app-1": "guid-app-1"}
+        ), patch.object(
+            self.client.v3.spaces, "apply_manifest", return_value=None
+        ), patch.object(
+            self.client.v3.packages, "create", side_effect=lambda app_guid, *args, **kwargs: dict(guid="package-%s" % app_guid)
+        ), patch.object(
+            self.client.v3.builds, "create", side_effect=lambda package_guid: dict(guid="build-%s" % package_guid)
+        ), patch.object(
+            self.client.v3.builds, "get", side_effect=get_build
+        ), patch.object(
+            self.client.v3.apps, "set_current_droplet"
+        ), patch.object(
+            self.client.v3.apps, "get", side_effect=lambda guid: dict(guid=guid)
+        ):
+            with self.assertRaises(PushError) as context:
+                push_operation.push("space_id", "manifest.yml", restart=False, max_workers=2)
+
+        self.assertEqual({"app-0"}, set(context.exception.errors))
+        self.assertIn("NoAppDetectedError", str(context.exception.errors["app-0"]))
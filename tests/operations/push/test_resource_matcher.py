@@ -0,0 +1,38 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from cloudfoundry_client.operations.push.resource_matcher import ResourceMatcher
+
+
+class TestResourceMatcher(TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.v2.resources.match_many.side_effect = lambda items, chunk_size, max_workers: [
+            item for item in items if item["sha1"].startswith("known")
+        ]
+        self.matcher = ResourceMatcher(self.client, minimum_size=10, maximum_size=1000, chunk_size=100, max_workers=2)
+
+    def test_match(self):
+        descriptions = {
+            "known.txt": dict(sha1="known-1", size=100, mode="644"),
+            "copy-of-known.txt": dict(sha1="known-1", size=100, mode="644"),
+            "unknown.txt": dict(sha1="unknown", size=100, mode="644"),
+            "small.txt": dict(sha1="known-small", size=1, mode="644"),
+            "large.bin": dict(sha1="known-large", size=1001, mode="644"),
+        }
+
+        matched = self.matcher.match(descriptions)
+
+        self.assertEqual({"known.txt", "copy-of-known.txt"}, matched)
+        self.client.v2.resources.match_many.assert_called_once()
+        items, chunk_size, max_workers = self.client.v2.resources.match_many.call_args.args
+        self.assertEqual(
+            sorted([dict(sha1="known-1", size=100), dict(sha1="unknown", size=100)], key=lambda item: item["sha1"]),
+            sorted(items, key=lambda item: item["sha1"]),
+        )
+        self.assertEqual((100, 2), (chunk_size, max_workers))
+        self.assertEqual(dict(files=5, looked_up=2, matched=2, match_ratio=0.4), self.matcher.counters())
+
+    def test_match_without_candidates(self):
+        self.assertEqual(set(), self.matcher.match(dict(small=dict(sha1="known", size=1, mode="644"))))
+        self.assertEqual(dict(files=1, looked_up=0, matched=0, match_ratio=0.0), self.matcher.counters())
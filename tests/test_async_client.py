@@ -0,0 +1,115 @@
+import asyncio
+import json
+import unittest
+from http import HTTPStatus
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from abstract_test_case import AbstractTestCase
+from cloudfoundry_client.async_client import AsyncCloudFoundryClient
+from cloudfoundry_client.common_objects import BufferedResponse
+from cloudfoundry_client.errors import InvalidStatusCode
+from cloudfoundry_client.retry_policy import RetryPolicy
+from cloudfoundry_client.v2.async_entities import AsyncEntity as AsyncEntityV2
+from cloudfoundry_client.v3.async_entities import AsyncEntity
+
+
+class TestAsyncCloudFoundryClient(unittest.TestCase, AbstractTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_client_class()
+
+    def setUp(self):
+        self.build_client()
+        self.async_client = AsyncCloudFoundryClient(self.client)
+
+    @staticmethod
+    def async_response(uri: str, status_code: HTTPStatus, headers: dict | None, *path_parts: str) -> BufferedResponse:
+        response = AbstractTestCase.mock_response(uri, status_code, headers, *path_parts)
+        return BufferedResponse(response.url, response.status_code, response.headers, response.text.encode("utf-8"), "utf-8")
+
+    def test_managers_mirror_synchronous_ones(self):
+        self.assertEqual("/v3/apps", self.async_client.v3.apps.entity_uri)
+        self.assertEqual("/v3/service_instances", self.async_client.v3.service_instances.entity_uri)
+        self.assertEqual("/v2/apps", self.async_client.v2.apps.entity_uri)
+        self.assertEqual("/v2/shared_domains", self.async_client.v2.shared_domains.entity_uri)
+
+    def test_list_v3_pages(self):
+        async def list_guids():
+            return [app["guid"] async for app in await self.async_client.v3.apps.list()]
+
+        with patch.object(self.async_client, "_send", new=AsyncMock()) as send:
+            send.side_effect = [
+                self.async_response("/fake", HTTPStatus.OK, None, "v3", "fake", "GET_multi_page_0_response.json"),
+                self.async_response("/fake/last", HTTPStatus.OK, None, "v3", "fake", "GET_multi_page_1_response.json"),
+            ]
+            guids = asyncio.run(list_guids())
+            self.assertEqual(4, len(guids))
+            self.assertEqual("%s/v3/apps" % self.TARGET_ENDPOINT, send.call_args_list[0].args[1])
+            self.assertEqual("http://somewhere.org/fake/last?page=2&per_page=2", send.call_args_list[1].args[1])
+
+    def test_list_v3_does_not_prefetch(self):
+        with patch.object(self.async_client, "_send", new=AsyncMock()) as send:
+            self.assertRaises(ValueError, asyncio.run, self.async_client.v3.apps.list(prefetch=2))
+            send.assert_not_called()
+
+    def test_get_v3_with_navigable_links(self):
+        async def get_space():
+            app = await self.async_client.v3.apps.get("app_id")
+            return app, await app.space()
+
+        with patch.object(self.async_client, "_send", new=AsyncMock()) as send:
+            send.side_effect = [
+                self.async_response("/v3/apps/app_id", HTTPStatus.OK, None, "v3", "apps", "GET_{id}_response.json"),
+                self.async_response("/v3/spaces/space_id", HTTPStatus.OK, None, "v3", "spaces", "GET_{id}_response.json"),
+            ]
+            app, space = asyncio.run(get_space())
+            self.assertIsInstance(app, AsyncEntity)
+            self.assertIsInstance(space, AsyncEntity)
+            self.assertEqual("my_app", app["name"])
+            self.assertEqual("my-space", space["name"])
+
+    def test_get_first_v2(self):
+        with patch.object(self.async_client, "_send", new=AsyncMock()) as send:
+            send.return_value = self.async_response("/v2/apps", HTTPStatus.OK, None, "v2", "apps", "GET_response.json")
+            app = asyncio.run(self.async_client.v2.apps.get_first(name="name"))
+            self.assertIsInstance(app, AsyncEntityV2)
+            self.assertEqual("%s/v2/apps?q=name%%3Aname&results-per-page=1" % self.TARGET_ENDPOINT, send.call_args.args[1])
+
+    def test_invalid_status_code(self):
+        with patch.object(self.async_client, "_send", new=AsyncMock()) as send:
+            send.return_value = BufferedResponse("url", HTTPStatus.NOT_FOUND.value, {}, b'{"errors": []}', None)
+            self.assertRaises(InvalidStatusCode, lambda: asyncio.run(self.async_client.v3.apps.get("app_id")))
+
+    def test_refresh_token_when_expired(self):
+        expired = BufferedResponse(
+            "url",
+            HTTPStatus.UNAUTHORIZED.value,
+            {},
+            json.dumps(dict(code=1000, error_code="CF-InvalidAuthToken")).encode("utf-8"),
+            None,
+        )
+        self.client.refresh_token = "refresh-token"
+        with patch.object(self.async_client, "_send", new=AsyncMock()) as send, patch.object(
+            self.client, "_refresh_token", new=MagicMock()
+        ) as refresh_token:
+            send.side_effect = [
+                expired,
+                self.async_response("/v3/apps/app_id", HTTPStatus.OK, None, "v3", "apps", "GET_{id}_response.json"),
+            ]
+            app = asyncio.run(self.async_client.v3.apps.get("app_id"))
+            refresh_token.assert_called_once()
+            self.assertEqual(2, send.call_count)
+            self.assertEqual("my_app", app["name"])
+
+    def test_retry_when_rate_limited(self):
+        self.client.retry_policy = RetryPolicy()
+        rate_limited = BufferedResponse("url", HTTPStatus.TOO_MANY_REQUESTS.value, {"Retry-After": "0"}, b"", None)
+        with patch.object(self.async_client, "_send", new=AsyncMock()) as send:
+            send.side_effect = [
+                rate_limited,
+                self.async_response("/v3/apps/app_id", HTTPStatus.OK, None, "v3", "apps", "GET_{id}_response.json"),
+            ]
+            app = asyncio.run(self.async_client.v3.apps.get("app_id"))
+            self.assertEqual(2, send.call_count)
+            self.assertEqual("my_app", app["name"])
+            self.assertEqual(1, self.client.retry_policy.retries)
@@ -1,11 +1,24 @@
 import json
+import logging
+import os
+import socket
+import tempfile
+import threading
 from os import remove as file_remove
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
-from unittest.mock import patch
+from unittest.mock import MagicMock, call, patch
 from urllib.parse import quote
 
+import requests
+
+from cloudfoundry_client.conditional_requests import ConditionalRequests
 from cloudfoundry_client.errors import InvalidStatusCode
+from cloudfoundry_client.rate_limiter import RateLimiter
+from cloudfoundry_client.request_logger import RequestLogger
+from cloudfoundry_client.response_cache import ResponseCache
+from cloudfoundry_client.retry_policy import RetryPolicy
 
 from abstract_test_case import AbstractTestCase
 from cloudfoundry_client.client import CloudFoundryClient
@@ -189,6 +202,198 @@ class TestCloudfoundryClient(
             self.assertEqual(info.doppler_endpoint, self.DOPPLER_ENDPOINT)
             self.assertEqual(info.log_stream_endpoint, self.LOG_STREAM_ENDPOINT)
 
+    def test_connection_pool_configuration(self):
+        requests = FakeRequests()
+        session = MockSession()
+        with patch("oauth2_client.credentials_manager.requests", new=requests), patch(
+            "cloudfoundry_client.client.requests", new=requests
+        ):
+            requests.Session.return_value = session
+            self._mock_info_calls(requests)
+            CloudFoundryClient(self.TARGET_ENDPOINT, pool_maxsize=50, pool_block=True, tcp_keep_alive=True)
+            session.get.assert_called_with(
+                "%s/" % self.TARGET_ENDPOINT, proxies=dict(http="", https=""), verify=True
+            )
+            requests.get.assert_not_called()
+            self.assertEqual(["https://", "http://"], [call.args[0] for call in session.mount.call_args_list])
+            adapter = session.mount.call_args.args[1]
+            pool_kwargs = adapter.poolmanager.connection_pool_kw
+            self.assertEqual(50, pool_kwargs["maxsize"])
+            self.assertTrue(pool_kwargs["block"])
+            self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), pool_kwargs["socket_options"])
+            self.assertIn(
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+                adapter.proxy_manager_for("http://proxy:3128").connection_pool_kw["socket_options"],
+            )
+
+    def test_session_is_reused_when_token_is_renewed(self):
+        requests = FakeRequests()
+        session = MockSession()
+        with patch("oauth2_client.credentials_manager.requests", new=requests), patch(
+            "cloudfoundry_client.client.requests", new=requests
+        ):
+            requests.Session.return_value = session
+            self._mock_info_calls(requests)
+            requests.post.return_value = MockResponse(
+                "%s/oauth/token" % self.AUTHORIZATION_ENDPOINT,
+                status_code=HTTPStatus.OK.value,
+                text=json.dumps(dict(access_token="access-token", refresh_token="refresh-token")),
+            )
+            client = CloudFoundryClient(self.TARGET_ENDPOINT)
+            client.init_with_token("refresh-token")
+            client._session = None
+            client._access_token = "other-token"
+            self.assertIs(session, client._session)
+            self.assertEqual("Bearer other-token", session.headers.get("Authorization"))
+            self.assertEqual(1, requests.Session.call_count)
+
+    def test_token_is_refreshed_once_by_concurrent_requests(self):
+        requests = FakeRequests()
+        session = MockSession()
+        with patch("oauth2_client.credentials_manager.requests", new=requests), patch(
+            "cloudfoundry_client.client.requests", new=requests
+        ):
+            requests.Session.return_value = session
+            self._mock_info_calls(requests)
+            client = CloudFoundryClient(self.TARGET_ENDPOINT)
+        client._access_token = "expired-token"
+        client.refresh_token = "refresh-token"
+        threads_count = 4
+        barrier = threading.Barrier(threads_count, timeout=5)
+        expired = MockResponse(
+            "http://some-cf-url", HTTPStatus.UNAUTHORIZED.value, text='{"code": 1000, "error_code": "CF-InvalidAuthToken"}'
+        )
+
+        def send(url: str, **kwargs) -> MockResponse:
+            if client._access_token == "expired-token":
+                # all the requests are sent with the expired token
+                barrier.wait()
+                return expired
+            return MockResponse(url, HTTPStatus.OK.value, text="{}")
+
+        def refresh(credential_manager: CloudFoundryClient):
+            credential_manager.refresh_token = "renewed-refresh-token"
+            credential_manager._access_token = "renewed-token"
+
+        with patch.object(CloudFoundryClient.__bases__[0], "_refresh_token", autospec=True, side_effect=refresh) as mock_refresh:
+            with ThreadPoolExecutor(max_workers=threads_count) as executor:
+                responses = list(executor.map(lambda _: client._bearer_request(send, "http://some-cf-url"), range(threads_count)))
+
+        mock_refresh.assert_called_once()
+        self.assertEqual([HTTPStatus.OK.value] * threads_count, [response.status_code for response in responses])
+        self.assertEqual("Bearer renewed-token", session.headers["Authorization"])
+
+    def test_retry_policy(self):
+        self.build_client()
+        self.client.retry_policy = RetryPolicy(max_retries=2)
+        rate_limited = MockResponse("http://some-cf-url", 429, text="", headers={"Retry-After": "1"})
+        # the instance get attribute is mocked by the test case, the real one is called through the class
+        with patch.object(CloudFoundryClient.__bases__[0], "get") as get, patch("cloudfoundry_client.client.time") as fake_time:
+            get.side_effect = [rate_limited, MockResponse("http://some-cf-url", 200, text="{}")]
+            CloudFoundryClient.get(self.client, "http://some-cf-url")
+            self.assertEqual(2, get.call_count)
+            fake_time.sleep.assert_called_once_with(1.0)
+
+            get.reset_mock()
+            get.side_effect = [rate_limited, rate_limited, rate_limited]
+            self.assertRaises(InvalidStatusCode, lambda: CloudFoundryClient.get(self.client, "http://some-cf-url"))
+            self.assertEqual(3, get.call_count)
+        self.assertEqual(dict(retries=3, retries_by_status={429: 3}, exhausted=1), self.client.retry_policy.counters())
+
+    def test_retry_policy_sends_files_again(self):
+        self.build_client()
+        self.client.retry_policy = RetryPolicy(max_retries=1)
+        # the instance put attribute is mocked by the test case, the real one is called by the manager
+        del self.client.put
+        bodies = []
+
+        def send(url, data, json, **kwargs):
+            bodies.append(requests.Request("PUT", url, data=data, files=kwargs["files"]).prepare().body)
+            if len(bodies) == 1:
+                return MockResponse(url, HTTPStatus.SERVICE_UNAVAILABLE.value, text="", headers={"Retry-After": "0"})
+            return MockResponse(url, HTTPStatus.CREATED.value, text="{}")
+
+        with tempfile.TemporaryDirectory() as directory:
+            application = os.path.join(directory, "application.zip")
+            with open(application, "wb") as f:
+                f.write(b"zip content" * 100)
+            with patch.object(CloudFoundryClient.__bases__[0], "put", side_effect=send), patch("cloudfoundry_client.client.time"):
+                self.client.v2.apps.upload("app_id", [], application)
+
+        self.assertEqual(2, len(bodies))
+        self.assertIn(b"zip content" * 100, bodies[1])
+        self.assertEqual(len(bodies[0]), len(bodies[1]))
+
+    def test_rate_limiter(self):
+        self.build_client()
+        self.client.rate_limiter = MagicMock(spec=RateLimiter)
+        response = MockResponse("http://some-cf-url", 200, text="{}", headers={"X-RateLimit-Remaining": "10"})
+        with patch.object(CloudFoundryClient.__bases__[0], "get") as get:
+            get.return_value = response
+            CloudFoundryClient.get(self.client, "http://some-cf-url")
+        self.client.rate_limiter.acquire.assert_called_once()
+        self.client.rate_limiter.update.assert_called_once_with(response)
+
+    def test_response_cache(self):
+        self.build_client()
+        self.client.response_cache = ResponseCache(ttls=dict(organizations=60))
+        url = "%s/v3/organizations/org_guid" % self.TARGET_ENDPOINT
+        with patch.object(CloudFoundryClient.__bases__[0], "get") as get, patch.object(
+            CloudFoundryClient.__bases__[0], "patch"
+        ) as patch_method:
+            get.return_value = MockResponse(url, 200, text="{}")
+            patch_method.return_value = MockResponse(url, 200, text="{}")
+            CloudFoundryClient.get(self.client, url)
+            CloudFoundryClient.get(self.client, url)
+            self.assertEqual(1, get.call_count)
+            CloudFoundryClient.patch(self.client, url, json=dict(name="new_name"))
+            CloudFoundryClient.get(self.client, url)
+            self.assertEqual(2, get.call_count)
+        self.assertEqual(1, self.client.response_cache.hits)
+
+    def test_conditional_requests(self):
+        self.build_client()
+        self.client.conditional_requests = ConditionalRequests()
+        url = "%s/v3/apps" % self.TARGET_ENDPOINT
+        with patch.object(CloudFoundryClient.__bases__[0], "get") as get:
+            get.side_effect = [
+                MockResponse(url, 200, text='{"resources": []}', headers={"ETag": '"v1"'}),
+                MockResponse(url, 304, text=""),
+            ]
+            CloudFoundryClient.get(self.client, url)
+            get.assert_called_with(url, None, headers=dict())
+            response = CloudFoundryClient.get(self.client, url)
+            get.assert_called_with(url, None, headers={"If-None-Match": '"v1"'})
+            self.assertEqual(200, response.status_code)
+            self.assertEqual('{"resources": []}', response.text)
+
+    def test_not_modified_is_an_error_without_validators(self):
+        self.build_client()
+        url = "%s/v3/apps" % self.TARGET_ENDPOINT
+        with patch.object(CloudFoundryClient.__bases__[0], "get", return_value=MockResponse(url, 304, text="")):
+            self.assertRaises(InvalidStatusCode, CloudFoundryClient.get, self.client, url)
+            self.client.conditional_requests = ConditionalRequests()
+            # no response stored yet: no validator sent
+            self.assertRaises(InvalidStatusCode, CloudFoundryClient.get, self.client, url)
+
+    def test_conditional_request_sent_again_when_stored_response_is_gone(self):
+        self.build_client()
+        self.client.conditional_requests = ConditionalRequests()
+        url = "%s/v3/apps" % self.TARGET_ENDPOINT
+        with patch.object(CloudFoundryClient.__bases__[0], "get") as get, patch.object(
+            self.client.conditional_requests, "headers", return_value={"If-None-Match": '"v1"'}
+        ):
+            get.side_effect = [
+                MockResponse(url, 304, text=""),
+                MockResponse(url, 200, text='{"resources": []}', headers={"ETag": '"v2"'}),
+            ]
+            response = CloudFoundryClient.get(self.client, url)
+            self.assertListEqual(
+                [call(url, None, headers={"If-None-Match": '"v1"'}), call(url, None, headers=dict())], get.call_args_list
+            )
+            self.assertEqual(200, response.status_code)
+            self.assertEqual('{"resources": []}', response.text)
+
     def test_invalid_token_v3(self):
         response = MockResponse(
             "http://some-cf-url",
@@ -218,7 +423,7 @@ class TestCloudfoundryClient(
             headers={"x-vcap-request-id": "testVcap"},
         )
         with self.assertLogs(level="DEBUG") as cm:
-            CloudFoundryClient._log_request("GET", "testURL", response)
+            RequestLogger(logging.getLogger("cloudfoundry_client.client")).log("GET", "testURL", response)
         self.assertEqual(
             cm.output,
             [
@@ -230,7 +435,7 @@ class TestCloudfoundryClient(
     def test_log_request_empty_headers(self):
         response = MockResponse("http://some-cf-url", 200, text=json.dumps(dict(entity="entityTest", metadata="metadataTest")))
         with self.assertLogs(level="DEBUG") as cm:
-            CloudFoundryClient._log_request("GET", "testURL", response)
+            RequestLogger(logging.getLogger("cloudfoundry_client.client")).log("GET", "testURL", response)
         self.assertEqual(
             cm.output,
             [
@@ -0,0 +1,58 @@
+import os
+import tempfile
+import unittest
+
+from cloudfoundry_client.conditional_requests import ConditionalRequests, DiskValidatorStore, MemoryValidatorStore
+from fake_requests import MockResponse
+
+
+class TestConditionalRequests(unittest.TestCase):
+    URL = "http://somewhere.org/v3/apps"
+
+    def test_no_validator_before_first_response(self):
+        self.assertEqual(dict(), ConditionalRequests().headers(self.URL, None))
+
+    def test_memory_store(self):
+        self._check_revalidation(ConditionalRequests(MemoryValidatorStore()))
+
+    def test_disk_store(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self._check_revalidation(ConditionalRequests(DiskValidatorStore(directory)))
+            # another instance, another process for instance, reads the same store
+            self.assertEqual(
+                {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"},
+                ConditionalRequests(DiskValidatorStore(directory)).headers(self.URL, dict(page=1)),
+            )
+
+    def test_response_without_validators_is_not_stored(self):
+        conditional_requests = ConditionalRequests()
+        conditional_requests.resolve(self.URL, None, MockResponse(self.URL, 200, '{"resources": []}'))
+        self.assertEqual(dict(), conditional_requests.headers(self.URL, None))
+
+    def test_not_modified_without_stored_response(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = DiskValidatorStore(directory)
+            conditional_requests = ConditionalRequests(store)
+            conditional_requests.resolve(self.URL, None, MockResponse(self.URL, 200, "{}", headers={"ETag": '"v1"'}))
+            # the stored file is deleted after the validators were sent
+            os.remove(store._path(self.URL))
+            self.assertIsNone(conditional_requests.resolve(self.URL, None, MockResponse(self.URL, 304, "")))
+
+    def _check_revalidation(self, conditional_requests: ConditionalRequests):
+        response = MockResponse(
+            self.URL,
+            200,
+            '{"resources": []}',
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+        )
+        self.assertIs(response, conditional_requests.resolve(self.URL, dict(page=1), response))
+        self.assertEqual(
+            {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"},
+            conditional_requests.headers(self.URL, dict(page=1)),
+        )
+        self.assertEqual(dict(), conditional_requests.headers(self.URL, dict(page=2)))
+
+        revalidated = conditional_requests.resolve(self.URL, dict(page=1), MockResponse(self.URL, 304, ""))
+        self.assertEqual(200, revalidated.status_code)
+        self.assertEqual(dict(resources=[]), revalidated.json())
+        self.assertEqual(dict(not_modified=1, modified=1), conditional_requests.counters())
@@ -0,0 +1,45 @@
+import json
+import unittest
+from json import JSONDecodeError
+from unittest.mock import MagicMock
+
+from cloudfoundry_client.common_objects import JsonObject
+from cloudfoundry_client.json_decoder import JsonDecoder, STANDARD_DECODER
+from fake_requests import MockResponse
+
+
+class TestJsonDecoder(unittest.TestCase):
+    def test_default_decoder(self):
+        result = JsonDecoder().decode(MockResponse("url", 200, json.dumps(dict(resources=[dict(entity=dict(name="name"))]))))
+        self.assertIsInstance(result, JsonObject)
+        self.assertIsInstance(result["resources"][0], JsonObject)
+        self.assertIsInstance(result["resources"][0]["entity"], JsonObject)
+        self.assertEqual(dict(resources=[dict(entity=dict(name="name"))]), result)
+
+    def test_custom_decoder_objects_are_json_objects(self):
+        result = JsonDecoder(json.loads).decode(MockResponse("url", 200, json.dumps(dict(resources=[dict(guid="guid")]))))
+        self.assertIsInstance(result, JsonObject)
+        self.assertIsInstance(result["resources"][0], JsonObject)
+        self.assertEqual("guid", result["resources"][0]["guid"])
+
+    def test_fastest_decoder(self):
+        result = JsonDecoder.fastest().decode(MockResponse("url", 200, json.dumps(dict(entity=dict(name="name")))))
+        self.assertIsInstance(result["entity"], JsonObject)
+
+    def test_client_without_decoder(self):
+        self.assertIs(STANDARD_DECODER, JsonDecoder.of(object()))
+        decoder = JsonDecoder()
+        self.assertIs(decoder, JsonDecoder.of(MagicMock(json_decoder=decoder)))
+
+    def test_list_is_not_wrapped(self):
+        result = JsonDecoder().decode(MockResponse("url", 200, json.dumps([dict(sha1="sha1", size=1)])))
+        self.assertEqual([dict(sha1="sha1", size=1)], result)
+
+    def test_empty_response(self):
+        self.assertRaises(JSONDecodeError, lambda: JsonDecoder().decode(MockResponse("url", 204, "")))
+
+    def test_decoding_errors_are_json_decode_errors(self):
+        def loads(_):
+            raise ValueError("Expected object or value")
+
+        self.assertRaises(JSONDecodeError, lambda: JsonDecoder(loads).decode(MockResponse("url", 204, "")))
@@ -0,0 +1,38 @@
+import email
+import email.policy
+import unittest
+
+from cloudfoundry_client.multipart import MultipartStream
+
+
+class TestMultipartStream(unittest.TestCase):
+    def test_body_is_a_form(self):
+        body = MultipartStream(
+            dict(resources='[{"fn": "a.txt"}]'),
+            dict(application=("application.zip", [b"first ", b"", b"second"], "application/zip")),
+            boundary="boundary",
+        )
+
+        content = b"".join(body)
+
+        self.assertEqual("multipart/form-data; boundary=boundary", body.content_type)
+        message = email.message_from_bytes(
+            ("Content-Type: %s\r\n\r\n" % body.content_type).encode("utf-8") + content, policy=email.policy.HTTP
+        )
+        parts = list(message.iter_parts())
+        self.assertEqual(2, len(parts))
+        self.assertEqual("resources", parts[0].get_param("name", header="content-disposition"))
+        self.assertEqual('[{"fn": "a.txt"}]', parts[0].get_content().strip())
+        self.assertEqual("application.zip", parts[1].get_filename())
+        self.assertEqual("application/zip", parts[1].get_content_type())
+        self.assertEqual(b"first second", parts[1].get_payload(decode=True))
+
+    def test_empty_chunks_are_skipped(self):
+        body = MultipartStream(dict(), dict(application=("application.zip", [b"", b"data", b""], "application/zip")))
+
+        self.assertTrue(all(len(chunk) > 0 for chunk in body))
+
+    def test_body_can_be_sent_again(self):
+        body = MultipartStream(dict(field="value"), dict(application=("application.zip", [b"data"], "application/zip")))
+
+        self.assertEqual(b"".join(body), b"".join(body))
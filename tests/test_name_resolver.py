@@ -0,0 +1,59 @@
+import unittest
+from http import HTTPStatus
+
+from abstract_test_case import AbstractTestCase
+from cloudfoundry_client.name_resolver import NameResolver
+from fake_requests import FakeClock
+
+
+class TestNameResolver(unittest.TestCase, AbstractTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_client_class()
+
+    def setUp(self):
+        self.build_client()
+        self.clock = FakeClock()
+        self.resolver = NameResolver(ttl=60, batch_size=2, clock=self.clock)
+
+    def test_resolve_many_v3_by_batches(self):
+        self.client.get.return_value = self.mock_response("/v3/apps", HTTPStatus.OK, None, "v3", "apps", "GET_response.json")
+        guids = self.resolver.resolve_many(self.client.v3.apps, ["my_app", "my_app2", "other_app"], space_guids="space_guid")
+        self.assertEqual(
+            dict(my_app="1cb006ee-fb05-47e1-b541-c34179ddc446", my_app2="02b4ec9b-94c7-4468-9c23-4e906191a0f8"), guids
+        )
+        self.assertEqual(2, self.client.get.call_count)
+        self.client.get.assert_any_call(
+            "%s/v3/apps?names=my_app%%2Cmy_app2&per_page=5000&space_guids=space_guid" % self.TARGET_ENDPOINT
+        )
+        self.client.get.assert_called_with(
+            "%s/v3/apps?names=other_app&per_page=5000&space_guids=space_guid" % self.TARGET_ENDPOINT
+        )
+
+    def test_resolve_v2(self):
+        self.client.get.return_value = self.mock_response("/v2/apps", HTTPStatus.OK, None, "v2", "apps", "GET_response.json")
+        self.assertEqual("7002efa8-3f54-4338-8884-117e98f21566", self.resolver.resolve(self.client.v2.apps, "name-433"))
+        self.client.get.assert_called_with("%s/v2/apps?q=name%%20IN%%20name-433&results-per-page=100" % self.TARGET_ENDPOINT)
+
+    def test_guids_are_remembered_until_expiration(self):
+        self.client.get.return_value = self.mock_response("/v3/apps", HTTPStatus.OK, None, "v3", "apps", "GET_response.json")
+        self.resolver.resolve(self.client.v3.apps, "my_app")
+        self.assertEqual("1cb006ee-fb05-47e1-b541-c34179ddc446", self.resolver.resolve(self.client.v3.apps, "my_app"))
+        self.assertEqual(1, self.client.get.call_count)
+        self.clock.now = 60
+        self.resolver.resolve(self.client.v3.apps, "my_app")
+        self.assertEqual(2, self.client.get.call_count)
+
+    def test_remembered_guid_is_not_looked_up(self):
+        self.assertIsNone(self.resolver.remembered(self.client.v3.apps, "my_app"))
+        self.resolver.remember(self.client.v3.apps, "my_app", "app_guid")
+        self.assertEqual("app_guid", self.resolver.remembered(self.client.v3.apps, "my_app"))
+        self.clock.now = 60
+        self.assertIsNone(self.resolver.remembered(self.client.v3.apps, "my_app"))
+        self.client.get.assert_not_called()
+
+    def test_modified_entity_is_forgotten(self):
+        self.resolver.remember(self.client.v3.apps, "my_app", "app_guid")
+        self.resolver.invalidate("%s/v3/apps/app_guid" % self.TARGET_ENDPOINT)
+        self.client.get.return_value = self.mock_response("/v3/apps", HTTPStatus.OK, None, "v3", "apps", "GET_response.json")
+        self.assertEqual("1cb006ee-fb05-47e1-b541-c34179ddc446", self.resolver.resolve(self.client.v3.apps, "my_app"))
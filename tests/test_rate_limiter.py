@@ -0,0 +1,73 @@
+import os
+import tempfile
+import unittest
+
+from cloudfoundry_client.rate_limiter import FileRateLimitStore, RateLimiter
+from fake_requests import FakeClock, MockResponse
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock(1000.0)
+
+    def test_no_throttling_until_calibrated(self):
+        rate_limiter = RateLimiter(clock=self.clock)
+        for _ in range(100):
+            self.assertEqual(0, rate_limiter.try_acquire())
+
+    def test_bucket_is_emptied_then_refilled(self):
+        rate_limiter = RateLimiter(limit=2, period=10.0, clock=self.clock)
+        self.assertEqual(0, rate_limiter.try_acquire())
+        self.assertEqual(0, rate_limiter.try_acquire())
+        self.assertEqual(5.0, rate_limiter.try_acquire())
+        self.clock.now += 5.0
+        self.assertEqual(0, rate_limiter.try_acquire())
+
+    def test_calibration_with_headers(self):
+        rate_limiter = RateLimiter(clock=self.clock)
+        rate_limiter.update(
+            MockResponse("url", 200, "", headers={"X-RateLimit-Limit": "3600", "X-RateLimit-Remaining": "1"})
+        )
+        self.assertEqual(0, rate_limiter.try_acquire())
+        self.assertEqual(1.0, rate_limiter.try_acquire())
+
+    def test_wait_for_reset_when_budget_is_exhausted(self):
+        rate_limiter = RateLimiter(clock=self.clock)
+        rate_limiter.update(
+            MockResponse(
+                "url",
+                429,
+                "",
+                headers={"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1060"},
+            )
+        )
+        self.assertEqual(60.0, rate_limiter.try_acquire())
+        self.clock.now = 1060.0
+        self.assertEqual(0, rate_limiter.try_acquire())
+
+    def test_budget_is_taken_from_server_after_reset(self):
+        rate_limiter = RateLimiter(clock=self.clock)
+
+        def update(remaining: int, reset: int):
+            headers = {"X-RateLimit-Limit": "3600", "X-RateLimit-Remaining": str(remaining), "X-RateLimit-Reset": str(reset)}
+            rate_limiter.update(MockResponse("url", 200, "", headers=headers))
+
+        update(0, 1060)
+        self.assertEqual(60.0, rate_limiter.try_acquire())
+        self.clock.now = 1060.0
+        update(3599, 4660)
+        for _ in range(100):
+            self.assertEqual(0, rate_limiter.try_acquire())
+        # a late response of the previous window is ignored
+        update(0, 1060)
+        self.assertEqual(0, rate_limiter.try_acquire())
+
+    def test_file_store_is_shared(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "rate_limit.json")
+            first = RateLimiter(limit=2, period=10.0, store=FileRateLimitStore(path), clock=self.clock)
+            second = RateLimiter(limit=2, period=10.0, store=FileRateLimitStore(path), clock=self.clock)
+            self.assertEqual(0, first.try_acquire())
+            self.assertEqual(0, second.try_acquire())
+            self.assertEqual(5.0, first.try_acquire())
+            self.assertEqual(5.0, second.try_acquire())
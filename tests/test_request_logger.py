@@ -0,0 +1,49 @@
+import logging
+import unittest
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from cloudfoundry_client.request_logger import RequestLogger
+from fake_requests import MockResponse
+
+
+class TestRequestLogger(unittest.TestCase):
+    def test_body_is_not_read_when_debug_is_disabled(self):
+        logger = logging.getLogger("test_request_logger.disabled")
+        logger.setLevel(logging.INFO)
+        response = MagicMock(status_code=200)
+        type(response).text = PropertyMock(side_effect=AssertionError("body read"))
+        type(response).content = PropertyMock(side_effect=AssertionError("body read"))
+
+        RequestLogger(logger).log("GET", "testURL", response)
+
+    def test_body_is_truncated(self):
+        response = MockResponse("http://some-cf-url", 200, text="0123456789")
+        with self.assertLogs(level="DEBUG") as cm:
+            RequestLogger(logging.getLogger("test_request_logger"), max_body_length=4).log("GET", "testURL", response)
+        self.assertEqual(
+            cm.output,
+            [
+                "DEBUG:test_request_logger:GET: url=testURL - status_code=200 - vcap-request-id=N/A - response="
+                "0123... (6 bytes truncated)"
+            ],
+        )
+
+    def test_timing_and_hook(self):
+        hook = MagicMock()
+        response = MockResponse("http://some-cf-url", 200, text="{}")
+        request_logger = RequestLogger(logging.getLogger("test_request_logger"), timing=True, hook=hook)
+        with patch("cloudfoundry_client.request_logger.time.perf_counter", side_effect=[1.0, 1.25]), self.assertLogs(
+            level="DEBUG"
+        ) as cm:
+            request_logger.log("POST", "testURL", response, request_logger.start())
+        hook.assert_called_with("POST", "testURL", response, 0.25)
+        self.assertEqual(
+            cm.output,
+            [
+                "DEBUG:test_request_logger:POST: url=testURL - status_code=200 - vcap-request-id=N/A"
+                " - elapsed=250.0ms - response={}"
+            ],
+        )
+
+    def test_no_timing_without_timing_nor_hook(self):
+        self.assertIsNone(RequestLogger(logging.getLogger("test_request_logger")).start())
@@ -0,0 +1,51 @@
+import unittest
+
+from cloudfoundry_client.response_cache import ResponseCache
+from fake_requests import FakeClock, MockResponse
+
+
+class TestResponseCache(unittest.TestCase):
+    URL = "http://somewhere.org/v3/organizations"
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ResponseCache(ttls=dict(organizations=60, spaces=60), max_size=2, clock=self.clock)
+        self.response = MockResponse(self.URL, 200, "{}")
+
+    def test_hit_until_expiration(self):
+        self.cache.put(self.URL, dict(names="org"), self.response)
+        self.assertIs(self.response, self.cache.get(self.URL, dict(names="org")))
+        self.assertIsNone(self.cache.get(self.URL, dict(names="other")))
+        self.clock.now = 60
+        self.assertIsNone(self.cache.get(self.URL, dict(names="org")))
+        self.assertEqual(dict(hits=1, misses=2, evictions=0, invalidations=0, size=0), self.cache.counters())
+
+    def test_params_and_query_string_are_equivalent(self):
+        self.cache.put("%s?names=org" % self.URL, None, self.response)
+        self.assertIs(self.response, self.cache.get(self.URL, dict(names="org")))
+
+    def test_types_without_ttl_are_not_cached(self):
+        self.cache.put("http://somewhere.org/v3/apps/app_guid", None, self.response)
+        self.assertIsNone(self.cache.get("http://somewhere.org/v3/apps/app_guid"))
+
+    def test_least_recently_used_is_evicted(self):
+        self.cache.put("%s/first" % self.URL, None, self.response)
+        self.cache.put("%s/second" % self.URL, None, self.response)
+        self.cache.get("%s/first" % self.URL)
+        self.cache.put("%s/third" % self.URL, None, self.response)
+        self.assertIsNotNone(self.cache.get("%s/first" % self.URL))
+        self.assertIsNone(self.cache.get("%s/second" % self.URL))
+        self.assertEqual(1, self.cache.evictions)
+
+    def test_mutation_invalidates_resource_and_its_parents(self):
+        cache = ResponseCache(default_ttl=60, clock=self.clock)
+        cache.put(self.URL, None, self.response)
+        cache.put("%s/org_guid" % self.URL, None, self.response)
+        cache.put("%s/org_guid/domains" % self.URL, None, self.response)
+        cache.put("%s/other_guid" % self.URL, None, self.response)
+        cache.invalidate("%s/org_guid" % self.URL)
+        self.assertIsNone(cache.get(self.URL))
+        self.assertIsNone(cache.get("%s/org_guid" % self.URL))
+        self.assertIsNone(cache.get("%s/org_guid/domains" % self.URL))
+        self.assertIsNotNone(cache.get("%s/other_guid" % self.URL))
+        self.assertEqual(3, cache.invalidations)
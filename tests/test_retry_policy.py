@@ -0,0 +1,64 @@
+import time
+import unittest
+from email.utils import formatdate
+from http import HTTPStatus
+
+from cloudfoundry_client.retry_policy import RetryPolicy
+from fake_requests import MockResponse
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_non_idempotent_methods_are_not_retried(self):
+        policy = RetryPolicy()
+        response = MockResponse("url", HTTPStatus.SERVICE_UNAVAILABLE.value, "")
+        self.assertIsNone(policy.delay("POST", response, 0))
+        self.assertIsNone(policy.delay("PATCH", response, 0))
+        self.assertIsNotNone(policy.delay("GET", response, 0))
+
+    def test_other_status_codes_are_not_retried(self):
+        policy = RetryPolicy()
+        self.assertIsNone(policy.delay("GET", MockResponse("url", HTTPStatus.NOT_FOUND.value, ""), 0))
+        self.assertIsNone(policy.delay("GET", MockResponse("url", HTTPStatus.INTERNAL_SERVER_ERROR.value, ""), 0))
+
+    def test_backoff_is_exponential(self):
+        policy = RetryPolicy(max_retries=10, backoff_factor=1.0, max_delay=5.0)
+        response = MockResponse("url", HTTPStatus.BAD_GATEWAY.value, "")
+        for attempt in range(10):
+            delay = policy.delay("GET", response, attempt)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(2**attempt, 5.0))
+
+    def test_retry_after_seconds(self):
+        response = MockResponse("url", HTTPStatus.TOO_MANY_REQUESTS.value, "", headers={"Retry-After": "7"})
+        self.assertEqual(7.0, RetryPolicy().delay("GET", response, 0))
+
+    def test_retry_after_date(self):
+        response = MockResponse(
+            "url", HTTPStatus.SERVICE_UNAVAILABLE.value, "", headers={"Retry-After": formatdate(time.time() + 30)}
+        )
+        self.assertAlmostEqual(30.0, RetryPolicy().delay("GET", response, 0), delta=2)
+
+    def test_rate_limit_reset(self):
+        response = MockResponse(
+            "url", HTTPStatus.TOO_MANY_REQUESTS.value, "", headers={"X-RateLimit-Reset": str(int(time.time()) + 20)}
+        )
+        self.assertAlmostEqual(20.0, RetryPolicy().delay("GET", response, 0), delta=2)
+        self.assertEqual(10.0, RetryPolicy(max_delay=10.0).delay("GET", response, 0))
+
+    def test_rate_limit_reset_is_ignored_when_not_rate_limited(self):
+        response = MockResponse(
+            "url", HTTPStatus.BAD_GATEWAY.value, "", headers={"X-RateLimit-Reset": str(int(time.time()) + 3600)}
+        )
+        self.assertLessEqual(RetryPolicy(backoff_factor=0.5).delay("GET", response, 0), 0.5)
+
+    def test_counters(self):
+        policy = RetryPolicy(max_retries=2)
+        rate_limited = MockResponse("url", HTTPStatus.TOO_MANY_REQUESTS.value, "", headers={"Retry-After": "0"})
+        unavailable = MockResponse("url", HTTPStatus.SERVICE_UNAVAILABLE.value, "", headers={"Retry-After": "0"})
+        policy.delay("GET", rate_limited, 0)
+        policy.delay("GET", unavailable, 1)
+        self.assertIsNone(policy.delay("GET", unavailable, 2))
+        self.assertEqual(
+            dict(retries=2, retries_by_status={429: 1, 503: 1}, exhausted=1),
+            policy.counters(),
+        )
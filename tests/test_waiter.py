@@ -0,0 +1,44 @@
+import unittest
+
+from cloudfoundry_client.waiter import Waiter, WaitTimeout
+from fake_requests import FakeClock
+
+
+class TestWaiter(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_wait_backs_off_up_to_the_cap(self):
+        states = iter(["queued"] * 6 + ["done"])
+        waiter = Waiter(initial_interval=0.25, max_interval=2.0, jitter=0, clock=self.clock, sleep=self.clock.sleep)
+
+        result = waiter.wait(lambda: next(states), lambda state: state == "done")
+
+        self.assertEqual("done", result)
+        self.assertEqual([0.25, 0.5, 1.0, 2.0, 2.0, 2.0], self.clock.sleeps)
+
+    def test_wait_jitters_intervals(self):
+        polls = iter(range(50))
+        waiter = Waiter(initial_interval=1.0, max_interval=1.0, jitter=0.2, clock=self.clock, sleep=self.clock.sleep)
+
+        waiter.wait(lambda: next(polls), lambda poll: poll == 49)
+
+        self.assertTrue(all(0.8 <= seconds <= 1.0 for seconds in self.clock.sleeps))
+        self.assertGreater(len(set(self.clock.sleeps)), 1)
+
+    def test_wait_has_deadline(self):
+        waiter = Waiter(initial_interval=1.0, max_interval=4.0, timeout=10.0, jitter=0, clock=self.clock, sleep=self.clock.sleep)
+
+        with self.assertRaises(WaitTimeout):
+            waiter.wait(lambda: "running", lambda state: False)
+
+        self.assertEqual([1.0, 2.0, 4.0, 3.0], self.clock.sleeps)
+
+    def test_wait_notifies_state_changes(self):
+        jobs = iter([dict(state="PROCESSING", n=0), dict(state="PROCESSING", n=1), dict(state="COMPLETE", n=2)])
+        changes = []
+        waiter = Waiter(clock=self.clock, sleep=self.clock.sleep)
+
+        waiter.wait(lambda: next(jobs), lambda job: job["state"] == "COMPLETE", lambda job: job["state"], changes.append)
+
+        self.assertEqual([0, 2], [job["n"] for job in changes])
@@ -1,3 +1,4 @@
+import json
 import sys
 import unittest
 from functools import reduce
@@ -69,6 +70,26 @@ class TestApps(unittest.TestCase, AbstractTestCase):
         self.client.v2.apps.associate_route("app_id", "route_id")
         self.client.put.assert_called_with(self.client.put.return_value.url, json=None)
 
+    def test_upload_stream(self):
+        self.client.put.return_value = self.mock_response(
+            "/v2/apps/app_id/bits?async=true", HTTPStatus.CREATED, None, "v2", "apps", "PUT_{id}_response.json"
+        )
+        resources = [dict(fn="path/file.txt", sha1="sha1", size=1, mode="644")]
+
+        self.client.v2.apps.upload_stream("app_id", resources, [b"zip ", b"content"], True)
+
+        _, kwargs = self.client.put.call_args
+        body = kwargs["data"]
+        self.client.put.assert_called_with(
+            "%s/v2/apps/app_id/bits" % self.TARGET_ENDPOINT,
+            params={"async": "true"},
+            data=body,
+            headers={"Content-Type": body.content_type},
+        )
+        content = b"".join(body)
+        self.assertIn(json.dumps(resources).encode("utf-8"), content)
+        self.assertIn(b"zip content", content)
+
     def test_list_routes(self):
         self.client.get.return_value = self.mock_response(
             "/v2/apps/app_id/routes?q=route_guid%3Aroute_id", HTTPStatus.OK, None, "v2", "apps", "GET_{id}_routes_response.json"
@@ -185,3 +185,41 @@ class TestEntities(unittest.TestCase, AbstractTestCase):
 
         self.assertEqual(cpt, 3)
         client.get.assert_called_with(client.get.return_value.url)
+
+    def test_list_raw(self):
+        client = MagicMock()
+        client.get.return_value = self.mock_response("/fake/something", HTTPStatus.OK, None, "v2", "apps", "GET_response.json")
+        entity_manager = EntityManager(self.TARGET_ENDPOINT, client, "/fake/something")
+
+        resources = [resource for resource in entity_manager.list(raw=True)]
+
+        self.assertEqual(3, len(resources))
+        for resource in resources:
+            self.assertNotIsInstance(resource, Entity)
+            self.assertIn("metadata", resource)
+        client.get.assert_called_with("%s/fake/something" % self.TARGET_ENDPOINT)
+
+    def test_get_first_projected(self):
+        client = MagicMock()
+        client.get.return_value = self.mock_response("/fake/something", HTTPStatus.OK, None, "v2", "apps", "GET_response.json")
+        entity_manager = EntityManager(self.TARGET_ENDPOINT, client, "/fake/something")
+
+        guid, name, unknown = entity_manager.get_first(project=("metadata.guid", "entity.name", "entity.unknown.field"))
+
+        self.assertIsNotNone(guid)
+        self.assertEqual("name-423", name)
+        self.assertIsNone(unknown)
+        client.get.assert_called_with("%s/fake/something?results-per-page=1" % self.TARGET_ENDPOINT)
+
+    def test_get_many(self):
+        client = MagicMock()
+        client.get.return_value = self.mock_response("/fake/something", HTTPStatus.OK, None, "v2", "apps", "GET_response.json")
+        entity_manager = EntityManager(self.TARGET_ENDPOINT, client, "/fake/something")
+
+        entities = entity_manager.get_many(["guid-1", "guid-2"], raw=True)
+
+        self.assertEqual(3, len(entities))
+        self.assertEqual("name-433", entities["7002efa8-3f54-4338-8884-117e98f21566"]["entity"]["name"])
+        client.get.assert_called_once_with(
+            "%s/fake/something?q=guid%%20IN%%20guid-1%%2Cguid-2&results-per-page=50" % self.TARGET_ENDPOINT
+        )
@@ -0,0 +1,43 @@
+import json
+import unittest
+from http import HTTPStatus
+
+from abstract_test_case import AbstractTestCase
+from fake_requests import MockResponse
+
+
+class TestResources(unittest.TestCase, AbstractTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_client_class()
+
+    def setUp(self):
+        self.build_client()
+
+    def test_match(self):
+        items = [dict(sha1="sha1-0", size=1), dict(sha1="sha1-1", size=2)]
+        self.client.put.return_value = MockResponse(
+            "%s/v2/resource_match" % self.TARGET_ENDPOINT, HTTPStatus.OK.value, json.dumps(items[:1])
+        )
+
+        matched = self.client.v2.resources.match(items)
+
+        self.client.put.assert_called_with("%s/v2/resource_match" % self.TARGET_ENDPOINT, json=items)
+        self.assertEqual(items[:1], matched)
+
+    def test_match_many(self):
+        items = [dict(sha1="sha1-%d" % i, size=i) for i in range(5)]
+
+        def match(url: str, **kwargs) -> MockResponse:
+            return MockResponse(url, HTTPStatus.OK.value, json.dumps([item for item in kwargs["json"] if item["size"] % 2 == 0]))
+
+        self.client.put.side_effect = match
+
+        matched = self.client.v2.resources.match_many(items, chunk_size=2, max_workers=2)
+
+        self.assertEqual(3, self.client.put.call_count)
+        self.assertEqual([item for item in items if item["size"] % 2 == 0], matched)
+
+    def test_match_many_without_items(self):
+        self.assertEqual([], self.client.v2.resources.match_many([]))
+        self.client.put.assert_not_called()
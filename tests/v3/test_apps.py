@@ -4,7 +4,8 @@ from http import HTTPStatus
 
 from abstract_test_case import AbstractTestCase
 from cloudfoundry_client.common_objects import JsonObject, Pagination
-from cloudfoundry_client.v3.entities import Entity
+from cloudfoundry_client.v3.entities import Entity, ToOneRelationship
+from fake_requests import MockResponse
 
 
 class TestApps(unittest.TestCase, AbstractTestCase):
@@ -74,6 +75,33 @@ class TestApps(unittest.TestCase, AbstractTestCase):
         self.assertIsInstance(environment_variables, dict)
         self.assertEqual("production", environment_variables["var"]["RAILS_ENV"])
 
+    def test_create(self):
+        self.client.post.return_value = self.mock_response(
+            "/v3/apps", HTTPStatus.CREATED, None, "v3", "apps", "GET_{id}_response.json"
+        )
+        result = self.client.v3.apps.create("my_app", "space-guid", lifecycle=dict(type="docker", data={}))
+        self.client.post.assert_called_with(
+            self.client.post.return_value.url,
+            files=None,
+            json={
+                "name": "my_app",
+                "relationships": {"space": {"data": {"guid": "space-guid"}}},
+                "lifecycle": {"type": "docker", "data": {}},
+            },
+        )
+        self.assertIsInstance(result, Entity)
+
+    def test_set_current_droplet(self):
+        self.client.patch.return_value = MockResponse(
+            "%s/v3/apps/app_id/relationships/current_droplet" % self.TARGET_ENDPOINT,
+            HTTPStatus.OK.value,
+            '{"data": {"guid": "droplet_id"}}',
+        )
+        result = self.client.v3.apps.set_current_droplet("app_id", "droplet_id")
+        self.client.patch.assert_called_with(self.client.patch.return_value.url, json={"data": {"guid": "droplet_id"}})
+        self.assertIsInstance(result, ToOneRelationship)
+        self.assertEqual("droplet_id", result.guid)
+
     def test_restart(self):
         self.client.post.return_value = self.mock_response(
             "/v3/apps/app_id/actions/restart", HTTPStatus.OK, None, "v3", "apps",
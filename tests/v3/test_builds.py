@@ -0,0 +1,35 @@
+import unittest
+from http import HTTPStatus
+
+from abstract_test_case import AbstractTestCase
+from cloudfoundry_client.v3.entities import Entity
+
+
+class TestBuilds(unittest.TestCase, AbstractTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_client_class()
+
+    def setUp(self):
+        self.build_client()
+
+    def test_create(self):
+        self.client.post.return_value = self.mock_response(
+            "/v3/builds", HTTPStatus.CREATED, None, "v3", "builds", "POST_response.json"
+        )
+        result = self.client.v3.builds.create("package-guid", staging_memory_in_mb=1024)
+        self.client.post.assert_called_with(
+            self.client.post.return_value.url,
+            files=None,
+            json={"package": {"guid": "package-guid"}, "staging_memory_in_mb": 1024},
+        )
+        self.assertIsInstance(result, Entity)
+        self.assertEqual("STAGING", result["state"])
+
+    def test_get(self):
+        self.client.get.return_value = self.mock_response(
+            "/v3/builds/build_id", HTTPStatus.OK, None, "v3", "builds", "POST_response.json"
+        )
+        result = self.client.v3.builds.get("build_id")
+        self.client.get.assert_called_with(self.client.get.return_value.url)
+        self.assertEqual("585bc3c1-3743-497d-88b0-403ad6b56d16", result["guid"])
@@ -0,0 +1,73 @@
+import json
+import unittest
+from http import HTTPStatus
+
+from abstract_test_case import AbstractTestCase
+from cloudfoundry_client.v3.deployments import DeploymentStrategy
+from cloudfoundry_client.v3.entities import Entity
+from fake_requests import MockResponse
+
+
+class TestDeployments(unittest.TestCase, AbstractTestCase):
+    DEPLOYMENT = dict(guid="deployment_id", status=dict(value="ACTIVE", reason="DEPLOYING"), strategy="canary")
+
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_client_class()
+
+    def setUp(self):
+        self.build_client()
+
+    def test_create(self):
+        self.client.post.return_value = MockResponse(
+            "%s/v3/deployments" % self.TARGET_ENDPOINT, HTTPStatus.CREATED.value, json.dumps(self.DEPLOYMENT)
+        )
+        result = self.client.v3.deployments.create(
+            "app-guid",
+            droplet_guid="droplet-guid",
+            strategy=DeploymentStrategy.CANARY,
+            max_in_flight=2,
+            canary_steps=[dict(instance_weight=20), dict(instance_weight=60)],
+        )
+        self.client.post.assert_called_with(
+            self.client.post.return_value.url,
+            files=None,
+            json={
+                "strategy": "canary",
+                "relationships": {"app": {"data": {"guid": "app-guid"}}},
+                "droplet": {"guid": "droplet-guid"},
+                "options": {"max_in_flight": 2, "canary": {"steps": [{"instance_weight": 20}, {"instance_weight": 60}]}},
+            },
+        )
+        self.assertIsInstance(result, Entity)
+        self.assertEqual("DEPLOYING", result["status"]["reason"])
+
+    def test_create_rolling(self):
+        self.client.post.return_value = MockResponse(
+            "%s/v3/deployments" % self.TARGET_ENDPOINT, HTTPStatus.CREATED.value, json.dumps(self.DEPLOYMENT)
+        )
+        self.client.v3.deployments.create("app-guid")
+        self.client.post.assert_called_with(
+            self.client.post.return_value.url,
+            files=None,
+            json={"strategy": "rolling", "relationships": {"app": {"data": {"guid": "app-guid"}}}},
+        )
+
+    def test_cancel(self):
+        self.client.post.return_value = MockResponse(
+            "%s/v3/deployments/deployment_id/actions/cancel" % self.TARGET_ENDPOINT,
+            HTTPStatus.OK.value,
+            json.dumps(self.DEPLOYMENT),
+        )
+        self.client.v3.deployments.cancel("deployment_id")
+        self.client.post.assert_called_with(self.client.post.return_value.url, json=None, files=None)
+
+    def test_continue_deployment(self):
+        self.client.post.return_value = MockResponse(
+            "%s/v3/deployments/deployment_id/actions/continue" % self.TARGET_ENDPOINT,
+            HTTPStatus.OK.value,
+            json.dumps(self.DEPLOYMENT),
+        )
+        result = self.client.v3.deployments.continue_deployment("deployment_id")
+        self.client.post.assert_called_with(self.client.post.return_value.url, json=None, files=None)
+        self.assertEqual("deployment_id", result["guid"])
@@ -1,9 +1,13 @@
+import json
+import threading
 import unittest
 from functools import reduce
 from http import HTTPStatus
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call
 
 from abstract_test_case import AbstractTestCase
+from fake_requests import MockResponse
+from cloudfoundry_client.common_objects import JsonObject
 from cloudfoundry_client.v3.entities import EntityManager, Entity
 
 
@@ -83,3 +87,157 @@ class TestEntities(unittest.TestCase, AbstractTestCase):
             "1cb006ee-fb05-47e1-b541-c34179ddc447",
             "02b4ec9b-94c7-4468-9c23-4e906191a0f9",
         ])
+
+    def test_list_pagination_with_prefetch(self):
+        def page(page_number: int, total_pages: int) -> MockResponse:
+            next_page = (
+                dict(href="%s/fake?page=%d&per_page=1" % (self.TARGET_ENDPOINT, page_number + 1))
+                if page_number < total_pages
+                else None
+            )
+            body = dict(
+                pagination=dict(total_results=total_pages, total_pages=total_pages, next=next_page),
+                resources=[dict(guid="guid-%d" % page_number)],
+            )
+            return MockResponse("%s/fake?page=%d&per_page=1" % (self.TARGET_ENDPOINT, page_number), HTTPStatus.OK.value,
+                                json.dumps(body))
+
+        responses = {"%s/fake?per_page=1" % self.TARGET_ENDPOINT: page(1, 5)}
+        responses.update({response.url: response for response in [page(page_number, 5) for page_number in range(2, 6)]})
+        client = MagicMock()
+        client.get.side_effect = lambda url: responses[url]
+        entity_manager = EntityManager(self.TARGET_ENDPOINT, client, "/fake")
+
+        guids = [entity["guid"] for entity in entity_manager.list(prefetch=2, per_page=1)]
+
+        self.assertEqual(["guid-1", "guid-2", "guid-3", "guid-4", "guid-5"], guids)
+        self.assertEqual(5, client.get.call_count)
+        self.assertEqual(
+            sorted(["%s/fake?page=%d&per_page=1" % (self.TARGET_ENDPOINT, page_number) for page_number in range(2, 6)]),
+            sorted(call.args[0] for call in client.get.call_args_list[1:]),
+        )
+
+    def test_list_pagination_with_prefetch_stopped_early(self):
+        first_page = dict(
+            pagination=dict(
+                total_results=5, total_pages=5, next=dict(href="%s/fake?page=2&per_page=1" % self.TARGET_ENDPOINT)
+            ),
+            resources=[dict(guid="guid-1")],
+        )
+        loading = threading.Event()
+        released = threading.Event()
+
+        def get(url: str) -> MockResponse:
+            if url == "%s/fake?per_page=1" % self.TARGET_ENDPOINT:
+                return MockResponse(url, HTTPStatus.OK.value, json.dumps(first_page))
+            loading.set()
+            released.wait(5)
+            return MockResponse(url, HTTPStatus.OK.value, json.dumps(dict(pagination=dict(), resources=[])))
+
+        client = MagicMock()
+        client.get.side_effect = get
+        entity_manager = EntityManager(self.TARGET_ENDPOINT, client, "/fake")
+        pagination = entity_manager.list(prefetch=1, per_page=1)
+        prefetcher = pagination._next_page_loader
+
+        for entity in pagination:
+            self.assertEqual("guid-1", entity["guid"])
+            break
+        loading.wait(5)
+        # dropping the pagination closes it
+        del pagination
+        released.set()
+
+        # the page being loaded ends, the following ones are never requested
+        self.assertTrue(prefetcher._executor._shutdown)
+        self.assertEqual(0, len(prefetcher._pending))
+        prefetcher._executor.shutdown(wait=True)
+        self.assertEqual(2, client.get.call_count)
+
+    def test_mixin_included_resources_with_shared_included_resources(self):
+        def to_one(guid: str) -> dict:
+            return dict(data=dict(guid=guid))
+
+        page = JsonObject(
+            resources=[
+                JsonObject(guid="app-1", relationships=dict(space=to_one("space-1"))),
+                JsonObject(guid="app-2", relationships=dict(space=to_one("space-1"))),
+                JsonObject(guid="app-3", relationships=dict(space=to_one("unknown-space"))),
+            ],
+            included=dict(
+                spaces=[dict(guid="space-1", relationships=dict(organization=to_one("organization-1")))],
+                organizations=[dict(guid="organization-1", name="organization")],
+            ),
+        )
+        entity_manager = EntityManager(self.TARGET_ENDPOINT, MagicMock(), "/fake")
+
+        result = entity_manager._mixin_included_resources(page)
+
+        self.assertNotIn("included", result)
+        first, second, third = result["resources"]
+        self.assertEqual("space-1", first["_included"]["space"]["guid"])
+        self.assertIs(first["_included"]["space"], second["_included"]["space"])
+        self.assertEqual("organization", first["_included"]["space"]["_included"]["organization"]["name"])
+        self.assertNotIn("_included", third)
+
+    def test_navigable_links_are_resolved_on_first_access(self):
+        client = MagicMock()
+        entity = Entity(
+            self.TARGET_ENDPOINT,
+            client,
+            guid="app-guid",
+            links=dict(self=dict(href="self-url"), space=dict(href="space-url"), start=dict(href="start-url", method="POST")),
+        )
+
+        client.v3.spaces._get.assert_not_called()
+        self.assertNotIn("space", vars(entity))
+
+        self.assertIs(entity.space, entity.space)
+        entity.space()
+        client.v3.spaces._get.assert_called_with("space-url")
+        entity.start()
+        client.v3.starts._post.assert_called_with("start-url")
+        self.assertRaises(AttributeError, lambda: entity.self)
+        self.assertRaises(AttributeError, lambda: entity.unknown)
+
+    def test_list_raw(self):
+        client = MagicMock()
+        client.get.return_value = self.mock_response("/fake/something", HTTPStatus.OK, None, "v3", "apps", "GET_response.json")
+        entity_manager = EntityManager(self.TARGET_ENDPOINT, client, "/fake/something")
+
+        resources = [resource for resource in entity_manager.list(raw=True, names="my_app")]
+
+        self.assertEqual(2, len(resources))
+        for resource in resources:
+            self.assertNotIsInstance(resource, Entity)
+        client.get.assert_called_with("%s/fake/something?names=my_app" % self.TARGET_ENDPOINT)
+
+    def test_list_projected(self):
+        client = MagicMock()
+        client.get.return_value = self.mock_response("/fake/something", HTTPStatus.OK, None, "v3", "apps", "GET_response.json")
+        entity_manager = EntityManager(self.TARGET_ENDPOINT, client, "/fake/something")
+
+        resources = [resource for resource in entity_manager.list(project=("guid", "name", "relationships.space.data.guid"))]
+
+        self.assertEqual(2, len(resources))
+        self.assertEqual(("1cb006ee-fb05-47e1-b541-c34179ddc446", "my_app", "2f35885d-0c9d-4423-83ad-fd05066f8576"), resources[0])
+
+    def test_get_many(self):
+        client = MagicMock()
+        client.get.side_effect = [
+            self.mock_response("/fake/something", HTTPStatus.OK, None, "v3", "apps", "GET_response.json"),
+            self.mock_response("/fake/something", HTTPStatus.OK, None, "v3", "apps", "GET_response.json"),
+        ]
+        entity_manager = EntityManager(self.TARGET_ENDPOINT, client, "/fake/something")
+
+        entities = entity_manager.get_many(["guid-1", "guid-2", "guid-1", "guid-3"], chunk_size=2, max_workers=2)
+
+        self.assertEqual(["1cb006ee-fb05-47e1-b541-c34179ddc446", "02b4ec9b-94c7-4468-9c23-4e906191a0f8"], list(entities))
+        self.assertIsInstance(entities["1cb006ee-fb05-47e1-b541-c34179ddc446"], Entity)
+        self.assertCountEqual(
+            [
+                call("%s/fake/something?guids=guid-1%%2Cguid-2&per_page=2" % self.TARGET_ENDPOINT),
+                call("%s/fake/something?guids=guid-3&per_page=2" % self.TARGET_ENDPOINT),
+            ],
+            client.get.call_args_list,
+        )
@@ -97,7 +97,7 @@ class TestJobs(unittest.TestCase, AbstractTestCase):
         ]
 
         with patch("time.sleep", return_value=None) as m:
-            self.client.v3.jobs.wait_for_job_completion("job_id")
+            self.client.v3.jobs.wait_for_job_completion("job_id", step=1, jitter=0)
             m.assert_has_calls([call(1), call(2), call(4)])
 
     @patch("time.sleep", return_value=None)
@@ -1,3 +1,6 @@
+import json
+import os
+import tempfile
 import unittest
 from http import HTTPStatus
 
@@ -45,6 +48,39 @@ class TestPackages(unittest.TestCase, AbstractTestCase):
         self.assertIsNotNone(result)
         self.assertIsInstance(result, Entity)
 
+    def test_upload(self):
+        self.client.post.return_value = self.mock_response(
+            "/v3/packages/package_id/upload", HTTPStatus.OK, None, "v3", "packages", "GET_{id}_response.json"
+        )
+        resources = [dict(path="lib/shared.jar", mode="644", checksum=dict(value="a" * 40), size_in_bytes=1024)]
+        result = self.client.v3.packages.upload("package_id", [b"zip ", b"content"], resources)
+        _, kwargs = self.client.post.call_args
+        self.assertEqual(self.client.post.return_value.url, self.client.post.call_args[0][0])
+        body = kwargs["data"]
+        self.assertEqual(body.content_type, kwargs["headers"]["Content-Type"])
+        payload = b"".join(body)
+        self.assertIn(json.dumps(resources).encode("utf-8"), payload)
+        self.assertIn(b'name="bits"; filename="application.zip"', payload)
+        self.assertIn(b"zip content", payload)
+        self.assertIsInstance(result, Entity)
+
+    def test_upload_file(self):
+        self.client.post.return_value = self.mock_response(
+            "/v3/packages/package_id/upload", HTTPStatus.OK, None, "v3", "packages", "GET_{id}_response.json"
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            bits_file = os.path.join(directory, "application.zip")
+            with open(bits_file, "wb") as f:
+                f.write(b"zip content")
+            result = self.client.v3.packages.upload_file("package_id", bits_file)
+        _, kwargs = self.client.post.call_args
+        self.assertEqual(self.client.post.return_value.url, self.client.post.call_args[0][0])
+        self.assertEqual(dict(resources="[]"), kwargs["data"])
+        file_name, _, content_type, headers = kwargs["files"]["bits"]
+        self.assertEqual(("application.zip", "application/zip"), (file_name, content_type))
+        self.assertEqual(11, headers["Content-Length"])
+        self.assertIsInstance(result, Entity)
+
     def test_copy(self):
         self.client.post.return_value = self.mock_response(
             "/v3/packages?source_guid=package_id",
@@ -0,0 +1,31 @@
+import json
+import unittest
+from http import HTTPStatus
+
+from abstract_test_case import AbstractTestCase
+from fake_requests import MockResponse
+
+
+class TestResourceMatches(unittest.TestCase, AbstractTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_client_class()
+
+    def setUp(self):
+        self.build_client()
+
+    def test_match(self):
+        known = dict(checksum=dict(value="a" * 40), size_in_bytes=1024)
+        self.client.post.return_value = MockResponse(
+            "%s/v3/resource_matches" % self.TARGET_ENDPOINT, HTTPStatus.CREATED.value, json.dumps(dict(resources=[known]))
+        )
+        resources = [known, dict(checksum=dict(value="b" * 40), size_in_bytes=2048)]
+        result = self.client.v3.resource_matches.match(resources)
+        self.client.post.assert_called_with(self.client.post.return_value.url, json=dict(resources=resources))
+        self.assertEqual([known], result)
+
+    def test_match_many(self):
+        self.client.post.side_effect = lambda url, json: MockResponse(url, HTTPStatus.CREATED.value, '{"resources": []}')
+        resources = [dict(checksum=dict(value="%040d" % i), size_in_bytes=i) for i in range(5)]
+        self.assertEqual([], self.client.v3.resource_matches.match_many(resources, chunk_size=2, max_workers=2))
+        self.assertEqual(3, self.client.post.call_count)
@@ -2,6 +2,8 @@ import unittest
 from http import HTTPStatus
 from unittest.mock import call
 
+import yaml
+
 from abstract_test_case import AbstractTestCase
 from cloudfoundry_client.v3.entities import Entity, ToOneRelationship
 
@@ -92,6 +94,19 @@ class TestSpaces(unittest.TestCase, AbstractTestCase):
         self.assertIsInstance(result, ToOneRelationship)
         self.assertEqual("iso-seg-guid", result.guid)
 
+    def test_apply_manifest(self):
+        self.client.post.return_value = self.mock_response(
+            "/v3/spaces/space_id/actions/apply_manifest",
+            HTTPStatus.ACCEPTED,
+            {"Location": "https://somewhere.org/v3/jobs/job_id"},
+        )
+        manifest = dict(applications=[dict(name="my_app", memory="256M")])
+        result = self.client.v3.spaces.apply_manifest("space_id", manifest)
+        _, kwargs = self.client.post.call_args
+        self.assertEqual(manifest, yaml.safe_load(kwargs["data"]))
+        self.assertEqual("application/x-yaml", kwargs["headers"]["Content-Type"])
+        self.assertEqual("job_id", result)
+
     def test_remove(self):
         self.client.delete.return_value = self.mock_response("/v3/spaces/space_id", HTTPStatus.NO_CONTENT, None)
         self.client.v3.spaces.remove("space_id")